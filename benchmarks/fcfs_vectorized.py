@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cpu_scheduler.table import ProcessTable, vectorized_fcfs
+
+SIZES = [10 ** 5, 10 ** 6, 10 ** 7]
+
+
+def make_table(n, seed=0):
+    rng = np.random.default_rng(seed)
+    arrival = np.sort(rng.integers(0, n * 3, n))
+    burst = rng.integers(1, 6, n)
+    return ProcessTable(np.arange(n), arrival, burst)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'Processes':>12}{'Seconds':>10}")
+    for n in sizes:
+        table = make_table(n)
+        start = time.perf_counter()
+        vectorized_fcfs(table)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>12}{elapsed:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
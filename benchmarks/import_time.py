@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+# Import-time regression check. Runs each import in a fresh interpreter under
+# `python -X importtime`, fails if the cumulative time of the module goes over its
+# budget or if a GUI/plotting backend sneaks into a headless path.
+#
+#   python benchmarks/import_time.py              exit status 1 on a regression
+#   python -m pytest tests/test_import_time.py    the same checks as tests
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Budgets in milliseconds, generous enough to absorb CI noise
+BUDGETS = {
+    'cpu_scheduler.scheduler': 50,
+    'cpu_scheduler.cli': 100,
+}
+
+FORBIDDEN = ('tkinter', 'ttkthemes', 'matplotlib', 'numpy', 'streamlit')
+
+RUNS = 5
+
+
+def import_profile(module):
+    # Returns {module name: cumulative microseconds} for one cold import
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def main():
+    failures = 0
+    for module, budget in BUDGETS.items():
+        # Best of several runs; the first one also pays for cold disk caches
+        best = None
+        for _ in range(RUNS):
+            profile = import_profile(module)
+            best = profile[module] if best is None else min(best, profile[module])
+
+        status = 'ok'
+        if best / 1000 > budget:
+            status = 'OVER BUDGET'
+            failures += 1
+        leaked = sorted({name for name in profile if name.split('.')[0] in FORBIDDEN})
+        if leaked:
+            status = 'IMPORTS ' + ', '.join(leaked)
+            failures += 1
+        print(f"{module:<28}{best / 1000:>8.1f} ms  (budget {budget} ms)  {status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
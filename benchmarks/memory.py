@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cpu_scheduler.scheduler import Process, fcfs, round_robin, to_dicts
+
+N = 200000
+
+
+def measure(build):
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    rng = random.Random(0)
+    rows = [(str(i), rng.randint(0, n * 5), rng.randint(1, 10), rng.randint(0, 9)) for i in range(n)]
+
+    # Dict rows are what every algorithm returned before the slotted records
+    dict_processes = measure(lambda: [
+        {'pid': pid, 'arrival': a, 'burst': b, 'priority': pr} for pid, a, b, pr in rows])
+    record_processes = measure(lambda: [Process(*row) for row in rows])
+
+    processes = [Process(*row) for row in rows]
+
+    def run_fcfs():
+        return fcfs(processes)
+
+    def run_round_robin():
+        result, timeline = round_robin(processes, 2)
+        return result['processes'], timeline
+
+    print(f"{'Output':<36}{'dict B/job':>12}{'record B/job':>14}")
+    print(f"{'input processes':<36}{dict_processes / n:>12.1f}{record_processes / n:>14.1f}")
+    for name, run in (('fcfs', run_fcfs), ('round_robin (q=2)', run_round_robin)):
+        # Both sides run the algorithm under the tracer, so each counts the values it
+        # computed. The dict side keeps one fresh dict per row and drops the records.
+        dicts = measure(lambda: [to_dicts(part) for part in run()])
+        records = measure(run)
+        print(f"{name + ' results+timeline':<36}{dicts / n:>12.1f}{records / n:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
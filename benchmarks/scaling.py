@@ -0,0 +1,44 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cpu_scheduler.scheduler import sjf, priority_scheduling
+
+SIZES = [10 ** 5, 3 * 10 ** 5, 10 ** 6]
+
+
+def make_processes(n, seed=0):
+    rng = random.Random(seed)
+    return [{
+        'pid': str(i),
+        'arrival': rng.randint(0, n * 5),
+        'burst': rng.randint(1, 10),
+        'priority': rng.randint(0, 9)
+    } for i in range(n)]
+
+
+def size_sweep(algorithms, sizes, make_processes):
+    # (name, func, size, processes) for every algorithm at every size; each size's
+    # workload is generated once and shared by the algorithms
+    for n in sizes:
+        processes = make_processes(n)
+        for name, func in algorithms:
+            yield name, func, n, processes
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'Algorithm':<22}{'Processes':>12}{'Seconds':>10}")
+    algorithms = (('sjf', sjf), ('priority_scheduling', priority_scheduling))
+    for name, func, n, processes in size_sweep(algorithms, sizes, make_processes):
+        start = time.perf_counter()
+        func(processes)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<22}{n:>12}{elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cpu_scheduler.scheduler import fcfs, sjf, priority_scheduling, round_robin, preemptive_sjf
+from cpu_scheduler.workloads import WORKLOADS, generate
+from scaling import size_sweep
+
+TIME_QUANTUM = 4
+
+ALGORITHMS = {
+    'fcfs': fcfs,
+    'sjf': sjf,
+    'priority_scheduling': priority_scheduling,
+    'round_robin': lambda processes: round_robin(processes, TIME_QUANTUM),
+    'preemptive_sjf': preemptive_sjf,
+}
+
+SIZES = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def measure(func, processes, repeat):
+    # Best-of-N wall time without tracing, then one traced run for peak memory
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(processes)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(processes)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(args):
+    results = []
+    algorithms = [(name, ALGORITHMS[name]) for name in args.algorithms]
+    for workload in args.workloads:
+        def make_processes(n):
+            return generate(workload, n, seed=args.seed)
+
+        for name, func, size, processes in size_sweep(algorithms, args.sizes, make_processes):
+            wall_time, peak = measure(func, processes, args.repeat)
+            row = {
+                'algorithm': name,
+                'workload': workload,
+                'size': size,
+                'wall_time': wall_time,
+                'peak_memory': peak,
+                'jobs_per_sec': size / wall_time if wall_time else float('inf'),
+            }
+            results.append(row)
+            print(f"{name:<20}{workload:<14}{size:>9}{wall_time:>10.3f}s"
+                  f"{peak / 2 ** 20:>10.1f}MiB{row['jobs_per_sec']:>14,.0f} jobs/s", file=sys.stderr)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'time_quantum': TIME_QUANTUM,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} measurements to {args.output}", file=sys.stderr)
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    def key(row):
+        return row['algorithm'], row['workload'], row['size']
+
+    before = {key(row): row for row in baseline['results']}
+    slowdowns = 0
+    print(f"{'Algorithm':<20}{'Workload':<14}{'Size':>9}{'Before':>10}{'After':>10}{'Change':>9}")
+    for row in current['results']:
+        old = before.get(key(row))
+        if old is None:
+            continue
+        change = row['wall_time'] / old['wall_time'] - 1 if old['wall_time'] else 0.0
+        flag = ''
+        # Timings of a few milliseconds are mostly noise
+        if change > args.threshold and max(old['wall_time'], row['wall_time']) >= args.min_time:
+            flag = '  SLOWER'
+            slowdowns += 1
+        print(f"{row['algorithm']:<20}{row['workload']:<14}{row['size']:>9}"
+              f"{old['wall_time']:>10.3f}{row['wall_time']:>10.3f}{change:>+9.1%}{flag}")
+
+    if slowdowns:
+        print(f"\n{slowdowns} measurement(s) slowed down by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms on synthetic workloads.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="time every algorithm and write a JSON report")
+    run_parser.add_argument('--output', default='bench.json')
+    run_parser.add_argument('--sizes', type=lambda s: [int(float(x)) for x in s.split(',')], default=SIZES,
+                            help="comma-separated process counts, e.g. 1e2,1e4,1e6")
+    run_parser.add_argument('--workloads', type=lambda s: s.split(','), default=list(WORKLOADS))
+    run_parser.add_argument('--algorithms', type=lambda s: s.split(','), default=list(ALGORITHMS))
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--repeat', type=int, default=3)
+
+    compare_parser = commands.add_parser('compare', help="flag slowdowns between two JSON reports")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="relative slowdown that counts as a regression (default 0.10)")
+    compare_parser.add_argument('--min-time', type=float, default=0.005,
+                                help="ignore measurements faster than this many seconds (default 0.005)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        for name in args.algorithms:
+            if name not in ALGORITHMS:
+                parser.error(f"unknown algorithm {name!r}")
+        for name in args.workloads:
+            if name not in WORKLOADS:
+                parser.error(f"unknown workload {name!r}")
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
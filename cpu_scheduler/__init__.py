@@ -0,0 +1,9 @@
+from .scheduler import (Process, Result, Segment, SwitchCost, OVERHEAD, to_dicts, fcfs,
+                        round_robin, sjf, priority_scheduling, preemptive_sjf, priority_preemptive, mlfq,
+                        IncrementalSimulation)
+
+__all__ = [
+    'Process', 'Result', 'Segment', 'SwitchCost', 'OVERHEAD', 'to_dicts',
+    'fcfs', 'round_robin', 'sjf', 'priority_scheduling',
+    'preemptive_sjf', 'priority_preemptive', 'mlfq', 'IncrementalSimulation',
+]
@@ -0,0 +1,209 @@
+import hashlib
+import operator
+import os
+import pickle
+import sys
+from collections import OrderedDict
+
+# Content-addressed cache for scheduler runs. The key is a hash of the process
+# table, the scheduler, the source of the package that defines it and the
+# remaining arguments, so a rerun on the same workload is a lookup, and editing
+# the scheduler code (or anything it imports from its package) invalidates old
+# entries on disk.
+
+CACHE_VERSION = 1
+
+
+def fingerprint(processes):
+    # Schedulers stable-sort their input by arrival, so two tables that differ only
+    # in the order of jobs with different arrivals give the same schedule and the
+    # same fingerprint. Every field of a job goes in, not just the ones the
+    # single-CPU schedulers read: multi-burst processes (iosim) schedule on their
+    # bursts and pinned ones (smp) on their cpu.
+    shapes = {}
+    rows = []
+    for p in processes:
+        # One sorted field list per record type or dict shape; a dict without a
+        # priority runs as priority 0, like a Process record
+        shape = type(p) if hasattr(type(p), '__slots__') else tuple(p)
+        if shape not in shapes:
+            names = tuple(sorted(set(p.keys()) | {'priority'}))
+            get = _getter(p, names) if 'priority' in p.keys() else None
+            shapes[shape] = names, names.index('arrival'), get
+        names, arrival, get = shapes[shape]
+        values = get(p) if get else tuple(p.get(name, 0) for name in names)
+        rows.append((values[arrival], names, values))
+    if any(a[0] > b[0] for a, b in zip(rows, rows[1:])):
+        rows.sort(key=lambda row: row[0])
+    # Field lists go into the hash once, rows refer to them by position
+    fields = sorted({shape[0] for shape in shapes.values()})
+    if len(fields) == 1:
+        rows = [row[2] for row in rows]
+    else:
+        position = {names: i for i, names in enumerate(fields)}
+        rows = [(position[row[1]], row[2]) for row in rows]
+    return hashlib.blake2b(repr((fields, rows)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _getter(p, names):
+    # Process records: plain attribute reads are much cheaper than record['field']
+    if hasattr(type(p), '__slots__'):
+        return operator.attrgetter(*names)
+    return operator.itemgetter(*names)
+
+
+_PLAIN = (type(None), bool, int, float, complex, str, bytes)
+
+
+def keyable(value):
+    # Whether repr(value) identifies value, so it can go into a cache key. Records
+    # (anything with to_dict, e.g. SwitchCost) repr their fields. Plain functions
+    # and stateful objects such as burst predictors repr as a memory address, and a
+    # predictor also has to see the run to learn from it, so calls that pass one
+    # bypass the cache.
+    if isinstance(value, _PLAIN):
+        return True
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return all(keyable(v) for v in value)
+    if isinstance(value, dict):
+        return all(keyable(k) and keyable(v) for k, v in value.items())
+    if hasattr(value, 'to_dict'):
+        return all(keyable(v) for v in value.to_dict().values())
+    return False
+
+
+_source_hashes = {}
+
+
+def _source_hash(func):
+    # Hash of every module in the package that defines func, since a scheduler's
+    # behaviour also depends on the helpers it imports (the shared engines, the
+    # registry keys). A top-level module hashes on its own.
+    module = sys.modules.get(func.__module__)
+    path = getattr(module, '__file__', None)
+    if path and getattr(module, '__package__', None):
+        root = sys.modules[module.__package__.partition('.')[0]]
+        path = os.path.dirname(getattr(root, '__file__', None) or path)
+    if path not in _source_hashes:
+        digest = hashlib.blake2b(digest_size=8)
+        for name in _sources(path) if path else ():
+            digest.update(os.path.relpath(name, os.path.dirname(path)).encode('utf-8'))
+            with open(name, 'rb') as f:
+                digest.update(f.read())
+        _source_hashes[path] = digest.hexdigest()
+    return _source_hashes[path]
+
+
+def _sources(path):
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(os.path.join(folder, name) for folder, _, names in os.walk(path)
+                  for name in names if name.endswith('.py'))
+
+
+def _fresh(value):
+    # Results are shared between hits; hand out new containers so callers can
+    # append to or reorder them. The records themselves are not copied.
+    if isinstance(value, tuple):
+        return tuple(_fresh(v) for v in value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return {k: _fresh(v) for k, v in value.items()}
+    return value
+
+
+class ResultCache:
+    # LRU over the last maxsize results in memory, with an optional directory of
+    # pickles behind it that survives restarts and is shared between processes
+    def __init__(self, maxsize=32, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._entries = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, func, processes, args=(), kwargs=None):
+        parts = (CACHE_VERSION, func.__name__, _source_hash(func), args, sorted((kwargs or {}).items()))
+        digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16)
+        digest.update(fingerprint(processes).encode('ascii'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, _fresh(self._entries[key])
+        if self.directory:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                # Missing, truncated, or pickled by a process that imported the
+                # scheduler under another module name
+                pass
+            else:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return True, _fresh(value)
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory:
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def wrap(self, func):
+        # Same signature as func; processes is the first argument
+        def cached(processes, *args, **kwargs):
+            if not (keyable(args) and keyable(kwargs)):
+                self.bypassed += 1
+                return func(processes, *args, **kwargs)
+            processes = list(processes)
+            key = self.key(func, processes, args, kwargs)
+            found, value = self.get(key)
+            if found:
+                return value
+            value = func(processes, *args, **kwargs)
+            self.put(key, value)
+            return _fresh(value)
+
+        cached.__name__ = func.__name__
+        cached.__qualname__ = func.__qualname__
+        cached.__doc__ = func.__doc__
+        cached.__wrapped__ = func
+        return cached
+
+    def wrap_all(self, funcs):
+        # {name: cached function} for a mapping of schedulers
+        return {name: self.wrap(func) for name, func in funcs.items()}
+
+    def info(self):
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'bypassed': self.bypassed, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = self.bypassed = 0
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,203 @@
+import argparse
+import csv
+import json
+import sys
+
+from .metrics import summarize
+from .registry import SCHEDULERS, get_scheduler
+from .scheduler import SwitchCost, to_dicts
+
+# Headless entry point (python -m cpu_scheduler). Keep this module free of GUI and
+# plotting imports so it starts fast on servers and in containers.
+
+ALGORITHMS = list(SCHEDULERS)
+FORMATS = ['text', 'csv', 'json']
+
+
+def simulate(processes, algorithm, quantum=None, cpus=1, policy='global', cache=None, io=False, devices=None,
+             switch_cost=None, predictor=None):
+    wrap = cache.wrap if cache else (lambda func: func)
+    scheduler = get_scheduler(algorithm)
+    if switch_cost and (io or cpus > 1):
+        raise ValueError("--switch-cost is only modelled for single-CPU runs without --io")
+    if predictor is not None and ('predictor' not in scheduler.params or cpus > 1):
+        raise ValueError(f"--predictor applies to single-CPU runs of "
+                         f"{', '.join(name for name, s in SCHEDULERS.items() if 'predictor' in s.params)}")
+    if io:
+        from .iosim import simulate_io
+
+        if cpus > 1:
+            raise ValueError("the I/O model is single-CPU only")
+        return wrap(simulate_io)(processes, algorithm, quantum[0] if quantum else None, devices, predictor)
+    if cpus > 1:
+        from .smp import simulate_smp
+
+        return wrap(simulate_smp)(processes, algorithm, cpus, policy, quantum[0] if quantum else None)
+
+    params = {}
+    if 'time_quantum' in scheduler.params:
+        if not quantum:
+            raise ValueError(f"{algorithm} needs --quantum")
+        params['time_quantum'] = quantum[0]
+    if 'quanta' in scheduler.params and quantum:
+        params['quanta'] = tuple(quantum)
+    if switch_cost:
+        if 'switch_cost' not in scheduler.params:
+            raise ValueError(f"{algorithm} does not model context switch cost")
+        params['switch_cost'] = switch_cost
+    if predictor is not None:
+        params['predictor'] = predictor
+    return scheduler.run(processes, cache, **params)
+
+
+def write_output(out, fmt, result, timeline, summary, include_timeline):
+    if fmt == 'json':
+        report = {'summary': summary, 'results': to_dicts(result)}
+        if include_timeline:
+            report['timeline'] = to_dicts(timeline)
+        json.dump(report, out, indent=2)
+        out.write('\n')
+    elif fmt == 'csv':
+        rows = to_dicts(timeline if include_timeline else result)
+        if rows:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        for r in result:
+            out.write(f"{r.pid} -> CT: {r.completion} | TAT: {r.turnaround} | WT: {r.waiting}\n")
+        if include_timeline:
+            out.write("\nTimeline:\n")
+            for s in timeline:
+                cpu = f"CPU{s.cpu} " if hasattr(s, 'cpu') else ""
+                out.write(f"{cpu}{s.pid}: {s.start}-{s.end}\n")
+        out.write(f"\nAverage Waiting Time: {summary['avg_waiting']:.2f}\n")
+        out.write(f"Average Turnaround Time: {summary['avg_turnaround']:.2f}\n")
+        out.write(f"Average Response Time: {summary['avg_response']:.2f}\n")
+        for name in ('waiting', 'turnaround', 'response'):
+            out.write(f"{name.capitalize()} p50 / p95 / p99: {summary[f'p50_{name}']:g} / "
+                      f"{summary[f'p95_{name}']:g} / {summary[f'p99_{name}']:g}\n")
+        out.write(f"Throughput: {summary['throughput']:.4f} processes per time unit "
+                  f"(peak {summary['peak_throughput'] or 0:.4f} over {summary['throughput_window'] or 0:g})\n")
+        out.write(f"CPU Utilization: {summary['cpu_utilization']:.1%} (idle {summary['idle_time']:g})\n")
+        if summary['overhead_time']:
+            out.write(f"Switch Overhead: {summary['overhead_time']:g} "
+                      f"(effective utilization {summary['effective_utilization']:.1%})\n")
+        out.write(f"Context Switches: {summary['context_switches']}\n")
+
+
+def _devices(text):
+    devices = {}
+    for item in text.split(','):
+        name, _, count = item.partition('=')
+        try:
+            devices[name] = int(count or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected a whole-number server count, got {item}") from None
+        if devices[name] < 1:
+            raise argparse.ArgumentTypeError(f"each device needs at least one server, got {item}")
+    return devices
+
+
+def _quanta(text):
+    # Round robin quantum, or comma-separated MLFQ level quanta; a quantum of zero
+    # or less would never let the clock advance
+    try:
+        quanta = [int(x) for x in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected whole-number quanta, got {text}") from None
+    if min(quanta) <= 0:
+        raise argparse.ArgumentTypeError(f"quanta must be positive, got {text}")
+    return quanta
+
+
+def parse_switch_cost(text):
+    # DISPATCH[,WARMUP[,COLD_AFTER]]
+    parts = [float(x) if '.' in x else int(x) for x in text.split(',')]
+    if len(parts) > 3:
+        raise argparse.ArgumentTypeError("expected DISPATCH[,WARMUP[,COLD_AFTER]]")
+    return SwitchCost(*parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpu_scheduler',
+                                     description="Run a CPU scheduling simulation without the GUI.")
+    parser.add_argument('-a', '--algorithm', choices=ALGORITHMS, default='fcfs')
+    parser.add_argument('-q', '--quantum', type=_quanta,
+                        help="time quantum for round_robin, or comma-separated level quanta for mlfq")
+    parser.add_argument('-i', '--input', help="trace file (CSV, Parquet, Arrow or .trace); "
+                                              "a synthetic workload is generated when omitted")
+    parser.add_argument('-f', '--format', choices=FORMATS, default='text')
+    parser.add_argument('-o', '--output', help="write to this file instead of stdout")
+    parser.add_argument('-c', '--cpus', type=int, default=1)
+    parser.add_argument('--policy', choices=['global', 'steal', 'affinity'], default='global',
+                        help="load balancing when --cpus > 1")
+    parser.add_argument('--io', action='store_true',
+                        help="simulate CPU and I/O bursts (e.g. --workload io_bound) instead of one CPU burst per job")
+    parser.add_argument('--devices', type=_devices, help="I/O device servers, e.g. disk=2,net=1 (default one each)")
+    parser.add_argument('--switch-cost', type=parse_switch_cost, metavar='DISPATCH[,WARMUP[,COLD_AFTER]]',
+                        help="charge each context switch a dispatch cost plus a cache warmup penalty that "
+                             "reaches WARMUP once a process has been off the CPU for COLD_AFTER time units")
+    parser.add_argument('--predictor', choices=['ewma', 'history', 'regression'],
+                        help="schedule sjf / srtf on predicted instead of true bursts")
+    parser.add_argument('--alpha', type=float, default=0.5,
+                        help="weight of the latest burst for the ewma and regression predictors")
+    parser.add_argument('-s', '--seed', type=int, default=0, help="seed for the synthetic workload")
+    parser.add_argument('--workload', default='poisson', help="synthetic workload generator")
+    parser.add_argument('-n', '--size', type=int, default=1000, help="synthetic workload size")
+    parser.add_argument('--timeline', action='store_true', help="include the timeline in the output")
+    parser.add_argument('--window', type=float,
+                        help="sliding window for peak throughput, in time units (default: a tenth of the makespan)")
+    parser.add_argument('--cache-dir', help="reuse results of earlier runs on the same workload from this directory")
+    parser.add_argument('--animation', metavar='PATH',
+                        help="also render an animated Gantt chart to PATH (.gif, or .mp4 with ffmpeg)")
+    parser.add_argument('--fps', type=int, default=30, help="animation frames per second")
+    parser.add_argument('--duration', type=float, default=10, help="animation length in seconds")
+    args = parser.parse_args(argv)
+
+    if 'time_quantum' in SCHEDULERS[args.algorithm].params and not args.quantum:
+        parser.error(f"{args.algorithm} needs --quantum")
+    if args.cpus < 1:
+        parser.error("--cpus must be at least 1")
+
+    if args.input:
+        from .traces import load_trace
+        processes = load_trace(args.input)
+    else:
+        from .workloads import generate
+        try:
+            processes = generate(args.workload, args.size, seed=args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+
+    predictor = None
+    if args.predictor:
+        from .prediction import by_pid, make_predictor
+        options = {} if args.predictor == 'history' else {'alpha': args.alpha}
+        if args.io:
+            # Learn across the CPU bursts of each process
+            options['key'] = by_pid
+        predictor = make_predictor(args.predictor, **options)
+
+    cache = None
+    if args.cache_dir:
+        from .cache import ResultCache
+        cache = ResultCache(directory=args.cache_dir)
+
+    try:
+        result, timeline = simulate(processes, args.algorithm, args.quantum, args.cpus, args.policy, cache,
+                                    args.io, args.devices, args.switch_cost, predictor)
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        write_output(out, args.format, result, timeline, summarize(result, timeline, args.cpus, args.window), args.timeline)
+    finally:
+        if args.output:
+            out.close()
+
+    if args.animation and timeline:
+        from .gantt import save_animation
+        save_animation(timeline, args.animation, args.fps, args.duration)
+    return 0
@@ -0,0 +1,208 @@
+import math
+from bisect import bisect_left, bisect_right
+
+# Gantt rendering that stays responsive on long timelines: adjacent segments of a
+# PID are merged, bars are drawn as one broken_barh (a single PolyCollection) per
+# palette color, and the bars are rebuilt for the visible range whenever the
+# x-limits change so zoomed-out views never draw sub-pixel detail.
+#
+# Only the drawing code needs matplotlib; callers import it before using GanttChart.
+
+# matplotlib's tab20, reordered so neighbouring PIDs get contrasting colors
+PALETTE = [
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f',
+    '#bcbd22', '#17becf', '#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5', '#c49c94',
+    '#f7b6d2', '#c7c7c7', '#dbdb8d', '#9edae5',
+]
+IDLE_COLOR = '#eeeeee'
+OVERHEAD_COLOR = '#222222'
+CROWDED_COLOR = '#555555'
+
+LANE_HEIGHT = 9
+LANE_STEP = 12
+LABEL_MIN_PX = 24
+
+
+def lane_of(segment):
+    # SMP timelines tag segments with a CPU; single-CPU timelines use one lane
+    return segment.get('cpu', 0) or 0
+
+
+def merge_segments(timeline):
+    # {(lane, pid): ([starts], [ends])}, merging back-to-back segments of a PID
+    spans = {}
+    for segment in timeline:
+        starts, ends = spans.setdefault((lane_of(segment), segment['pid']), ([], []))
+        if ends and ends[-1] == segment['start']:
+            ends[-1] = segment['end']
+        else:
+            starts.append(segment['start'])
+            ends.append(segment['end'])
+    for starts, ends in spans.values():
+        if any(a > b for a, b in zip(starts, starts[1:])):
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            starts[:] = [starts[i] for i in order]
+            ends[:] = [ends[i] for i in order]
+    return spans
+
+
+def assign_colors(pids):
+    colors = {}
+    for pid in pids:
+        if pid not in colors:
+            if pid == 'idle':
+                colors[pid] = IDLE_COLOR
+            elif pid == 'overhead':
+                colors[pid] = OVERHEAD_COLOR
+            else:
+                colors[pid] = PALETTE[len(colors) % len(PALETTE)]
+    return colors
+
+
+def level_of_detail(starts, ends, min_width):
+    # Join bars separated by gaps narrower than min_width (one pixel)
+    bars = []
+    for start, end in zip(starts, ends):
+        if bars and start - bars[-1][1] < min_width:
+            bars[-1][1] = max(bars[-1][1], end)
+        else:
+            bars.append([start, end])
+    return bars
+
+
+class GanttChart:
+    def __init__(self, ax, timeline):
+        self.ax = ax
+        self.spans = merge_segments(timeline)
+        if not self.spans:
+            raise ValueError("Cannot draw a Gantt chart of an empty timeline")
+        self.colors = assign_colors(pid for _, pid in self.spans)
+        self.lanes = sorted({lane for lane, _ in self.spans})
+        self.lane_index = {lane: i for i, lane in enumerate(self.lanes)}
+        self.artists = []
+        self._drawing = False
+
+        self.start = min(starts[0] for starts, _ in self.spans.values() if starts)
+        self.end = max(ends[-1] for _, ends in self.spans.values() if ends)
+        ax.set_xlim(min(0, self.start), self.end + 2)
+        ax.set_ylim(0, 10 + LANE_STEP * len(self.lanes) + 10)
+        ax.set_xlabel("Time")
+        if len(self.lanes) > 1:
+            ax.set_yticks([self.lane_y(lane) + LANE_HEIGHT / 2 for lane in self.lanes])
+            ax.set_yticklabels([f"CPU {lane}" for lane in self.lanes])
+        else:
+            ax.set_yticks([])
+
+        self.draw()
+        ax.callbacks.connect('xlim_changed', lambda _: self.draw())
+
+    def lane_y(self, lane):
+        return 10 + LANE_STEP * self.lane_index[lane]
+
+    def draw(self):
+        if self._drawing:
+            return
+        self._drawing = True
+        try:
+            self._draw()
+        finally:
+            self._drawing = False
+
+    def _draw(self):
+        ax = self.ax
+        for artist in self.artists:
+            artist.remove()
+        self.artists = []
+
+        x0, x1 = ax.get_xlim()
+        pixel = (x1 - x0) / max(ax.bbox.width, 1)
+        crowded = {lane: [] for lane in self.lanes}
+        by_color = {}
+
+        for (lane, pid), (starts, ends) in self.spans.items():
+            lo = bisect_left(ends, x0)
+            hi = bisect_right(starts, x1)
+            if lo >= hi:
+                continue
+            y = self.lane_y(lane)
+            wide = by_color.setdefault((lane, self.colors[pid]), [])
+            for start, end in level_of_detail(starts[lo:hi], ends[lo:hi], pixel):
+                if end - start >= pixel:
+                    wide.append((start, end - start))
+                    if pid not in ('idle', 'overhead') and (end - start) / pixel >= LABEL_MIN_PX:
+                        self.artists.append(ax.text((start + end) / 2, y + LANE_HEIGHT / 2, f"P{pid}",
+                                                    ha='center', va='center', color='black',
+                                                    fontsize=8, weight='bold', clip_on=True))
+                elif pid != 'idle':
+                    crowded[lane].append((start, end))
+
+        # PIDs sharing a palette color share a collection, so the artist count is
+        # bounded by the palette size rather than the number of processes
+        for (lane, color), wide in by_color.items():
+            if wide:
+                self.artists.append(ax.broken_barh(wide, (self.lane_y(lane), LANE_HEIGHT), facecolors=color))
+
+        # Sub-pixel bars from different PIDs share one neutral collection per lane
+        for lane, bars in crowded.items():
+            if bars:
+                bars.sort()
+                merged = level_of_detail([b[0] for b in bars], [b[1] for b in bars], pixel)
+                self.artists.append(ax.broken_barh([(s, e - s) for s, e in merged],
+                                                   (self.lane_y(lane), LANE_HEIGHT), facecolors=CROWDED_COLOR))
+
+
+class GanttAnimation:
+    # Plays a timeline back in simulated time rather than one segment per frame. The
+    # chart is drawn once by GanttChart; each frame only moves a curtain hiding what
+    # has not happened yet, so with blitting a frame costs the same however many
+    # segments it reveals. Keep a reference to the object while the animation runs.
+    def __init__(self, fig, ax, timeline, fps=30, duration=10, blit=True):
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.patches import Rectangle
+
+        self.ax = ax
+        self.chart = GanttChart(ax, timeline)
+        start, end = self.chart.start, self.chart.end
+        # Never more frames than time units, so short timelines do not crawl
+        frames = max(2, min(int(fps * duration), math.ceil(end - start) + 1))
+        self.times = [start + (end - start) * i / (frames - 1) for i in range(frames)]
+
+        self.curtain = Rectangle((start, 0), 0, 1, transform=ax.get_xaxis_transform(),
+                                 facecolor=ax.get_facecolor(), edgecolor='none', zorder=3)
+        ax.add_patch(self.curtain)
+        self.cursor = ax.axvline(start, color='black', linewidth=1, zorder=4)
+        self.clock = ax.text(0.99, 0.95, "", transform=ax.transAxes, ha='right', va='top',
+                             fontsize=8, zorder=4)
+        self.animation = FuncAnimation(fig, self.update, frames=len(self.times), init_func=self.init,
+                                       interval=1000 / fps, blit=blit, repeat=False)
+
+    def init(self):
+        return self.update(0)
+
+    def update(self, frame):
+        now = self.times[frame]
+        self.curtain.set_x(now)
+        self.curtain.set_width(max(self.ax.get_xlim()[1] - now, 0))
+        self.cursor.set_xdata([now, now])
+        self.clock.set_text(f"t = {now:g}")
+        return self.curtain, self.cursor, self.clock
+
+
+def save_animation(timeline, path, fps=30, duration=10, dpi=100):
+    # Renders off screen with the Agg canvas, so no window or display is needed.
+    # .gif goes through Pillow, anything else (.mp4) through ffmpeg.
+    from matplotlib.animation import FFMpegWriter, PillowWriter
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 2))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    # Every saved frame is a full draw anyway; blitting would only add a second one
+    player = GanttAnimation(fig, ax, timeline, fps, duration, blit=False)
+    ax.set_title("Gantt Chart")
+    fig.tight_layout()
+
+    writer = PillowWriter(fps=fps) if path.lower().endswith('.gif') else FFMpegWriter(fps=fps)
+    player.animation.save(path, writer=writer, dpi=dpi)
+    return len(player.times)
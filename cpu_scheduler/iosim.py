@@ -0,0 +1,242 @@
+import heapq
+from collections import deque
+
+from .registry import fifo, get_event_driven
+from .scheduler import _Record, Segment
+
+# Discrete-event simulation of processes that alternate CPU and I/O bursts. One CPU
+# runs the ready queue under any registered policy with a ready-queue key (see
+# registry.py), which sees the time left in a job's current CPU burst as its
+# remaining time. A process that finishes a CPU burst queues for its I/O device,
+# and goes back to the ready queue when the device is done with it. CPU and
+# device completions share one heap-based event calendar; arrivals come from a
+# cursor over the sorted input.
+#
+# A process with a single CPU burst behaves exactly as in scheduler.py, so the
+# same policies reproduce the pure CPU schedules when there is no I/O.
+
+DEFAULT_DEVICE = 'io'
+
+# Calendar event kinds, in the order they are handled at the same instant: a CPU
+# burst that ends frees the CPU first, I/O completions and arrivals then join the
+# ready queue ahead of a job whose round robin slice ends at that instant
+_FINISH, _IO_DONE, _SLICE = 0, 1, 2
+
+
+class IOProcess(_Record):
+    # bursts alternate CPU and I/O times, starting and ending with CPU:
+    # [cpu, io, cpu, ..., cpu]. An I/O entry is either a time on the default device
+    # or a (device, time) pair.
+    __slots__ = ('pid', 'arrival', 'bursts', 'priority')
+
+    def __init__(self, pid, arrival, bursts, priority=0):
+        if len(bursts) % 2 == 0:
+            raise ValueError(f"Process {pid}: bursts must start and end with a CPU burst")
+        self.pid = pid
+        self.arrival = arrival
+        self.bursts = bursts
+        self.priority = priority
+
+    @property
+    def burst(self):
+        # Total CPU time, so the CPU-only schedulers can still run these processes
+        return sum(self.bursts[::2])
+
+
+class IOResult(_Record):
+    # waiting is time spent in the ready queue and io_waiting time spent queued for
+    # a device; burst and io are the total CPU and device service times
+    __slots__ = ('pid', 'arrival', 'burst', 'io', 'priority', 'completion', 'turnaround', 'waiting',
+                 'io_waiting')
+
+    def __init__(self, pid, arrival, burst, io, priority, completion, turnaround, waiting, io_waiting):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.io = io
+        self.priority = priority
+        self.completion = completion
+        self.turnaround = turnaround
+        self.waiting = waiting
+        self.io_waiting = io_waiting
+
+
+def _io_request(burst):
+    if isinstance(burst, tuple):
+        return burst
+    return DEFAULT_DEVICE, burst
+
+
+def simulate_io(processes, algorithm='fcfs', time_quantum=None, devices=None, predictor=None):
+    # devices maps a device name to how many requests it serves at once (default
+    # one server each); requests beyond that wait in the device's FIFO queue.
+    # With a predictor, policies that take one (sjf, srtf) rank each CPU burst on
+    # its predicted remaining time and the predictor learns every finished CPU
+    # burst (prediction.by_pid keeps one exponential average per process). Returns
+    # (results in arrival order, CPU timeline).
+    scheduler = get_event_driven(algorithm)
+    if scheduler.time_sliced and not time_quantum:
+        raise ValueError(f"{algorithm} needs a time_quantum")
+    if predictor is not None and 'predictor' not in scheduler.params:
+        raise ValueError(f"{algorithm} does not schedule on predicted bursts")
+    for device, count in (devices or {}).items():
+        if not isinstance(count, int) or count < 1:
+            raise ValueError(f"device {device} needs at least one server, got {count!r}")
+
+    processes = sorted(processes, key=lambda x: x['arrival'])
+    n = len(processes)
+    bursts = [p['bursts'] if 'bursts' in p.keys() else (p['burst'],) for p in processes]
+    arrivals = [p['arrival'] for p in processes]
+    pids = [p['pid'] for p in processes]
+    key = scheduler.key
+    preemptive = scheduler.preemptive
+    round_robin = scheduler.time_sliced
+    by_seq = key is fifo
+
+    phase = [0] * n                      # index into bursts of the current burst
+    remaining = [b[0] for b in bursts]   # CPU time left in the current CPU burst
+    predicted = [0] * n                  # predicted length of the current CPU burst
+    ready_since = [0] * n
+    waiting = [0] * n
+    io_waiting = [0] * n
+    results = [None] * n
+    timeline = []
+
+    ready = []      # (key, tie, index)
+    seq = 0
+    calendar = []   # (time, kind, tie, payload)
+    event_seq = 0
+    servers = dict(devices or {})
+    device_queues = {}
+
+    current = None
+    run_start = 0
+    version = 0     # bumps on preemption, so the preempted job's finish event is stale
+
+    def predicted_remaining(idx, left):
+        # As in scheduler.preemptive_sjf: a burst that outlives its prediction is
+        # assumed to be halfway done
+        ran = bursts[idx][phase[idx]] - left
+        return predicted[idx] - ran if ran < predicted[idx] else ran
+
+    def rank(idx, left):
+        # The policy's key, on the predicted rather than the true time left
+        if predictor is not None:
+            left = predicted_remaining(idx, left)
+        return key(processes[idx], left)
+
+    def make_ready(idx, t):
+        nonlocal seq
+        ready_since[idx] = t
+        if predictor is not None and remaining[idx] == bursts[idx][phase[idx]]:
+            predicted[idx] = predictor.predict(processes[idx])
+        if by_seq:
+            heapq.heappush(ready, (0, seq, idx))
+        else:
+            heapq.heappush(ready, (rank(idx, remaining[idx]), idx, idx))
+        seq += 1
+
+    def schedule(t, kind, payload):
+        nonlocal event_seq
+        heapq.heappush(calendar, (t, kind, event_seq, payload))
+        event_seq += 1
+
+    def start_io(idx, device, duration, t):
+        io_waiting[idx] += t - ready_since[idx]
+        schedule(t + duration, _IO_DONE, (idx, device))
+
+    def stop(t):
+        # Record the slice that just ran; returns the job that was on the CPU
+        nonlocal current
+        idx = current
+        ran = t - run_start
+        if ran > 0:
+            pid = pids[idx]
+            if timeline and timeline[-1].pid == pid and timeline[-1].end == run_start:
+                timeline[-1].end = t
+            else:
+                timeline.append(Segment(pid, run_start, t))
+            remaining[idx] -= ran
+        current = None
+        return idx
+
+    def cpu_burst_done(idx, t):
+        if predictor is not None:
+            predictor.update(processes[idx], bursts[idx][phase[idx]])
+        phase[idx] += 1
+        if phase[idx] == len(bursts[idx]):
+            p = processes[idx]
+            cpu = sum(bursts[idx][::2])
+            io = sum(_io_request(b)[1] for b in bursts[idx][1::2])
+            turnaround = t - p['arrival']
+            results[idx] = IOResult(p['pid'], p['arrival'], cpu, io, p.get('priority', 0), t, turnaround,
+                                    waiting[idx], io_waiting[idx])
+            return True
+        device, duration = _io_request(bursts[idx][phase[idx]])
+        ready_since[idx] = t
+        if servers.setdefault(device, 1) > 0:
+            servers[device] -= 1
+            start_io(idx, device, duration, t)
+        else:
+            device_queues.setdefault(device, deque()).append((idx, duration))
+        return False
+
+    def io_done(idx, device, t):
+        queue = device_queues.get(device)
+        if queue:
+            queued, duration = queue.popleft()
+            start_io(queued, device, duration, t)
+        else:
+            servers[device] += 1
+        phase[idx] += 1
+        remaining[idx] = bursts[idx][phase[idx]]
+        make_ready(idx, t)
+
+    done = 0
+    i = 0
+    while done < n:
+        # Next instant: the earliest calendar event or arrival
+        t = calendar[0][0] if calendar else None
+        if i < n and (t is None or arrivals[i] < t):
+            t = arrivals[i]
+
+        while calendar and calendar[0][0] == t and calendar[0][1] < _SLICE:
+            _, kind, _, payload = heapq.heappop(calendar)
+            if kind == _FINISH:
+                if payload != version:
+                    continue
+                idx = stop(t)
+                if cpu_burst_done(idx, t):
+                    done += 1
+            else:
+                io_done(payload[0], payload[1], t)
+
+        while i < n and arrivals[i] <= t:
+            make_ready(i, t)
+            i += 1
+
+        while calendar and calendar[0][0] == t:
+            _, kind, _, payload = heapq.heappop(calendar)
+            if payload == version and current is not None:
+                make_ready(stop(t), t)
+
+        # Preempt when the best ready job outranks the running one, with the same
+        # (key, arrival order) comparison as scheduler._preemptive_engine
+        if preemptive and current is not None and ready:
+            running = (rank(current, remaining[current] - (t - run_start)), current)
+            if ready[0][:2] < running:
+                version += 1
+                make_ready(stop(t), t)
+
+        if current is None and ready:
+            _, _, current = heapq.heappop(ready)
+            waiting[current] += t - ready_since[current]
+            run_start = t
+            version += 1
+            run_time = remaining[current]
+            if round_robin and run_time > time_quantum:
+                schedule(t + time_quantum, _SLICE, version)
+            else:
+                schedule(t + run_time, _FINISH, version)
+
+    return results, timeline
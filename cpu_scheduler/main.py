@@ -1,10 +1,18 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
-from ttkthemes import ThemedTk
-from scheduler import fcfs, round_robin, sjf, priority_scheduling, preemptive_sjf, priority_preemptive
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import random
+
+# Run as a script (python cpu_scheduler/main.py): make the package importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cpu_scheduler.cache import ResultCache
+from cpu_scheduler.metrics import summarize
+from cpu_scheduler.registry import SCHEDULERS, by_label
+from cpu_scheduler.scheduler import IncrementalSimulation
+
+# matplotlib is imported inside the drawing functions so the window opens without
+# loading it; most sessions only read the text output.
 
 class Tooltip:
     def __init__(self, widget, text):
@@ -40,16 +48,34 @@ def add_hover_effect(widget):
 
 process_list = []
 
+# Switching back to an algorithm already run on the same processes is a lookup
+result_cache = ResultCache(maxsize=16)
+
+# The last simulation run, kept up to date as processes are added and deleted.
+# IncrementalSimulation re-runs only the part of the schedule an edit can change.
+simulation = None
+simulation_settings = None
+shown_results = []
+
+PROCESS_HEADER_LINES = 2
+
+def process_row(process):
+    return f"{process['pid']:<8}{process['arrival']:<10}{process['burst']:<10}{process['priority']:<10}\n"
+
 def add_process():
     pid = entry_pid.get()
     arrival = entry_arrival.get()
     burst = entry_burst.get()
-    priority = entry_priority.get() if algorithm_var.get() == "Priority Scheduling" or algorithm_var.get() == "Priority Scheduling (Preemptive)" else "0"
+    priority = entry_priority.get() if by_label(algorithm_var.get()).priority else "0"
 
     if not pid or not arrival or not burst:
         messagebox.showerror("Input Error", "Please enter PID, Arrival Time, and Burst Time.")
         return
 
+    if any(p['pid'] == pid for p in process_list):
+        messagebox.showerror("Input Error", f"A process with PID {pid} already exists.")
+        return
+
     try:
         process = {
             'pid': pid,
@@ -69,11 +95,11 @@ def add_process():
         process_text.insert(tk.END, "-" * 40 + "\n")
 
     # Display the newly added process in tabular format
-    row = f"{process['pid']:<8}{process['arrival']:<10}{process['burst']:<10}{process['priority']:<10}\n"
-    process_text.insert(tk.END, row)
+    process_text.insert(tk.END, process_row(process))
 
-    # Optional: Status message in output_text
-    # output_text.insert(tk.END, f"Added process: {process['pid']}\n")
+    if simulation is not None:
+        simulation.add(process)
+        show_results()
 
     # Clear input fields
     entry_pid.delete(0, tk.END)
@@ -82,7 +108,10 @@ def add_process():
     entry_priority.delete(0, tk.END)
 
 def reset_all():
+    global simulation, simulation_settings
     process_list.clear()
+    simulation = simulation_settings = None
+    shown_results.clear()
     process_text.delete('1.0', tk.END)
     output_text.delete('1.0', tk.END)
 
@@ -92,214 +121,117 @@ def delete_process():
         messagebox.showerror("Input Error", "Enter the PID to delete.")
         return
 
-    # Remove process with matching PID
-    initial_len = len(process_list)
-    process_list[:] = [p for p in process_list if p['pid'] != pid_to_delete]
-
-    if len(process_list) == initial_len:
+    index = next((i for i, p in enumerate(process_list) if p['pid'] == pid_to_delete), None)
+    if index is None:
         messagebox.showinfo("Delete Process", f"No process found with PID {pid_to_delete}.")
-    else:
-        messagebox.showinfo("Delete Process", f"Deleted process with PID {pid_to_delete}.")
+        return
 
-    # Refresh the process list display
-    process_text.delete('1.0', tk.END)
+    del process_list[index]
+    # Remove just that row; the header goes with the last process
     if process_list:
-        process_text.insert(tk.END, f"{'PID':<8}{'Arrival':<10}{'Burst':<10}{'Priority':<10}\n")
-        process_text.insert(tk.END, "-" * 40 + "\n")
-        for process in process_list:
-            row = f"{process['pid']:<8}{process['arrival']:<10}{process['burst']:<10}{process['priority']:<10}\n"
-            process_text.insert(tk.END, row)
+        line = index + PROCESS_HEADER_LINES + 1
+        process_text.delete(f"{line}.0", f"{line + 1}.0")
+    else:
+        process_text.delete('1.0', tk.END)
 
-def run_simulation():
-    algorithm = algorithm_var.get()
+    if simulation is not None:
+        simulation.remove(pid_to_delete)
+        show_results()
 
-    if algorithm == "FCFS":
-        result, timeline = fcfs(process_list)
-        output_text.delete('1.0', tk.END)
-        
-        total_wt = 0
-        total_tat = 0
-        for r in result:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-        
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-    
-    elif algorithm == "Round Robin":
+    messagebox.showinfo("Delete Process", f"Deleted process with PID {pid_to_delete}.")
+
+def scheduler_settings(algorithm):
+    # (settings, scheduler, params) for the selected algorithm. Raises ValueError
+    # with a message for bad input.
+    scheduler = by_label(algorithm)
+    params = {}
+    if 'time_quantum' in scheduler.params:
         try:
-            quantum = int(quantum_entry.get())
+            params['time_quantum'] = int(quantum_entry.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Please enter a valid integer for time quantum.")
-            return
-
-        result, timeline = round_robin(process_list, quantum)
-        output_text.delete('1.0', tk.END)
-
-        total_wt = 0
-        total_tat = 0
-        for r in result['processes']:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-        # print("Timeline Data:", timeline) # debugging line
-        
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-    
-    elif algorithm == "SJF":
-        result, timeline = sjf(process_list)
-        output_text.delete('1.0', tk.END)
+            raise ValueError("Please enter a valid integer for time quantum.") from None
+        if params['time_quantum'] <= 0:
+            raise ValueError("Time quantum must be a positive integer.")
+    if 'quanta' in scheduler.params:
+        try:
+            quanta = [int(q) for q in quantum_entry.get().split(",")] if quantum_entry.get().strip() else [4, 8, 16]
+        except ValueError:
+            raise ValueError("Enter the level quanta as comma-separated integers, e.g. 4,8,16.") from None
+        if any(q <= 0 for q in quanta):
+            raise ValueError("Level quanta must be positive integers, e.g. 4,8,16.")
+        params['quanta'] = tuple(quanta)
+        params['boost_interval'] = 10 * sum(quanta)
+    return (scheduler.name, tuple(sorted(params.items()))), scheduler, params
+
+def result_row(r):
+    row = f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']}"
+    if SCHEDULERS[simulation_settings[0]].priority:
+        row += f" | Priority: {r['priority']}"
+    return row + "\n"
+
+def show_results():
+    # Rewrite only the rows between the unchanged head and tail of the results
+    results = simulation.results
+    old = shown_results
+    head = 0
+    while head < min(len(old), len(results)) and old[head] == results[head]:
+        head += 1
+    tail = 0
+    while tail < min(len(old), len(results)) - head and old[-1 - tail] == results[-1 - tail]:
+        tail += 1
+
+    output_text.delete(f"{head + 1}.0", f"{len(old) - tail + 1}.0")
+    output_text.insert(f"{head + 1}.0", "".join(result_row(r) for r in results[head:len(results) - tail]))
+    shown_results[:] = results
+
+    output_text.delete(f"{len(results) + 1}.0", tk.END)
+    if results:
+        summary = summarize(results, simulation.timeline)
+        output_text.insert(tk.END, f"\nAverage Waiting Time: {summary['avg_waiting']:.2f}")
+        output_text.insert(tk.END, f"\nAverage Turnaround Time: {summary['avg_turnaround']:.2f}")
+        output_text.insert(tk.END, f"\nAverage Response Time: {summary['avg_response']:.2f}")
+        for name in ("waiting", "turnaround", "response"):
+            output_text.insert(tk.END, f"\n{name.capitalize()} p50 / p95 / p99: {summary[f'p50_{name}']:g} / "
+                                       f"{summary[f'p95_{name}']:g} / {summary[f'p99_{name}']:g}")
+        output_text.insert(tk.END, f"\nThroughput: {summary['throughput']:.3f} processes per time unit "
+                                   f"(peak {summary['peak_throughput'] or 0:.3f})")
+        output_text.insert(tk.END, f"\nCPU Utilization: {summary['cpu_utilization']:.1%} (idle {summary['idle_time']:g})")
+        output_text.insert(tk.END, f"\nContext Switches: {summary['context_switches']}")
 
-        total_wt = 0
-        total_tat = 0
-        for r in result:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-    
-    elif algorithm == "Priority Scheduling":
-        result, timeline = priority_scheduling(process_list)
-        output_text.delete('1.0', tk.END)
+def run_simulation():
+    global simulation, simulation_settings
+    algorithm = algorithm_var.get()
 
-        total_wt = 0
-        total_tat = 0
-        for r in result:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']} | Priority: {r['priority']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-
-    elif algorithm == "SJF (Preemptive)":
-        result, timeline = preemptive_sjf(process_list)
-        output_text.delete('1.0', tk.END)
+    try:
+        settings, scheduler, params = scheduler_settings(algorithm)
+    except ValueError as e:
+        messagebox.showerror("Input Error", str(e))
+        return
 
-        total_wt = 0
-        total_tat = 0
-        for r in result:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-        # print("Timeline Data:", timeline) #debugging line
-        
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-
-    elif algorithm == "Priority Scheduling (Preemptive)":
-        result, timeline = priority_preemptive(process_list)
+    # Adds and deletes keep the simulation current, so only new settings re-run it
+    if settings != simulation_settings:
+        simulation = IncrementalSimulation(lambda processes: scheduler.run(processes, result_cache, **params),
+                                           process_list, scheduler.idle_segments)
+        simulation_settings = settings
+        shown_results.clear()
         output_text.delete('1.0', tk.END)
+    show_results()
 
-        total_wt = 0
-        total_tat = 0
-        for r in result:
-            output_text.insert(tk.END, f"{r['pid']} -> CT: {r['completion']} | TAT: {r['turnaround']} | WT: {r['waiting']} | Priority: {r['priority']}\n")
-            total_wt += r['waiting']
-            total_tat += r['turnaround']
-
-        avg_wt = total_wt / len(result)
-        avg_tat = total_tat / len(result)
-        output_text.insert(tk.END, f"\nAverage Waiting Time: {avg_wt:.2f}")
-        output_text.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}")
-
-        if is_animated.get():
-            draw_animated_gantt_chart(timeline)
-        else:
-            draw_gantt_chart(timeline)
-
+    if is_animated.get():
+        draw_animated_gantt_chart(simulation.timeline)
     else:
-        messagebox.showinfo("Coming Soon", f"{algorithm} not implemented yet.")
-
-
-def draw_gantt_chart(schedule):
-    fig, gnt = plt.subplots()
-    gnt.set_title("Gantt Chart")
-    gnt.set_xlabel("Time")
-    gnt.set_ylabel("Processes")
+        draw_gantt_chart(simulation.timeline)
 
-    gnt.set_yticks([10 * (i + 1) for i in range(len(schedule))])
-    gnt.set_yticklabels([p['pid'] for p in schedule])
-    gnt.set_ylim(0, 10 * (len(schedule) + 1))
-
-    for i, p in enumerate(schedule):
-        start = p['completion'] - p['burst']
-        gnt.broken_barh([(start, p['burst'])], (10 * (i + 1) - 4, 8),
-                        facecolors=('tab:blue'))
-
-    plt.show()
 
 def draw_gantt_chart(timeline):
     if not timeline:
         return
 
-    fig, ax = plt.subplots(figsize=(10, 2))
+    import matplotlib.pyplot as plt
+    from cpu_scheduler.gantt import GanttChart
 
-    colors = {}
-    y_pos = 10  # y-axis fixed position for the bar height
-    height = 9
-    used_colors = []
-
-    for item in timeline:
-        pid = item['pid']
-        start = item['start']
-        end = item['end']
-
-        # Assign a unique color for each process
-        if pid not in colors:
-            while True:
-                color = "#{:06x}".format(random.randint(0, 0xFFFFFF))
-                if color not in used_colors:
-                    break
-            colors[pid] = color
-            used_colors.append(color)
-
-        ax.broken_barh([(int(start), int(end) - int(start))], (y_pos, height), facecolors=colors[pid])
-        ax.text((int(start) + int(end)) / 2, y_pos + height / 2, f"P{pid}",
-                ha='center', va='center', color='black', fontsize=8, weight='bold')
-
-    ax.set_ylim(0, 30)
-    ax.set_xlim(0, max(int(item['end']) for item in timeline) + 2)
-    ax.set_xlabel("Time")
-    ax.set_yticks([])  # Hide y-axis ticks
+    fig, ax = plt.subplots(figsize=(10, 2))
+    GanttChart(ax, timeline)
     ax.set_title("Gantt Chart")
 
     fig.tight_layout()
@@ -309,57 +241,23 @@ def draw_animated_gantt_chart(timeline):
     if not timeline:
         return
 
+    import matplotlib.pyplot as plt
+    from cpu_scheduler.gantt import GanttAnimation
+
     fig, ax = plt.subplots(figsize=(10, 2))
-    y_pos = 10
-    height = 9
-    colors = {}
-    used_colors = []
-
-    # Assign colors beforehand
-    for item in timeline:
-        pid = item['pid']
-        if pid not in colors:
-            while True:
-                color = "#{:06x}".format(random.randint(0, 0xFFFFFF))
-                if color not in used_colors:
-                    break
-            colors[pid] = color
-            used_colors.append(color)
-
-    bars = []
-
-    def init():
-        ax.set_xlim(0, max(item['end'] for item in timeline) + 2)
-        ax.set_ylim(0, 30)
-        ax.set_yticks([])
-        ax.set_xlabel("Time")
-        ax.set_title("Live Gantt Chart Simulation")
-        return bars
-
-    def animate(i):
-        if i >= len(timeline):
-            return bars
-
-        item = timeline[i]
-        pid = item['pid']
-        start = item['start']
-        end = item['end']
-
-        bar = ax.broken_barh([(start, end - start)], (y_pos, height), facecolors=colors[pid])
-        text = ax.text((start + end) / 2, y_pos + height / 2, f"P{pid}",
-                       ha='center', va='center', color='black', fontsize=8, weight='bold')
-
-        bars.append(bar)
-        bars.append(text)
-        return bars
-
-    ani = animation.FuncAnimation(fig, animate, init_func=init,
-                                  frames=len(timeline), interval=800, blit=False, repeat=False)
+    # Plays the whole schedule back in about ten seconds whatever its length
+    player = GanttAnimation(fig, ax, timeline, fps=30, duration=10)
+    ax.set_title("Live Gantt Chart Simulation")
+
+    fig.tight_layout()
     plt.show()
+    return player
 
 
 # --- Root window styling ---
-root = ThemedTk(theme="arc")
+# The ttk theme is set to 'default' below, so a plain Tk root looks the same as the
+# old ThemedTk("arc") one without importing ttkthemes
+root = tk.Tk()
 root.title("CPU Scheduler Simulator")
 root.configure(bg="#f5f7fa")  # Light background
 
@@ -415,8 +313,7 @@ frame_top.pack(pady=10, padx=10, fill="x")
 tk.Label(frame_top, text="Select Scheduling Algorithm:", **label_style).pack(side=tk.LEFT)
 
 algorithm_dropdown = ttk.Combobox(frame_top, textvariable=algorithm_var,
-                                  values=["FCFS", "SJF", "SJF (Preemptive)", "Round Robin", 
-                                          "Priority Scheduling", "Priority Scheduling (Preemptive)"],
+                                  values=[scheduler.label for scheduler in SCHEDULERS.values()],
                                   state="readonly")
 algorithm_dropdown.pack(side=tk.LEFT, padx=10)
 Tooltip(algorithm_dropdown, "Choose a scheduling algorithm")
@@ -452,7 +349,7 @@ Tooltip(entry_priority, "Only used in Priority Scheduling")
 
 # --- Time Quantum Field ---
 frame_quantum = tk.Frame(root, bg="#f0f0f0")
-label_quantum = tk.Label(frame_quantum, text="Time Quantum (for RR):", **label_style)
+label_quantum = tk.Label(frame_quantum, text="Time Quantum (RR) / Level Quanta (MLFQ):", **label_style)
 quantum_entry = ttk.Entry(frame_quantum)
 
 label_quantum.pack(side=tk.LEFT)
@@ -460,7 +357,7 @@ quantum_entry.pack(side=tk.LEFT)
 frame_quantum.pack()
 frame_quantum.pack_forget()  # Initially hidden
 
-Tooltip(quantum_entry, "Only used in Round Robin algorithm")
+Tooltip(quantum_entry, "Round Robin: one quantum. MLFQ: comma-separated quanta per level, e.g. 4,8,16")
 
 # --- Add Button ---
 btn_add = ttk.Button(frame_input, text="Add Process", command=add_process)
@@ -516,12 +413,12 @@ Tooltip(animation_checkbox, "Toggle animated Gantt chart")
 
 # --- Algorithm Change Callback ---
 def on_algorithm_change(event=None):
-    selected = algorithm_var.get()
-    if selected == "Priority Scheduling" or selected == "Priority Scheduling (Preemptive)":
+    selected = by_label(algorithm_var.get())
+    if selected.priority:
         label_priority.grid()
         entry_priority.grid()
         frame_quantum.pack_forget()
-    elif selected == "Round Robin":
+    elif 'time_quantum' in selected.params or 'quanta' in selected.params:
         frame_quantum.pack(pady=5)
         label_priority.grid_remove()
         entry_priority.grid_remove()
@@ -533,4 +430,5 @@ def on_algorithm_change(event=None):
 algorithm_dropdown.bind("<<ComboboxSelected>>", on_algorithm_change)
 on_algorithm_change()  # Call initially to set correct visibility
 
-root.mainloop()
+if __name__ == "__main__":
+    root.mainloop()
@@ -0,0 +1,197 @@
+import math
+from collections import deque
+
+# Per-run metrics from a single pass over a schedule. MetricsCollector consumes the
+# Segment / Result events that the streaming schedulers yield, in time order, and
+# keeps only fixed-size state: distributions go into log-linear histograms, and
+# per-job state lives only between a job's first segment and its result. Throughput
+# is also kept per window of time, so that part grows with the run's length over the
+# window width, not with the number of jobs.
+#
+# The constant-memory guarantee is for observe() / add() over such a stream.
+# summarize() is the batch form for finished (results, timeline) lists that are in
+# memory already: it reads the whole timeline before the results, so it holds every
+# job's first start, and it sorts a copy of the results by completion.
+
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    # Log-linear buckets in the style of HdrHistogram: each power-of-two range is
+    # split into 2**precision sub-buckets, so a quantile is reported within a
+    # relative error of 2**-precision (under 1% by default) and integers below
+    # 2**precision are exact. Memory grows with the number of octaves spanned,
+    # not with the number of values.
+    __slots__ = ('precision', 'buckets', 'count', 'total', 'min', 'max')
+
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        if value <= 0:
+            return (-1075, 0)  # below the smallest float exponent
+        mantissa, exponent = math.frexp(value)
+        return exponent, int((mantissa * 2 - 1) * (1 << self.precision))
+
+    def _lower_bound(self, bucket):
+        exponent, sub = bucket
+        if exponent == -1075:
+            return 0
+        return math.ldexp(1 + sub / (1 << self.precision), exponent - 1)
+
+    def add(self, value):
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(max(self._lower_bound(bucket), self.min), self.max)
+        return self.max
+
+
+class MetricsCollector:
+    # window: width of the sliding window for peak throughput, and of the windows
+    # of the throughput series, in time units.
+    # cpus: number of CPUs for utilization; defaults to the lanes seen.
+    def __init__(self, window=None, cpus=None):
+        self.window = window
+        self.cpus = cpus
+        self.waiting = Histogram()
+        self.turnaround = Histogram()
+        self.response = Histogram()
+        self.busy = 0
+        self.overhead = 0
+        self.switches = 0
+        self.first_arrival = None
+        self.last_completion = None
+        self.peak_throughput = 0.0
+        self._started = {}
+        self._lanes = {}
+        self._recent = deque()
+        self._windows = {}  # k -> completions in [k * window, (k + 1) * window)
+
+    def segment(self, segment):
+        pid = segment['pid']
+        if pid == 'idle':
+            return
+        if pid == 'overhead':
+            # Context switch cost: the CPU is busy but no process makes progress
+            self.overhead += segment['end'] - segment['start']
+            return
+        self.busy += segment['end'] - segment['start']
+        # min() rather than first seen: SMP timelines are only ordered per CPU
+        start = self._started.get(pid)
+        if start is None or segment['start'] < start:
+            self._started[pid] = segment['start']
+        lane = segment.get('cpu', 0)
+        previous = self._lanes.get(lane)
+        if previous is not None and previous != pid:
+            self.switches += 1
+        self._lanes[lane] = pid
+
+    def result(self, r):
+        arrival, completion = r['arrival'], r['completion']
+        self.waiting.add(r['waiting'])
+        self.turnaround.add(r['turnaround'])
+        start = self._started.pop(r['pid'], None)
+        self.response.add((completion - r['burst'] if start is None else start) - arrival)
+        if self.first_arrival is None or arrival < self.first_arrival:
+            self.first_arrival = arrival
+        if self.last_completion is None or completion > self.last_completion:
+            self.last_completion = completion
+
+        if self.window:
+            recent = self._recent
+            recent.append(completion)
+            while recent[0] <= completion - self.window:
+                recent.popleft()
+            self.peak_throughput = max(self.peak_throughput, len(recent) / self.window)
+            k = int(completion // self.window)
+            self._windows[k] = self._windows.get(k, 0) + 1
+
+    def throughput_series(self):
+        # [(window start, completions per time unit)] for consecutive windows from
+        # the first completion to the last, empty windows included
+        if not self._windows:
+            return []
+        window = self.window
+        return [(k * window, self._windows.get(k, 0) / window)
+                for k in range(min(self._windows), max(self._windows) + 1)]
+
+    def add(self, event):
+        if 'completion' in event.keys():
+            self.result(event)
+        else:
+            self.segment(event)
+
+    def observe(self, events):
+        # Pass a stream through unchanged while collecting its metrics
+        for event in events:
+            self.add(event)
+            yield event
+
+    def summary(self):
+        n = self.waiting.count
+        summary = {
+            'processes': n,
+            'avg_waiting': self.waiting.mean,
+            'avg_turnaround': self.turnaround.mean,
+            'avg_response': self.response.mean,
+        }
+        for name, histogram in (('waiting', self.waiting), ('turnaround', self.turnaround),
+                                ('response', self.response)):
+            for p in PERCENTILES:
+                summary[f'p{p}_{name}'] = histogram.quantile(p / 100)
+
+        makespan = self.last_completion - self.first_arrival if n else 0
+        capacity = (self.cpus or max(len(self._lanes), 1)) * makespan
+        summary.update({
+            'makespan': makespan,
+            'throughput': n / makespan if makespan else (float('inf') if n else 0.0),
+            'cpu_utilization': (self.busy + self.overhead) / capacity if capacity else (1.0 if n else 0.0),
+            'effective_utilization': self.busy / capacity if capacity else (1.0 if n else 0.0),
+            'overhead_time': self.overhead,
+            'idle_time': max(capacity - self.busy - self.overhead, 0),
+            'context_switches': self.switches,
+            'throughput_window': self.window,
+            'peak_throughput': self.peak_throughput if self.window else None,
+            'throughput_series': self.throughput_series(),
+        })
+        return summary
+
+
+def summarize(results, timeline, cpus=None, window=None):
+    # Batch form over finished (results, timeline) lists, in O(n) memory (see the
+    # module comment). Without a window the throughput windows are a tenth of the
+    # makespan.
+    if window is None and results:
+        window = (max(r['completion'] for r in results) - min(r['arrival'] for r in results)) / 10 or None
+    collector = MetricsCollector(window, cpus)
+    for segment in timeline:
+        collector.segment(segment)
+    # The sliding window needs completions in time order; most schedulers already
+    # return them that way, and the sort is linear on sorted input
+    for r in sorted(results, key=lambda r: r['completion']):
+        collector.result(r)
+    return collector.summary()
@@ -0,0 +1,391 @@
+import asyncio
+import heapq
+import time
+from collections import deque
+
+from .registry import event_driven, get_event_driven
+from .scheduler import Process, Segment, _result
+
+# Online scheduling: a live dispatcher that only knows the jobs submitted so far.
+# submit(job) and tick(now) advance the clock and return the Segment / Result
+# records that became final, each decision costing O(log n) heap or deque work.
+#
+# Decisions for an instant are committed lazily, when the clock moves past it, so jobs
+# submitted at the same instant compete exactly as in the batch schedulers: a
+# replayed trace gives the same schedule as scheduler.py (minus its idle segments).
+# ready_queue() and etas() show the pending decision without making it.
+#
+# Any registered policy with a ready-queue key can run here (see registry.py);
+# time-sliced policies take turns in arrival order.
+
+
+class _Job:
+    __slots__ = ('job', 'seq', 'key', 'remaining')
+
+    def __init__(self, job, seq, key):
+        self.job = job
+        self.seq = seq
+        self.key = key
+        self.remaining = job['burst']
+
+
+class OnlineScheduler:
+    def __init__(self, algorithm='fcfs', time_quantum=None, aging=None):
+        scheduler = get_event_driven(algorithm)
+        if scheduler.time_sliced and not (isinstance(time_quantum, (int, float)) and time_quantum > 0):
+            raise ValueError(f"{algorithm} needs a positive time_quantum, got {time_quantum!r}")
+        if aging and 'aging' not in scheduler.params:
+            raise ValueError(f"{algorithm} does not age jobs")
+        self.algorithm = algorithm
+        self.time_quantum = time_quantum
+        self.clock = 0
+        self.running = None      # _Job on the CPU
+        self.run_start = 0
+        self.jobs = {}           # pid -> _Job, until the job completes
+        self.completed = 0
+        self._preemptive = scheduler.preemptive
+        self._round_robin = scheduler.time_sliced
+        self._ready = deque() if self._round_robin else []  # deque of _Job, or heap of (key, seq, _Job)
+        self._requeue = None     # round robin job whose slice ended at the current instant
+        self._dirty = False      # state changed at the current instant, decision not made yet
+        self._seq = 0
+        key = scheduler.key
+        if aging:
+            # As scheduler._priority_key: every job ages at the same rate, so the
+            # aged order never changes while jobs wait
+            self._key = lambda p, remaining: key(p, remaining) + p['arrival'] / aging
+        else:
+            self._key = key
+
+    @property
+    def busy(self):
+        return self.running is not None or bool(self._ready) or self._requeue is not None
+
+    def submit(self, job):
+        # Advance to the job's arrival and queue it. Returns the records that
+        # became final on the way.
+        arrival = job['arrival']
+        if arrival < self.clock:
+            raise ValueError(f"Job {job['pid']} arrives at {arrival}, before the scheduler clock {self.clock}")
+        if job['pid'] in self.jobs:
+            raise ValueError(f"Job {job['pid']} is already queued")
+        events = self.tick(arrival)
+
+        entry = _Job(job, self._seq, self._key(job, job['burst']))
+        self._seq += 1
+        self.jobs[job['pid']] = entry
+        if self._round_robin:
+            self._ready.append(entry)
+        else:
+            heapq.heappush(self._ready, (entry.key, entry.seq, entry))
+
+        # Preempting at once is safe: another job arriving at this instant can only
+        # take over if it beats the new one, as it would in the batch engine
+        running = self.running
+        if self._preemptive and running is not None and (entry.key, entry.seq) < self._running_key():
+            self._stop(events)
+            heapq.heappush(self._ready, (running.key, running.seq, running))
+        self._dirty = True
+        return events
+
+    def tick(self, now):
+        # Run the schedule up to now; returns the records that became final
+        if now < self.clock:
+            raise ValueError(f"Cannot tick back to {now}; the scheduler clock is at {self.clock}")
+        events = []
+        while True:
+            if self._dirty and self.clock < now:
+                self._settle()
+            if self.running is None:
+                break
+            stop = self.next_event()
+            if stop > now:
+                break
+            self.clock = stop
+            self._stop(events)
+        self.clock = now
+        return events
+
+    def drain(self):
+        # Run every known job to completion
+        events = []
+        while True:
+            if self._dirty:
+                self._settle()
+            if self.running is None:
+                return events
+            self.clock = self.next_event()
+            self._stop(events)
+
+    def next_event(self):
+        # When the running job next leaves the CPU unless something preempts it
+        running = self.running
+        if running is None:
+            return None
+        if self._round_robin and running.remaining > self.time_quantum:
+            return self.run_start + self.time_quantum
+        return self.run_start + running.remaining
+
+    def _running_key(self):
+        running = self.running
+        return self._key(running.job, running.remaining - (self.clock - self.run_start)), running.seq
+
+    def _stop(self, events):
+        # Take the running job off the CPU at self.clock
+        running = self.running
+        ran = self.clock - self.run_start
+        if ran > 0:
+            events.append(Segment(running.job['pid'], self.run_start, self.clock))
+            running.remaining -= ran
+        self.running = None
+        self._dirty = True
+        if running.remaining <= 0:
+            del self.jobs[running.job['pid']]
+            self.completed += 1
+            events.append(_result(running.job, self.clock))
+        elif self._round_robin:
+            # Queued behind any job that arrives at this same instant
+            self._requeue = running
+        else:
+            running.key = self._key(running.job, running.remaining)
+
+    def _settle(self):
+        # Make the decision for the current instant
+        self._dirty = False
+        if self._requeue is not None:
+            self._ready.append(self._requeue)
+            self._requeue = None
+        if self.running is None and self._ready:
+            if self._round_robin:
+                self.running = self._ready.popleft()
+            else:
+                self.running = heapq.heappop(self._ready)[2]
+            self.run_start = self.clock
+
+    def _view(self):
+        # (running job, its start, waiting jobs in dispatch order) as the pending
+        # decision for this instant would leave them, without making it: a job
+        # submitted later at the same instant must still compete for the CPU
+        # whether or not anyone looked at the queue in between
+        if self._round_robin:
+            waiting = list(self._ready)
+            if self._requeue is not None:
+                waiting.append(self._requeue)
+        else:
+            waiting = [entry for _, _, entry in sorted(self._ready, key=lambda item: item[:2])]
+        if self.running is None and waiting:
+            return waiting[0], self.clock, waiting[1:]
+        return self.running, self.run_start, waiting
+
+    def ready_queue(self):
+        # Waiting jobs in the order they would be dispatched if nothing else arrives
+        return [entry.job for entry in self._view()[2]]
+
+    def remaining(self, pid):
+        entry = self.jobs[pid]
+        if entry is self.running:
+            return entry.remaining - (self.clock - self.run_start)
+        return entry.remaining
+
+    def etas(self):
+        # {pid: completion time} if no other job arrives
+        running, run_start, waiting = self._view()
+        if running is None:
+            return {}
+        if self._round_robin:
+            return self._round_robin_etas(running, run_start, waiting)
+        etas = {}
+        t = run_start + running.remaining
+        etas[running.job['pid']] = t
+        for entry in waiting:
+            t += entry.remaining
+            etas[entry.job['pid']] = t
+        return etas
+
+    def eta(self, pid):
+        return self.etas()[pid]
+
+    def _round_robin_etas(self, running, run_start, order):
+        # Closed form for round robin without arrivals. Once the running job's slice
+        # ends (at start), job i with r_i left needs k_i = ceil(r_i / q) more turns and
+        # finishes after: all of every job needing fewer turns, k_i - 1 quanta of each
+        # job (itself included) needing at least as many, plus one more quantum of each
+        # job queued ahead of it that needs more turns, and the last partial turn of
+        # itself and of the jobs ahead of it that need exactly k_i. Counting the jobs
+        # ahead that need more turns is a Fenwick tree query.
+        q = self.time_quantum
+        lefts = [entry.remaining for entry in order]
+        etas = {}
+        # From run_start rather than the clock, so float ticks don't perturb the turn counts
+        if running.remaining <= q:
+            start = etas[running.job['pid']] = run_start + running.remaining
+        else:
+            start = run_start + q
+            order.append(running)
+            lefts.append(running.remaining - q)
+
+        turns = [-(-r // q) for r in lefts]
+        levels = sorted(set(turns))
+        rank = {k: i + 1 for i, k in enumerate(levels)}
+        # Per turn count: total remaining time and number of jobs
+        work = {}
+        count = {}
+        for r, k in zip(lefts, turns):
+            work[k] = work.get(k, 0) + r
+            count[k] = count.get(k, 0) + 1
+        done_before = {}   # k -> remaining time of all jobs needing fewer turns
+        at_least = {}      # k -> number of jobs needing k or more turns
+        total_work, total_count = 0, len(lefts)
+        for k in levels:
+            done_before[k] = total_work
+            at_least[k] = total_count
+            total_work += work[k]
+            total_count -= count[k]
+
+        tree = [0] * (len(levels) + 1)
+        seen_same = {}     # k -> time of the jobs needing k turns queued so far, in their last turn
+        for position, (entry, r, k) in enumerate(zip(order, lefts, turns)):
+            # Jobs ahead of this one that need more turns
+            not_more = 0
+            i = rank[k]
+            while i:
+                not_more += tree[i]
+                i -= i & -i
+            more_ahead = position - not_more
+            last_turn = seen_same.get(k, 0) + r - (k - 1) * q
+            seen_same[k] = last_turn
+            etas[entry.job['pid']] = (start + done_before[k] + (k - 1) * q * at_least[k]
+                                      + q * more_ahead + last_turn)
+            i = rank[k]
+            while i <= len(levels):
+                tree[i] += 1
+                i += i & -i
+        return etas
+
+
+def _replay_steps(engine, trace, speed):
+    # Yields (records, seconds to wait) pairs. speed is trace time units per
+    # wall-clock second; None runs without waiting.
+    jobs = sorted(trace, key=lambda p: p['arrival'])
+    n = len(jobs)
+    i = 0
+    if not speed:
+        for job in jobs:
+            yield engine.submit(job), 0
+        yield engine.drain(), 0
+        return
+
+    origin = time.monotonic() - engine.clock / speed
+    while i < n or engine.busy:
+        now = max((time.monotonic() - origin) * speed, engine.clock)
+        events = []
+        while i < n and jobs[i]['arrival'] <= now:
+            events += engine.submit(jobs[i])
+            i += 1
+        events += engine.tick(now)
+        upcoming = [t for t in (jobs[i]['arrival'] if i < n else None, engine.next_event()) if t is not None]
+        if not upcoming and engine.busy:
+            # A decision is pending at this instant; the next tick makes it
+            upcoming = [now]
+        wait = (min(upcoming) - now) / speed if upcoming else 0
+        yield events, max(wait, 0)
+
+
+def replay(engine, trace, speed=None):
+    # Feeds a recorded trace to engine and yields records as they become final.
+    # speed=1 replays in real time (one time unit per second), speed=60 a minute
+    # of trace per second; without speed the trace is replayed as fast as possible.
+    for events, wait in _replay_steps(engine, trace, speed):
+        yield from events
+        if wait:
+            time.sleep(wait)
+
+
+async def areplay(engine, trace, speed=None):
+    # replay() as an async generator, for use inside an event loop
+    for events, wait in _replay_steps(engine, trace, speed):
+        for event in events:
+            yield event
+        await asyncio.sleep(wait)
+
+
+async def follow(engine, feed, speed=1):
+    # Live mode: takes jobs from an async iterator as they come, stamps each with
+    # the current scheduler time as its arrival, and yields records as they
+    # become final. Stops once the feed ends and every job has completed.
+    origin = time.monotonic() - engine.clock / speed
+    feed = feed.__aiter__()
+    pending = asyncio.ensure_future(feed.__anext__())
+    try:
+        while pending is not None or engine.busy:
+            now = max((time.monotonic() - origin) * speed, engine.clock)
+            for event in engine.tick(now):
+                yield event
+
+            stop = engine.next_event()
+            if stop is None and engine.busy:
+                stop = now
+            timeout = None if stop is None else max((stop - now) / speed, 0)
+            if pending is None:
+                await asyncio.sleep(timeout or 0)
+                continue
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if pending not in done:
+                continue
+            try:
+                job = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                continue
+            pending = asyncio.ensure_future(feed.__anext__())
+            now = max((time.monotonic() - origin) * speed, engine.clock)
+            job = Process(job['pid'], now, job['burst'], job.get('priority', 0))
+            for event in engine.submit(job):
+                yield event
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _positive_int(text):
+    import argparse
+
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {text}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {text}")
+    return value
+
+
+def main(argv=None):
+    import argparse
+
+    from .traces import load_trace
+
+    parser = argparse.ArgumentParser(prog='python -m cpu_scheduler.online',
+                                     description="Replay a recorded trace through the online scheduler.")
+    parser.add_argument('trace', help="CSV, Parquet, Arrow or .trace file")
+    parser.add_argument('-a', '--algorithm', choices=event_driven(), default='fcfs')
+    parser.add_argument('-q', '--quantum', type=_positive_int, help="time quantum for time-sliced policies (round_robin)")
+    parser.add_argument('--aging', type=float, help="priority aging interval")
+    parser.add_argument('--speed', type=float,
+                        help="trace time units per second (1 = real time); default: as fast as possible")
+    args = parser.parse_args(argv)
+
+    try:
+        engine = OnlineScheduler(args.algorithm, args.quantum, args.aging)
+    except ValueError as e:
+        parser.error(str(e))
+    for event in replay(engine, load_trace(args.trace), args.speed):
+        if type(event) is Segment:
+            print(f"{event.start:g}-{event.end:g} ran {event.pid}", flush=True)
+        else:
+            print(f"{event.completion:g} finished {event.pid} | TAT: {event.turnaround:g} | WT: {event.waiting:g}",
+                  flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
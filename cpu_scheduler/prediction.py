@@ -0,0 +1,293 @@
+import re
+from collections import deque
+
+# Burst-time predictors for the SJF family. A real scheduler never knows a job's
+# burst up front, so sjf / preemptive_sjf (and simulate_io's sjf / srtf) can rank
+# jobs on predictor.predict(job) instead, and report each finished burst back with
+# predictor.update(job, burst). Updates are O(1) in the number of jobs seen.
+#
+# Predictors learn as a run goes, so pass a fresh one to each run.
+
+_TRAILING_ID = re.compile(r'[-_.:#]?\d+$')
+
+
+def pid_class(job):
+    # Default job class: the PID without its trailing number, so web-1 and web-2
+    # share a history (every P<n> PID from the synthetic workloads is one class)
+    return _TRAILING_ID.sub('', str(job['pid'])) or str(job['pid'])
+
+
+def by_pid(job):
+    # One history per process: the textbook use of exponential averaging, across
+    # the CPU bursts of a process in simulate_io
+    return job['pid']
+
+
+class ExponentialAverage:
+    # tau' = alpha * burst + (1 - alpha) * tau, kept per job class. Classes not seen
+    # yet get the same average taken over every class, which starts at initial.
+    def __init__(self, alpha=0.5, initial=5, key=pid_class):
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha}")
+        self.alpha = alpha
+        self.initial = initial
+        self.key = key
+        self.overall = initial
+        self.estimates = {}
+
+    def predict(self, job):
+        return self.estimates.get(self.key(job), self.overall)
+
+    def update(self, job, burst):
+        alpha = self.alpha
+        key = self.key(job)
+        self.estimates[key] = alpha * burst + (1 - alpha) * self.estimates.get(key, self.overall)
+        self.overall = alpha * burst + (1 - alpha) * self.overall
+
+
+class ClassHistory:
+    # Mean of the last `size` bursts of each job class, from a running sum over a
+    # bounded deque per class
+    def __init__(self, size=8, initial=5, key=pid_class):
+        self.size = size
+        self.initial = initial
+        self.key = key
+        self.history = {}   # class -> deque of its last bursts
+        self.sums = {}      # class -> sum of that deque
+        self.total = 0
+        self.count = 0
+
+    def predict(self, job):
+        key = self.key(job)
+        if key not in self.history:
+            return self.total / self.count if self.count else self.initial
+        return self.sums[key] / len(self.history[key])
+
+    def update(self, job, burst):
+        key = self.key(job)
+        bursts = self.history.get(key)
+        if bursts is None:
+            bursts = self.history[key] = deque()
+            self.sums[key] = 0
+        bursts.append(burst)
+        self.sums[key] += burst
+        if len(bursts) > self.size:
+            self.sums[key] -= bursts.popleft()
+        self.total += burst
+        self.count += 1
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The regression predictor needs numpy (pip install numpy)") from None
+    return numpy
+
+
+class RegressionPredictor:
+    # Ridge regression of the burst on numeric job features: field names or
+    # functions of the job. The default uses the priority and the job's class
+    # average (from an ExponentialAverage kept alongside). Updates only buffer the
+    # feature row; every refit_every updates the buffer is folded into the normal
+    # equations with one matrix product and the weights are re-solved, so the cost
+    # per completion is O(d^2) amortized for d features, and predictions lag the
+    # latest completions by at most refit_every - 1 jobs.
+    def __init__(self, features=('priority',), ridge=1.0, alpha=0.5, initial=5, key=pid_class, refit_every=32):
+        np = _require_numpy()
+        self.np = np
+        self.average = ExponentialAverage(alpha, initial, key)
+        self.features = [self._field(f) if isinstance(f, str) else f for f in features]
+        self.features.append(self.average.predict)
+        d = len(self.features) + 1
+        self.xtx = np.eye(d) * ridge
+        self.xtx[0, 0] = 0   # leave the intercept unpenalized
+        self.xty = np.zeros(d)
+        self.count = 0
+        self.initial = initial
+        self.refit_every = refit_every
+        self._rows = []
+        self._bursts = []
+        self._weights = None
+
+    @staticmethod
+    def _field(name):
+        return lambda job: job.get(name, 0) or 0
+
+    def _row(self, job):
+        return [1.0] + [float(f(job)) for f in self.features]
+
+    def _fold(self):
+        np = self.np
+        if self._rows:
+            X = np.array(self._rows, dtype=float)
+            self.xtx += X.T @ X
+            self.xty += X.T @ np.asarray(self._bursts, dtype=float)
+            self._rows.clear()
+            self._bursts.clear()
+        self._weights = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0].tolist()
+
+    @property
+    def weights(self):
+        if self._rows or self._weights is None:
+            self._fold()
+        return self.np.array(self._weights)
+
+    def predict(self, job):
+        if not self.count:
+            return self.initial
+        if self._weights is None:
+            self._fold()
+        return max(sum(w * x for w, x in zip(self._weights, self._row(job))), 0.0)
+
+    def predict_many(self, jobs):
+        # One matrix product for a whole table of jobs
+        if not self.count:
+            return self.np.full(len(jobs), float(self.initial))
+        X = self.np.array([self._row(job) for job in jobs], dtype=float).reshape(len(jobs), -1)
+        return self.np.maximum(X @ self.weights, 0.0)
+
+    def update(self, job, burst):
+        self._rows.append(self._row(job))
+        self._bursts.append(burst)
+        self.count += 1
+        self.average.update(job, burst)
+        if len(self._rows) >= self.refit_every:
+            self._fold()
+
+    def fit(self, jobs, bursts=None):
+        # Vectorized warm start from historical jobs (their own bursts by default)
+        jobs = list(jobs)
+        if bursts is None:
+            bursts = [job['burst'] for job in jobs]
+        for job, burst in zip(jobs, bursts):
+            # Each row sees the class average from the jobs before it, as in update()
+            self._rows.append(self._row(job))
+            self._bursts.append(burst)
+            self.average.update(job, burst)
+        self.count += len(jobs)
+        self._fold()
+        return self
+
+
+PREDICTORS = {
+    'ewma': ExponentialAverage,
+    'history': ClassHistory,
+    'regression': RegressionPredictor,
+}
+
+
+def make_predictor(name, **options):
+    try:
+        return PREDICTORS[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown predictor {name!r}; expected one of {', '.join(PREDICTORS)}") from None
+
+
+class PredictionLog:
+    # Wraps a predictor and keeps the first prediction made for each job, to
+    # compare against its actual burst afterwards
+    def __init__(self, predictor):
+        self.predictor = predictor
+        self.predictions = {}
+
+    def predict(self, job):
+        prediction = self.predictor.predict(job)
+        self.predictions.setdefault(job['pid'], prediction)
+        return prediction
+
+    def update(self, job, burst):
+        self.predictor.update(job, burst)
+
+    def errors(self, processes):
+        # {'mae', 'rmse', 'mape', 'bias', 'predicted'} over the jobs that got a prediction
+        n = 0
+        abs_total = sq_total = rel_total = bias_total = 0.0
+        for p in processes:
+            prediction = self.predictions.get(p['pid'])
+            if prediction is None:
+                continue
+            error = prediction - p['burst']
+            n += 1
+            abs_total += abs(error)
+            sq_total += error * error
+            bias_total += error
+            rel_total += abs(error) / p['burst'] if p['burst'] else 0.0
+        if not n:
+            return {'predicted': 0, 'mae': 0.0, 'rmse': 0.0, 'mape': 0.0, 'bias': 0.0}
+        return {'predicted': n, 'mae': abs_total / n, 'rmse': (sq_total / n) ** 0.5,
+                'mape': rel_total / n, 'bias': bias_total / n}
+
+
+REPORT_METRICS = ('avg_waiting', 'avg_turnaround', 'avg_response', 'p95_waiting', 'p99_turnaround')
+
+
+def prediction_report(processes, algorithm='sjf', predictor=None):
+    # Runs algorithm ('sjf' or 'srtf') on the true bursts (the oracle) and on
+    # predictions, and reports the prediction error and what it costs the schedule.
+    # FCFS, which needs no burst at all, is the baseline a predictor has to beat.
+    from .metrics import summarize
+    from .registry import get_scheduler
+
+    scheduler = get_scheduler(algorithm)
+    if 'predictor' not in scheduler.params:
+        raise ValueError(f"{algorithm} does not schedule on predicted bursts")
+    processes = list(processes)
+    log = PredictionLog(predictor or ExponentialAverage())
+    oracle = summarize(*scheduler.run(processes))
+    predicted = summarize(*scheduler.run(processes, predictor=log))
+    baseline = summarize(*get_scheduler('fcfs').run(processes))
+
+    report = {'algorithm': algorithm, 'predictor': type(log.predictor).__name__, 'error': log.errors(processes)}
+    for name in REPORT_METRICS:
+        report[name] = {'oracle': oracle[name], 'predicted': predicted[name], 'fcfs': baseline[name],
+                        'ratio': predicted[name] / oracle[name] if oracle[name] else None}
+    return report
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m cpu_scheduler.prediction',
+                                     description="Compare SJF / SRTF on predicted bursts with the oracle schedule.")
+    parser.add_argument('-i', '--input', help="trace file; default: a synthetic workload")
+    parser.add_argument('--workload', default='poisson')
+    parser.add_argument('-n', '--size', type=int, default=10000)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-a', '--algorithm', choices=['sjf', 'srtf'], default='sjf')
+    parser.add_argument('-p', '--predictor', choices=list(PREDICTORS), default='ewma')
+    parser.add_argument('--alpha', type=float, default=0.5, help="exponential averaging weight of the last burst")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.input:
+        from .traces import load_trace
+        processes = load_trace(args.input)
+    else:
+        from .workloads import generate
+        try:
+            processes = generate(args.workload, args.size, seed=args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+
+    options = {} if args.predictor == 'history' else {'alpha': args.alpha}
+    report = prediction_report(processes, args.algorithm, make_predictor(args.predictor, **options))
+    if args.json:
+        import json
+        print(json.dumps(report, indent=2))
+        return 0
+
+    error = report['error']
+    print(f"{report['algorithm']} with {report['predictor']} over {error['predicted']} jobs")
+    print(f"Prediction error: MAE {error['mae']:.2f} | RMSE {error['rmse']:.2f} | "
+          f"MAPE {error['mape']:.1%} | bias {error['bias']:+.2f}")
+    print(f"{'':<16}{'oracle':>12}{'predicted':>12}{'ratio':>8}{'fcfs':>12}")
+    for name in REPORT_METRICS:
+        row = report[name]
+        ratio = f"{row['ratio']:.2f}" if row['ratio'] is not None else '-'
+        print(f"{name:<16}{row['oracle']:>12.2f}{row['predicted']:>12.2f}{ratio:>8}{row['fcfs']:>12.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
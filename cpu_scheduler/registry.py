@@ -0,0 +1,124 @@
+from .scheduler import (fcfs, round_robin, sjf, priority_scheduling, preemptive_sjf,
+                        priority_preemptive, mlfq)
+
+# One table of scheduling policies shared by the Tk GUI, the Streamlit app, the CLI
+# and the sweep tool.
+#
+# A scheduler is any function func(processes, **params) -> (results, timeline)
+# where results are Result records (or dicts with the same keys) and timeline is a
+# list of segments. Adding a policy is one register() call; front ends pick it up
+# from SCHEDULERS.
+#
+# The event-driven engines (smp, iosim, online) run their own loop instead of
+# func, driven by the policy's ready-queue key: key(process, remaining) ranks a
+# ready job, lower first, with ties to the earlier arrival (or to the job that
+# became ready first under fifo). With preemptive=True a better-ranked arrival
+# takes the CPU; a time_quantum parameter makes the policy time-sliced. A key that
+# reads remaining must be remaining plus a fixed amount per job, so running jobs
+# keep their relative rank as they all run. Policies without a key (mlfq) only run
+# in the batch engine.
+
+SCHEDULERS = {}
+
+
+def fifo(p, remaining):
+    # Every job ranks the same: jobs run in the order they became ready
+    return 0
+
+
+def remaining_time(p, remaining):
+    return remaining
+
+
+def by_priority(p, remaining):
+    return p['priority']
+
+
+class Scheduler:
+    __slots__ = ('name', 'label', 'func', 'params', 'priority', 'idle_segments', 'unpack', 'key', 'preemptive')
+
+    def __init__(self, name, label, func, params=(), priority=False, idle_segments=False, unpack=None, key=None,
+                 preemptive=False):
+        self.name = name
+        self.label = label
+        self.func = func
+        # Keyword parameters the front ends should ask for
+        self.params = params
+        # Whether the policy reads each process's priority
+        self.priority = priority
+        self.idle_segments = idle_segments
+        # Turns func's return value into (results, timeline) when it differs
+        self.unpack = unpack
+        # Ready-queue key for the event-driven engines, None if they cannot run it
+        self.key = key
+        self.preemptive = preemptive
+
+    @property
+    def time_sliced(self):
+        return 'time_quantum' in self.params
+
+    def run(self, processes, cache=None, **params):
+        # cache wraps the scheduler function itself, so cache keys follow the
+        # module that defines it
+        func = cache.wrap(self.func) if cache else self.func
+        value = func(processes, **params)
+        return self.unpack(value) if self.unpack else value
+
+    def __repr__(self):
+        return f"Scheduler({self.name!r})"
+
+
+def register(name, func, label=None, params=(), priority=False, idle_segments=False, unpack=None, key=None,
+             preemptive=False):
+    scheduler = Scheduler(name, label or name, func, params, priority, idle_segments, unpack, key, preemptive)
+    SCHEDULERS[name] = scheduler
+    return scheduler
+
+
+def get_scheduler(name):
+    try:
+        return SCHEDULERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm {name!r}; expected one of {', '.join(SCHEDULERS)}") from None
+
+
+def event_driven():
+    # Names of the policies the event-driven engines can run
+    return [name for name, scheduler in SCHEDULERS.items() if scheduler.key is not None]
+
+
+def get_event_driven(name):
+    scheduler = get_scheduler(name)
+    if scheduler.key is None:
+        raise ValueError(f"{name} only runs on one CPU without I/O; multi-CPU, I/O and online runs support "
+                         f"{', '.join(event_driven())}")
+    return scheduler
+
+
+def by_label(label):
+    for scheduler in SCHEDULERS.values():
+        if scheduler.label == label:
+            return scheduler
+    raise ValueError(f"Unknown algorithm {label!r}")
+
+
+def run(name, processes, cache=None, **params):
+    return get_scheduler(name).run(processes, cache, **params)
+
+
+def _round_robin_unpack(value):
+    summary, timeline = value
+    return summary['processes'], timeline
+
+
+register('fcfs', fcfs, "FCFS", params=('switch_cost',), key=fifo)
+register('sjf', sjf, "SJF", params=('switch_cost', 'predictor'), key=remaining_time)
+register('srtf', preemptive_sjf, "SJF (Preemptive)", params=('switch_cost', 'predictor'), idle_segments=True,
+         key=remaining_time, preemptive=True)
+register('round_robin', round_robin, "Round Robin", params=('time_quantum', 'switch_cost'),
+         unpack=_round_robin_unpack, key=fifo)
+register('priority', priority_scheduling, "Priority Scheduling", params=('aging', 'switch_cost'), priority=True,
+         key=by_priority)
+register('priority_preemptive', priority_preemptive, "Priority Scheduling (Preemptive)",
+         params=('aging', 'switch_cost'), priority=True, idle_segments=True, key=by_priority, preemptive=True)
+register('mlfq', mlfq, "MLFQ", params=('quanta', 'boost_interval', 'switch_cost'), idle_segments=True)
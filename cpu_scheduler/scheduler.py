@@ -1,97 +1,220 @@
-def fcfs(processes):
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+__all__ = [
+    'Process', 'Result', 'Segment', 'SwitchCost', 'OVERHEAD', 'to_dicts',
+    'fcfs', 'round_robin', 'sjf', 'priority_scheduling',
+    'preemptive_sjf', 'priority_preemptive', 'mlfq', 'IncrementalSimulation',
+]
+
+
+class _Record:
+    # Slotted record base. Fields stay readable as record['field'] so code written
+    # against the old dict rows keeps working; to_dict() gives a real dict.
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __reduce__(self):
+        # Rebuild from positional fields; much faster to pickle than slot state
+        return type(self), tuple(getattr(self, key) for key in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    # Mutable like the dict rows they replace, so unhashable like them
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Process(_Record):
+    __slots__ = ('pid', 'arrival', 'burst', 'priority')
+
+    def __init__(self, pid, arrival, burst, priority=0):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+
+
+class Result(_Record):
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', 'completion', 'turnaround', 'waiting')
+
+    def __init__(self, pid, arrival, burst, priority, completion, turnaround, waiting):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.completion = completion
+        self.turnaround = turnaround
+        self.waiting = waiting
+
+
+class Segment(_Record):
+    __slots__ = ('pid', 'start', 'end')
+
+    def __init__(self, pid, start, end):
+        self.pid = pid
+        self.start = start
+        self.end = end
+
+
+# Timeline PID of the time the CPU spends switching between processes
+OVERHEAD = 'overhead'
+
+
+class SwitchCost(_Record):
+    # Time charged each time the CPU switches to a different process: a fixed
+    # dispatch cost plus a cache warmup penalty. The penalty grows linearly with
+    # how long the incoming process has been off the CPU and is paid in full once
+    # it has been away for cold_after time units (or always, without cold_after).
+    # A process's first dispatch is always cold.
+    __slots__ = ('dispatch', 'warmup', 'cold_after')
+
+    def __init__(self, dispatch=0, warmup=0, cold_after=None):
+        self.dispatch = dispatch
+        self.warmup = warmup
+        self.cold_after = cold_after
+
+    def __call__(self, off_cpu):
+        if not self.cold_after or off_cpu >= self.cold_after:
+            return self.dispatch + self.warmup
+        return self.dispatch + self.warmup * off_cpu / self.cold_after
+
+
+class _Switches:
+    # Charges a switch cost (a SwitchCost, any callable of the off-CPU time, or a
+    # plain number for a fixed cost) as OVERHEAD segments on the timeline.
+    # Resuming the process that last ran is free.
+    __slots__ = ('cost', 'timeline', 'last', 'left')
+
+    def __init__(self, cost, timeline):
+        self.cost = cost if callable(cost) else SwitchCost(cost)
+        self.timeline = timeline
+        self.last = None
+        self.left = {}  # unfinished process -> when the CPU switched away from it
+
+    def dispatch(self, pid, time):
+        # Returns when pid actually starts running after a switch at time
+        if pid == self.last:
+            return time
+        if self.last is not None:
+            self.left[self.last] = time
+        self.last = pid
+        left = self.left.pop(pid, None)
+        overhead = self.cost(float('inf') if left is None else time - left)
+        if overhead > 0:
+            self.timeline.append(Segment(OVERHEAD, time, time + overhead))
+        return time + overhead
+
+    def finish(self):
+        # The running process completed; nothing is left to resume
+        self.last = None
+
+
+def to_dicts(records):
+    return [r.to_dict() for r in records]
+
+
+def _result(p, completion):
+    turnaround = completion - p['arrival']
+    return Result(p['pid'], p['arrival'], p['burst'], p.get('priority', 0),
+                  completion, turnaround, turnaround - p['burst'])
+
+
+def fcfs(processes, switch_cost=None):
     processes = sorted(processes, key=lambda x: x['arrival'])
     current_time = 0
     result = []
     timeline = []
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
 
     for p in processes:
         start_time = max(current_time, p['arrival'])
+        if switches:
+            start_time = switches.dispatch(p['pid'], start_time)
+            switches.finish()
         end_time = start_time + p['burst']
-        completion = end_time
-        turnaround = completion - p['arrival']
-        waiting = turnaround - p['burst']
-
-        result.append({
-            'pid': p['pid'],
-            'arrival': p['arrival'],
-            'burst': p['burst'],
-            'completion': completion,
-            'turnaround': turnaround,
-            'waiting': waiting
-        })
-
-        timeline.append({
-            'pid': p['pid'],
-            'start': start_time,
-            'end': end_time
-        })
+
+        result.append(_result(p, end_time))
+        timeline.append(Segment(p['pid'], start_time, end_time))
 
         current_time = end_time
 
     return result, timeline
 
-def round_robin(processes, time_quantum):
+def round_robin(processes, time_quantum, merge_segments=False, switch_cost=None):
     processes = sorted(processes, key=lambda x: x['arrival'])
-    queue = []
+    queue = deque()
     time = 0
     timeline = []
     results = []
     remaining_burst = {p['pid']: p['burst'] for p in processes}
     process_map = {p['pid']: p for p in processes}
-    arrived = []
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
     i = 0
 
     while i < len(processes) or queue:
+        # Jump straight to the next arrival when the CPU is idle
+        if not queue and processes[i]['arrival'] > time:
+            time = processes[i]['arrival']
+
         # Add newly arrived processes
         while i < len(processes) and processes[i]['arrival'] <= time:
             queue.append(processes[i]['pid'])
-            arrived.append(processes[i]['pid'])
             i += 1
 
-        if not queue:
-            time += 1
-            continue
-
-        pid = queue.pop(0)
+        pid = queue.popleft()
+        if switches:
+            time = switches.dispatch(pid, time)
         burst_left = remaining_burst[pid]
         run_time = min(time_quantum, burst_left)
         start_time = time
         time += run_time
         end_time = time
 
-        # Add to timeline
-        timeline.append({
-            'pid': pid,
-            'start': start_time,
-            'end': end_time
-        })
+        # Add to timeline, optionally folding back-to-back quanta of the same PID
+        if merge_segments:
+            _add_segment(timeline, pid, start_time, end_time)
+        else:
+            timeline.append(Segment(pid, start_time, end_time))
 
         remaining_burst[pid] -= run_time
 
         # Add newly arrived processes during this run
         while i < len(processes) and processes[i]['arrival'] <= time:
-            if processes[i]['pid'] not in arrived:
-                queue.append(processes[i]['pid'])
-                arrived.append(processes[i]['pid'])
+            queue.append(processes[i]['pid'])
             i += 1
 
         # Requeue if not finished
         if remaining_burst[pid] > 0:
             queue.append(pid)
         else:
-            turnaround = end_time - process_map[pid]['arrival']
-            waiting = turnaround - process_map[pid]['burst']
-            results.append({
-                'pid': pid,
-                'arrival': process_map[pid]['arrival'],
-                'burst': process_map[pid]['burst'],
-                'completion': end_time,
-                'waiting': waiting,
-                'turnaround': turnaround
-            })
-
-    avg_waiting = sum(p['waiting'] for p in results) / len(results)
-    avg_turnaround = sum(p['turnaround'] for p in results) / len(results)
+            results.append(_result(process_map[pid], end_time))
+            if switches:
+                switches.finish()
+
+    avg_waiting = sum(r.waiting for r in results) / len(results)
+    avg_turnaround = sum(r.turnaround for r in results) / len(results)
 
     return {
         'processes': results,
@@ -99,185 +222,366 @@ def round_robin(processes, time_quantum):
         'avg_turnaround': avg_turnaround
     }, timeline
 
-def sjf(processes):
-    processes = sorted(processes, key=lambda x: (x['arrival'], x['burst']))
+def _dispatch_order(processes, key, switches=None):
+    # Heap-backed ready queue fed by an arrival cursor over the sorted input.
+    # Ties on key go to the earlier position in processes, so results are deterministic.
+    # Yields each job with the time it starts running.
+    n = len(processes)
+    ready_queue = []
+    current_time = 0
+    i = 0
+
+    while i < n or ready_queue:
+        if not ready_queue and processes[i]['arrival'] > current_time:
+            current_time = processes[i]['arrival']
+
+        while i < n and processes[i]['arrival'] <= current_time:
+            heapq.heappush(ready_queue, (key(processes[i]), i))
+            i += 1
+
+        _, idx = heapq.heappop(ready_queue)
+        current = processes[idx]
+        if switches:
+            current_time = switches.dispatch(current['pid'], current_time)
+            switches.finish()
+        yield current, current_time
+        current_time += current['burst']
+
+
+def sjf(processes, switch_cost=None, predictor=None):
+    # With a predictor (see prediction.py) jobs are ranked on predicted bursts, and
+    # the predictor learns each actual burst as the job completes
+    if predictor is None:
+        processes = sorted(processes, key=lambda x: (x['arrival'], x['burst']))
+        key = lambda p: p['burst']
+    else:
+        processes = sorted(processes, key=lambda x: x['arrival'])
+        key = predictor.predict
     result = []
     timeline = []
-    current_time = 0
-    ready_queue = []
-    completed = []
-
-    while len(completed) < len(processes):
-        for p in processes:
-            if p not in completed and p['arrival'] <= current_time and p not in ready_queue:
-                ready_queue.append(p)
-
-        if ready_queue:
-            ready_queue.sort(key=lambda x: x['burst'])
-            current = ready_queue.pop(0)
-            start_time = max(current_time, current['arrival'])
-            end_time = start_time + current['burst']
-            completion = end_time
-            turnaround = completion - current['arrival']
-            waiting = turnaround - current['burst']
-
-            result.append({
-                'pid': current['pid'],
-                'arrival': current['arrival'],
-                'burst': current['burst'],
-                'completion': completion,
-                'turnaround': turnaround,
-                'waiting': waiting
-            })
-
-            timeline.append({
-                'pid': current['pid'],
-                'start': start_time,
-                'end': end_time
-            })
-
-            current_time = end_time
-            completed.append(current)
-        else:
-            current_time += 1
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
+
+    for current, start_time in _dispatch_order(processes, key, switches):
+        end_time = start_time + current['burst']
+
+        result.append(_result(current, end_time))
+        timeline.append(Segment(current['pid'], start_time, end_time))
+        if predictor is not None:
+            predictor.update(current, current['burst'])
 
     return result, timeline
 
-def priority_scheduling(processes):
+def _priority_key(aging):
+    # Lower value = higher priority. With aging, a job's effective priority improves
+    # by one level per `aging` time units since it arrived. Every job ages at the
+    # same rate, so ranking by priority + arrival / aging gives the same order at
+    # any instant and the heap never needs re-keying.
+    if not aging:
+        return lambda p: p['priority']
+    return lambda p: p['priority'] + p['arrival'] / aging
+
+
+def priority_scheduling(processes, aging=None, switch_cost=None):
     processes = sorted(processes, key=lambda x: (x['arrival'], x['priority']))
     result = []
     timeline = []
-    current_time = 0
-    ready_queue = []
-    completed = []
-
-    while len(completed) < len(processes):
-        for p in processes:
-            if p not in completed and p['arrival'] <= current_time and p not in ready_queue:
-                ready_queue.append(p)
-
-        if ready_queue:
-            ready_queue.sort(key=lambda x: x['priority'])  # Lower value = higher priority
-            current = ready_queue.pop(0)
-            start_time = max(current_time, current['arrival'])
-            end_time = start_time + current['burst']
-            completion = end_time
-            turnaround = completion - current['arrival']
-            waiting = turnaround - current['burst']
-
-            result.append({
-                'pid': current['pid'],
-                'arrival': current['arrival'],
-                'burst': current['burst'],
-                'priority': current['priority'],
-                'completion': completion,
-                'turnaround': turnaround,
-                'waiting': waiting
-            })
-
-            timeline.append({
-                'pid': current['pid'],
-                'start': start_time,
-                'end': end_time
-            })
-
-            current_time = end_time
-            completed.append(current)
-        else:
-            current_time += 1
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
+
+    for current, start_time in _dispatch_order(processes, _priority_key(aging), switches):
+        end_time = start_time + current['burst']
+
+        result.append(_result(current, end_time))
+        timeline.append(Segment(current['pid'], start_time, end_time))
 
     return result, timeline
 
 
-def preemptive_sjf(processes):
+def _add_segment(timeline, pid, start, end):
+    # Extend the previous segment instead of starting a new one for the same PID
+    if timeline and timeline[-1].pid == pid and timeline[-1].end == start:
+        timeline[-1].end = end
+    else:
+        timeline.append(Segment(pid, start, end))
+
+
+def _preemptive_engine(processes, key, switch_cost=None, on_complete=None):
+    # Event-driven core: the clock jumps between arrivals and completions and the
+    # ready queue is a heap of (key, arrival order) so ties go to the earlier arrival
     processes = sorted(processes, key=lambda x: x['arrival'])
     n = len(processes)
-    time = 0
-    completed = 0
-    remaining_bt = {p['pid']: p['burst'] for p in processes}
-    start_time = {}
+    remaining = [p['burst'] for p in processes]
+    results = [None] * n
     timeline = []
     ready_queue = []
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
+    time = 0
+    i = 0
+    completed = 0
 
     while completed < n:
-        for p in processes:
-            if p['arrival'] <= time and p['pid'] not in [x['pid'] for x in ready_queue if x['pid'] != 'idle'] and remaining_bt[p['pid']] > 0:
-                ready_queue.append(p)
-
-        if not ready_queue:
-            timeline.append({'pid': 'idle', 'start': time, 'end': time + 1})
-            time += 1
-            continue
-
-        current = min(ready_queue, key=lambda x: remaining_bt[x['pid']])
-        if current['pid'] not in start_time:
-            start_time[current['pid']] = time
-
-        timeline.append({'pid': current['pid'], 'start': time, 'end': time + 1})
-        remaining_bt[current['pid']] -= 1
-        time += 1
-
-        if remaining_bt[current['pid']] == 0:
-            current['completion'] = time
-            current['turnaround'] = current['completion'] - current['arrival']
-            current['waiting'] = current['turnaround'] - current['burst']
+        if not ready_queue and processes[i]['arrival'] > time:
+            _add_segment(timeline, 'idle', time, processes[i]['arrival'])
+            time = processes[i]['arrival']
+
+        while i < n and processes[i]['arrival'] <= time:
+            heapq.heappush(ready_queue, (key(processes[i], remaining[i]), i))
+            i += 1
+
+        _, idx = heapq.heappop(ready_queue)
+        current = processes[idx]
+        if switches:
+            time = switches.dispatch(current['pid'], time)
+
+        # Run until the job finishes or the next arrival may preempt it. A job that
+        # arrived during the switch gets its chance to preempt once the switch is done.
+        run_time = remaining[idx]
+        if i < n:
+            run_time = min(run_time, processes[i]['arrival'] - time)
+        if run_time > 0:
+            _add_segment(timeline, current['pid'], time, time + run_time)
+            time += run_time
+            remaining[idx] -= run_time
+
+        if remaining[idx] > 0:
+            heapq.heappush(ready_queue, (key(current, remaining[idx]), idx))
+        else:
+            results[idx] = _result(current, time)
             completed += 1
-            ready_queue = [p for p in ready_queue if p['pid'] != current['pid']]
+            if switches:
+                switches.finish()
+            if on_complete:
+                on_complete(current)
+
+    return results, timeline
+
+
+def preemptive_sjf(processes, switch_cost=None, predictor=None):
+    if predictor is None:
+        return _preemptive_engine(processes, lambda p, remaining: remaining, switch_cost)
+
+    # Predicted remaining time: the prediction made when the job first became ready,
+    # less the time it has run. A job that outlives its prediction is assumed to be
+    # halfway done, so an underestimated long job cannot hold the CPU at rank 0.
+    predicted = {}
+
+    def key(p, remaining):
+        prediction = predicted.get(p['pid'])
+        if prediction is None:
+            prediction = predicted[p['pid']] = predictor.predict(p)
+        ran = p['burst'] - remaining
+        return prediction - ran if ran < prediction else ran
+
+    def on_complete(p):
+        del predicted[p['pid']]
+        predictor.update(p, p['burst'])
+
+    return _preemptive_engine(processes, key, switch_cost, on_complete)
+
 
-    return processes, timeline
+def priority_preemptive(processes, aging=None, switch_cost=None):
+    key = _priority_key(aging)
+    return _preemptive_engine(processes, lambda p, remaining: key(p), switch_cost)
 
-def priority_preemptive(processes):
+
+def _positive(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def mlfq(processes, quanta=(4, 8, 16), boost_interval=None, switch_cost=None):
+    # Multilevel feedback queue. New jobs enter level 0; a job that uses up its
+    # level's quantum drops one level (quanta[-1] = None makes the last level run to
+    # completion). A job waiting in a higher level preempts a lower one, and the
+    # preempted job keeps the time it already used at its level. Every
+    # boost_interval time units all jobs go back to level 0.
+    if not quanta:
+        raise ValueError("mlfq needs at least one level quantum")
+    for q in quanta[:-1]:
+        if not _positive(q):
+            raise ValueError(f"mlfq quanta must be positive numbers, got {q!r}")
+    if quanta[-1] is not None and not _positive(quanta[-1]):
+        raise ValueError(f"the last mlfq quantum must be a positive number or None, got {quanta[-1]!r}")
+    if boost_interval is not None and not _positive(boost_interval):
+        raise ValueError(f"boost_interval must be a positive number, got {boost_interval!r}")
     processes = sorted(processes, key=lambda x: x['arrival'])
     n = len(processes)
+    remaining = [p['burst'] for p in processes]
+    level = [0] * n
+    used = [0] * n
+    results = [None] * n
+    timeline = []
+    ready_queue = []  # [level, seq, index]; seq keeps each level FIFO
+    switches = _Switches(switch_cost, timeline) if switch_cost else None
+    seq = 0
     time = 0
+    i = 0
     completed = 0
-    remaining_bt = {p['pid']: p['burst'] for p in processes}
-    start_time = {}
-    timeline = []
-    ready_queue = []
+    current = None
+    demoted = None
+    next_boost = boost_interval
 
     while completed < n:
-        for p in processes:
-            if p['arrival'] <= time and p['pid'] not in [x['pid'] for x in ready_queue if x['pid'] != 'idle'] and remaining_bt[p['pid']] > 0:
-                ready_queue.append(p)
-
-        if not ready_queue:
-            timeline.append({'pid': 'idle', 'start': time, 'end': time + 1})
-            time += 1
-            continue
-        if preemptive:
-            ready_queue.sort(key=lambda x: x.priority)
-        process = ready_queue.pop(0)
-        process.start_time = current_time
-        process.completion_time = current_time + process.burst
-        process.turnaround_time = process.completion_time - process.arrival
-        process.waiting_time = process.turnaround_time - process.burst
-        current_time = process.completion_time
-        completed.append(process)
-    return completed
-
-def round_robin(processes, quantum):
-    queue = []
-    current_time = 0
-    completed = []
-    remaining_burst = {p.pid: p.burst for p in processes}
-    while processes or queue:
-        while processes and processes[0].arrival <= current_time:
-            queue.append(processes.pop(0))
-        if not queue:
-            current_time = processes[0].arrival
-            continue
-        process = queue.pop(0)
-        if process.start_time is None:
-            process.start_time = current_time
-        if remaining_burst[process.pid] > quantum:
-            remaining_burst[process.pid] -= quantum
-            current_time += quantum
-            queue.append(process)
+        if current is None and demoted is None and not ready_queue and processes[i]['arrival'] > time:
+            _add_segment(timeline, 'idle', time, processes[i]['arrival'])
+            time = processes[i]['arrival']
+
+        # A boost re-heapifies in O(n), so dispatch is O(log n) amortized over
+        # the boost_interval, not per dispatch.
+        if boost_interval and time >= next_boost:
+            for entry in ready_queue:
+                level[entry[2]] = used[entry[2]] = entry[0] = 0
+            heapq.heapify(ready_queue)
+            for idx in (current, demoted):
+                if idx is not None:
+                    level[idx] = used[idx] = 0
+            next_boost = (time // boost_interval + 1) * boost_interval
+
+        while i < n and processes[i]['arrival'] <= time:
+            heapq.heappush(ready_queue, [0, seq, i])
+            seq += 1
+            i += 1
+
+        # Like round_robin, jobs arriving as a quantum expires queue ahead of it
+        if demoted is not None:
+            heapq.heappush(ready_queue, [level[demoted], seq, demoted])
+            seq += 1
+            demoted = None
+
+        if current is None:
+            current = heapq.heappop(ready_queue)[2]
+        elif ready_queue and ready_queue[0][0] < level[current]:
+            heapq.heappush(ready_queue, [level[current], seq, current])
+            seq += 1
+            current = heapq.heappop(ready_queue)[2]
+        if switches:
+            time = switches.dispatch(processes[current]['pid'], time)
+
+        # Run until completion, quantum expiry, the next arrival or the next boost
+        quantum = quanta[level[current]]
+        run_time = remaining[current]
+        if quantum is not None:
+            run_time = min(run_time, quantum - used[current])
+        if i < n:
+            run_time = min(run_time, processes[i]['arrival'] - time)
+        if boost_interval:
+            run_time = min(run_time, next_boost - time)
+
+        if run_time > 0:
+            _add_segment(timeline, processes[current]['pid'], time, time + run_time)
+            time += run_time
+            remaining[current] -= run_time
+            used[current] += run_time
+
+        if remaining[current] == 0:
+            results[current] = _result(processes[current], time)
+            completed += 1
+            current = None
+            if switches:
+                switches.finish()
+        elif quantum is not None and used[current] >= quantum:
+            level[current] = min(level[current] + 1, len(quanta) - 1)
+            used[current] = 0
+            demoted = current
+            current = None
+
+    return results, timeline
+
+
+class IncrementalSimulation:
+    # Keeps a schedule up to date across adds and deletes without re-running it from
+    # t=0. Every scheduler here is work-conserving and no job affects anything
+    # before its own arrival, so the schedule splits into busy periods that each
+    # start from an idle CPU with an empty ready queue. Those starts are the
+    # checkpoints: an edit re-runs from the last checkpoint at or before the edited
+    # arrival, up to the first later checkpoint that the new run has finished by,
+    # and keeps everything outside that window as it was.
+    #
+    # run(processes) -> (results, timeline) is any of the schedulers above with its
+    # parameters bound. Set idle_segments for schedulers that emit 'idle' segments.
+    def __init__(self, run, processes=(), idle_segments=False):
+        self.run = run
+        self.idle_segments = idle_segments
+        self.jobs = sorted(processes, key=lambda x: x['arrival'])
+        self.arrivals = [p['arrival'] for p in self.jobs]
+        self.results, self.timeline = run(self.jobs) if self.jobs else ([], [])
+        self.resimulated = len(self.jobs)
+        self._find_checkpoints()
+
+    def _find_checkpoints(self):
+        # (time, jobs arriving before it, timeline index) at t=0 and after each idle
+        # gap; the timeline index keeps the idle segment that leads up to the time
+        self.checkpoints = [(0, 0, 0)]
+        busy_until = 0
+        for index, segment in enumerate(self.timeline):
+            if segment['pid'] == 'idle':
+                continue
+            if segment['start'] > busy_until:
+                self.checkpoints.append((segment['start'], bisect_left(self.arrivals, segment['start']), index))
+            busy_until = segment['end']
+
+    def add(self, process):
+        # Jobs with equal arrivals keep insertion order, as the stable sorts do
+        index = bisect_right(self.arrivals, process['arrival'])
+        self.jobs.insert(index, process)
+        self.arrivals.insert(index, process['arrival'])
+        self._resimulate(process['arrival'])
+
+    def remove(self, pid):
+        for index, p in enumerate(self.jobs):
+            if p['pid'] == pid:
+                del self.jobs[index]
+                del self.arrivals[index]
+                self._resimulate(p['arrival'])
+                return p
+        return None
+
+    def _resimulate(self, arrival):
+        # Checkpoints still describe the schedule before the edit
+        at = bisect_right(self.checkpoints, arrival, key=lambda c: c[0]) - 1
+        start, kept_jobs, kept_segments = self.checkpoints[at]
+        later = self.checkpoints[at + 1:]
+
+        # Widen the window over later checkpoints (1, 2, 4, ...) until the re-run
+        # drains before the next busy period of the old schedule begins
+        step = 1
+        while True:
+            end = later[step - 1] if step <= len(later) else None
+            last = bisect_left(self.arrivals, end[0]) if end else len(self.jobs)
+            window = self.jobs[bisect_left(self.arrivals, start):last]
+            results, timeline = self.run(window) if window else ([], [])
+            if end is None or all(r['completion'] <= end[0] for r in results):
+                break
+            step = min(step * 2, len(later) + 1)
+
+        new_timeline = self.timeline[:kept_segments]
+        for segment in timeline:
+            if segment['end'] > start:
+                self._append(new_timeline, segment, start)
+        new_results = self.results[:kept_jobs] + results
+
+        if end is not None:
+            end_time, old_jobs, old_segments = end
+            if self.idle_segments:
+                self._append(new_timeline, Segment('idle', 0, end_time), new_timeline[-1]['end'] if new_timeline else 0)
+            new_timeline += self.timeline[old_segments:]
+            # Jobs before the old checkpoint are the ones the window covered
+            new_results += self.results[old_jobs:]
+        elif new_timeline and new_timeline[-1]['pid'] == 'idle':
+            # The edit removed the last busy period; schedules never end idle
+            new_timeline.pop()
+
+        self.results, self.timeline = new_results, new_timeline
+        self.resimulated = len(window)
+        self._find_checkpoints()
+
+    def _append(self, timeline, segment, start):
+        # Clip the window's leading idle segment to the checkpoint and join it to an
+        # idle segment before it. Segments are shared with older timelines, so
+        # build a new one rather than extending the last in place.
+        if segment['start'] < start:
+            segment = Segment(segment['pid'], start, segment['end'])
+        if segment['start'] >= segment['end']:
+            return
+        if timeline and timeline[-1]['pid'] == segment['pid'] == 'idle' and timeline[-1]['end'] == segment['start']:
+            timeline[-1] = Segment('idle', timeline[-1]['start'], segment['end'])
         else:
-            current_time += remaining_burst[process.pid]
-            process.completion_time = current_time
-            process.turnaround_time = process.completion_time - process.arrival
-            process.waiting_time = process.turnaround_time - process.burst
-            completed.append(process)
-    return completed
+            timeline.append(segment)
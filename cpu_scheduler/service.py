@@ -0,0 +1,596 @@
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .cache import ResultCache, fingerprint
+from .metrics import Histogram, MetricsCollector, PERCENTILES, summarize
+from .prediction import PREDICTORS, make_predictor
+from .registry import SCHEDULERS, get_scheduler
+from .scheduler import Process, Result, Segment, SwitchCost, to_dicts
+from .streaming import STREAMS
+from .traces import iter_csv
+
+# Local HTTP/JSON service for capacity-planning scripts, standard library only:
+#
+#   python -m cpu_scheduler.service serve --port 8765
+#   python -m cpu_scheduler.service load --requests 200 --concurrency 16
+#
+# asyncio handles the connections and simulations run off the event loop, so a long
+# run never blocks other clients. Identical requests that arrive while one is still
+# running follow that run instead of starting their own, and finished runs stay in
+# an LRU of results.
+#
+#   GET  /algorithms  registered schedulers and the parameters they take
+#   GET  /stats       request, coalescing and cache counters
+#   POST /traces      CSV (text/csv) or a JSON list of processes -> {"trace": id, "processes": n}
+#   POST /jobs        {"trace": id | "processes": [...], "algorithm": name, "params": {...},
+#                      "timeline": false}
+#
+# /jobs answers with newline-delimited JSON in chunked encoding: {"results": [...]}
+# lines (and {"timeline": [...]} lines when asked for) of at most BATCH_SIZE rows
+# each, then a {"summary": ...} line. Algorithms with a generator in streaming.py
+# (fcfs, sjf, priority, round_robin without switch costs or predictors) run in a
+# thread and each batch goes out as soon as it is full, so the first rows of a
+# large run arrive while it is still going. The others run on a process pool and
+# their lines go out once the whole run is done.
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BATCH_SIZE = 1000
+MAX_BODY = 256 * 1024 * 1024
+
+STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+          413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _columns(processes):
+    # Column lists pickle to the pool workers much faster than Process records
+    return ([p['pid'] for p in processes], [p['arrival'] for p in processes],
+            [p['burst'] for p in processes], [p.get('priority', 0) for p in processes])
+
+
+def _run_job(columns, algorithm, params, include_timeline):
+    # Runs in a pool worker and returns the encoded response lines: serializing a
+    # large run costs more than simulating it, so it is done here in parallel and
+    # only once per distinct job rather than on the event loop for every client
+    processes = [Process(*row) for row in zip(*columns)]
+    if 'predictor' in params:
+        # Built here from its spec: predictors learn during the run, so each run
+        # needs a fresh one, and the spec keeps job keys comparable
+        params = dict(params, predictor=make_predictor(**dict(params['predictor'])))
+    results, timeline = SCHEDULERS[algorithm].run(processes, **params)
+    lines = []
+    for name, rows in (('results', results), ('timeline', timeline if include_timeline else ())):
+        for i in range(0, len(rows), BATCH_SIZE):
+            lines.append(_line(name, rows[i:i + BATCH_SIZE]))
+    lines.append(_line('summary', summarize(results, timeline)))
+    return lines
+
+
+def _streams(algorithm, params):
+    # The generators take no switch costs, aging or predictors
+    return algorithm in STREAMS and set(params) <= {'time_quantum'}
+
+
+def _stream_job(columns, algorithm, params, include_timeline, emit):
+    # Runs in a thread and hands each encoded line to emit as soon as its batch is
+    # full. The summary comes from a collector watching the stream, with the same
+    # throughput window summarize() would pick.
+    processes = sorted((Process(*row) for row in zip(*columns)), key=lambda p: p.arrival)
+    collector = MetricsCollector(_window(processes))
+    batches = {Result: [], Segment: []}
+    names = {Result: 'results', Segment: 'timeline'}
+    for event in collector.observe(STREAMS[algorithm](processes, **params)):
+        batch = batches[type(event)]
+        if batch is batches[Segment] and not include_timeline:
+            continue
+        batch.append(event)
+        if len(batch) == BATCH_SIZE:
+            emit(_line(names[type(event)], batch))
+            batch.clear()
+    for kind, batch in batches.items():
+        if batch:
+            emit(_line(names[kind], batch))
+    emit(_line('summary', collector.summary()))
+
+
+def _window(processes):
+    # A tenth of the makespan, as in summarize(). The streamed policies never idle
+    # with work queued, so they all finish when FCFS would.
+    if not processes:
+        return None
+    time = 0
+    for p in processes:
+        time = max(time, p.arrival) + p.burst
+    return (time - processes[0].arrival) / 10 or None
+
+
+def _line(name, value):
+    if isinstance(value, list):
+        value = to_dicts(value)
+    return json.dumps({name: value}).encode('utf-8') + b'\n'
+
+
+def _number(name, value, bound='positive'):
+    # JSON numbers only, checked before the job is queued: a string or a quantum of
+    # zero would fail, or never finish, in a pool worker
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value != value:
+        raise HTTPError(400, f"{name} must be a number, got {value!r}")
+    if bound == 'positive' and value <= 0 or bound == 'non-negative' and value < 0:
+        raise HTTPError(400, f"{name} must be {bound}, got {value!r}")
+    return value
+
+
+def _switch_cost(cost):
+    # A number, [dispatch, warmup, cold_after] or {"dispatch": ..., ...}
+    if isinstance(cost, list):
+        if len(cost) > 3:
+            raise HTTPError(400, "switch_cost takes at most [dispatch, warmup, cold_after]")
+        cost = dict(zip(SwitchCost.__slots__, cost))
+    elif not isinstance(cost, dict):
+        return _number('switch_cost', cost, 'non-negative')
+    unknown = set(cost) - set(SwitchCost.__slots__)
+    if unknown:
+        raise HTTPError(400, f"switch_cost does not take {', '.join(sorted(unknown))}")
+    for name in ('dispatch', 'warmup'):
+        _number(f"switch_cost {name}", cost.get(name, 0), 'non-negative')
+    if cost.get('cold_after') is not None:
+        _number('switch_cost cold_after', cost['cold_after'])
+    return SwitchCost(**cost)
+
+
+def _predictor_spec(predictor):
+    # "ewma" or {"name": "ewma", "alpha": 0.3} -> a sorted tuple of the options.
+    # A trial predictor is built and trained on one job here, so bad options are a
+    # 400 now rather than an error from the worker.
+    spec = {'name': predictor} if isinstance(predictor, str) else predictor
+    if not isinstance(spec, dict) or spec.get('name') not in PREDICTORS:
+        name = spec.get('name') if isinstance(spec, dict) else spec
+        raise HTTPError(400, f"Unknown predictor {name!r}; expected one of {', '.join(PREDICTORS)}")
+    if 'key' in spec:
+        raise HTTPError(400, "The predictor key function cannot be set over the API")
+    try:
+        trial = make_predictor(**spec)
+        probe = Process('probe', 0, 1)
+        trial.update(probe, 1)
+        trial.predict(probe)
+    except (TypeError, ValueError, ArithmeticError, ImportError) as e:
+        raise HTTPError(400, f"Bad predictor options: {e}") from None
+    return tuple(sorted(spec.items()))
+
+
+def _job_params(scheduler, params):
+    # JSON parameters -> keyword arguments for the scheduler
+    if not isinstance(params, dict):
+        raise HTTPError(400, "params must be a JSON object")
+    unknown = set(params) - set(scheduler.params)
+    if unknown:
+        raise HTTPError(400, f"{scheduler.name} does not take {', '.join(sorted(unknown))}")
+    params = dict(params)
+    if 'time_quantum' in scheduler.params:
+        if params.get('time_quantum') is None:
+            raise HTTPError(400, f"{scheduler.name} needs time_quantum")
+        _number('time_quantum', params['time_quantum'])
+    for name in ('aging', 'boost_interval'):
+        if params.get(name) is not None:
+            _number(name, params[name])
+    quanta = params.get('quanta')
+    if quanta is not None:
+        if not isinstance(quanta, list) or not quanta:
+            raise HTTPError(400, "quanta must be a non-empty list")
+        # null as the last level runs jobs there to completion
+        for q in quanta if quanta[-1] is not None else quanta[:-1]:
+            _number('quanta', q)
+        params['quanta'] = tuple(quanta)
+    if params.get('switch_cost') is not None:
+        params['switch_cost'] = _switch_cost(params['switch_cost'])
+    if params.get('predictor') is not None:
+        params['predictor'] = _predictor_spec(params['predictor'])
+    return params
+
+
+def _parse_processes(body, content_type):
+    try:
+        if content_type.startswith('text/csv'):
+            return _checked(list(iter_csv(io.StringIO(body.decode('utf-8')))))
+        return _processes(json.loads(body))
+    except (ValueError, KeyError) as e:
+        raise HTTPError(400, f"Bad process table: {e}") from None
+
+
+def _processes(rows):
+    try:
+        processes = [Process(row['pid'], row['arrival'], row['burst'], row.get('priority', 0)) for row in rows]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise HTTPError(400, f"Bad process table: {e!r}") from None
+    return _checked(processes)
+
+
+def _checked(processes):
+    for p in processes:
+        _number(f"Process {p.pid} arrival", p.arrival, None)
+        _number(f"Process {p.pid} burst", p.burst, 'non-negative')
+        _number(f"Process {p.pid} priority", p.priority, None)
+    return processes
+
+
+class _Run:
+    # The encoded lines of one job as they are produced. Every client asking for
+    # the job reads them from the first line, however late it joined.
+    def __init__(self, lines=(), done=False):
+        self.lines = list(lines)
+        self.done = done
+        self.error = None
+        self.task = None
+        self._changed = asyncio.Event()
+
+    def push(self, line):
+        self.lines.append(line)
+        self._wake()
+
+    def finish(self, error=None):
+        self.done = True
+        self.error = error
+        self._wake()
+
+    def _wake(self):
+        # Waiters hold the event being set; later ones wait on a fresh one
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self):
+        i = 0
+        while True:
+            if i < len(self.lines):
+                yield self.lines[i]
+                i += 1
+            elif self.error is not None:
+                raise self.error
+            elif self.done:
+                return
+            else:
+                await self._changed.wait()
+
+
+class SimulationService:
+    def __init__(self, workers=None, max_traces=16, max_results=64):
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.threads = ThreadPoolExecutor(max_workers=workers)
+        self.max_traces = max_traces
+        self.traces = OrderedDict()  # trace id -> column lists
+        self.results = ResultCache(maxsize=max_results)
+        self.inflight = {}           # job key -> _Run shared by identical requests
+        self.requests = 0
+        self.runs = 0
+        self.coalesced = 0
+
+    def add_trace(self, processes):
+        trace_id = fingerprint(processes)
+        self.traces[trace_id] = _columns(processes)
+        self.traces.move_to_end(trace_id)
+        while len(self.traces) > self.max_traces:
+            self.traces.popitem(last=False)
+        return trace_id
+
+    def run_job(self, trace_id, columns, algorithm, params, include_timeline):
+        # A _Run to follow: finished for a cached job, in progress otherwise
+        key = hashlib.blake2b(repr((trace_id, algorithm, sorted(params.items()), include_timeline))
+                              .encode('utf-8'), digest_size=16).hexdigest()
+        found, lines = self.results.get(key)
+        if found:
+            return _Run(lines, done=True)
+        run = self.inflight.get(key)
+        if run is None:
+            run = self.inflight[key] = _Run()
+            # The run is its own task, so a client that disconnects does not cancel
+            # it for the others
+            run.task = asyncio.ensure_future(self._compute(key, run, columns, algorithm, params,
+                                                           include_timeline))
+        else:
+            self.coalesced += 1
+        return run
+
+    async def _compute(self, key, run, columns, algorithm, params, include_timeline):
+        self.runs += 1
+        loop = asyncio.get_running_loop()
+        try:
+            if _streams(algorithm, params):
+                def emit(line):
+                    loop.call_soon_threadsafe(run.push, line)
+                await loop.run_in_executor(self.threads, _stream_job, columns, algorithm, params,
+                                           include_timeline, emit)
+            else:
+                for line in await loop.run_in_executor(self.pool, _run_job, columns, algorithm, params,
+                                                       include_timeline):
+                    run.push(line)
+        except Exception as e:
+            run.finish(e)
+        else:
+            self.results.put(key, run.lines)
+            run.finish()
+        finally:
+            self.inflight.pop(key, None)
+
+    def stats(self):
+        return {'requests': self.requests, 'runs': self.runs, 'coalesced': self.coalesced,
+                'inflight': len(self.inflight), 'traces': len(self.traces), 'cache': self.results.info()}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request = await _read_message(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                self.requests += 1
+                try:
+                    await self.dispatch(method, path, headers, body, writer)
+                except HTTPError as e:
+                    await _send_json(writer, e.status, {'error': str(e)})
+                except ConnectionError:
+                    raise
+                except ValueError as e:
+                    # Schedulers reject bad parameters with ValueError
+                    await _send_json(writer, 400, {'error': str(e)})
+                except Exception as e:
+                    await _send_json(writer, 500, {'error': f"{type(e).__name__}: {e}"})
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except HTTPError as e:
+            await _send_json(writer, e.status, {'error': str(e)})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, headers, body, writer):
+        route = {
+            '/algorithms': ('GET', self.get_algorithms),
+            '/stats': ('GET', self.get_stats),
+            '/traces': ('POST', self.post_trace),
+            '/jobs': ('POST', self.post_job),
+        }.get(path.split('?')[0])
+        if route is None:
+            raise HTTPError(404, f"No route for {path}")
+        if method != route[0]:
+            raise HTTPError(405, f"{path} expects {route[0]}")
+        await route[1](headers, body, writer)
+
+    async def get_algorithms(self, headers, body, writer):
+        await _send_json(writer, 200, [{'name': s.name, 'label': s.label, 'params': list(s.params)}
+                                       for s in SCHEDULERS.values()])
+
+    async def get_stats(self, headers, body, writer):
+        await _send_json(writer, 200, self.stats())
+
+    async def post_trace(self, headers, body, writer):
+        processes = _parse_processes(body, headers.get('content-type', 'application/json'))
+        await _send_json(writer, 200, {'trace': self.add_trace(processes), 'processes': len(processes)})
+
+    async def post_job(self, headers, body, writer):
+        try:
+            job = json.loads(body)
+            algorithm = job['algorithm']
+        except (ValueError, KeyError, TypeError):
+            raise HTTPError(400, "Expected a JSON object with an algorithm") from None
+        try:
+            scheduler = get_scheduler(algorithm)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+        params = _job_params(scheduler, job.get('params') or {})
+
+        if 'processes' in job:
+            trace_id = self.add_trace(_processes(job['processes']))
+        elif job.get('trace') in self.traces:
+            trace_id = job['trace']
+        else:
+            raise HTTPError(404, "Unknown trace; upload it to /traces first")
+        # Read before anything awaits: other requests can evict the trace meanwhile
+        columns = self.traces[trace_id]
+
+        lines = self.run_job(trace_id, columns, algorithm, params, bool(job.get('timeline'))).follow()
+        # A run that fails before its first line still gets an error response
+        first = await anext(lines, None)
+
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n'
+                     b'Transfer-Encoding: chunked\r\n\r\n')
+        try:
+            if first is not None:
+                await _write_chunk(writer, first)
+            async for line in lines:
+                await _write_chunk(writer, line)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            # The status line is out; end the connection without the final chunk so
+            # the client sees a truncated response rather than a complete one
+            raise ConnectionError(f"run failed mid-stream: {e}") from e
+        await _write_chunk(writer, b'')
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+        self.threads.shutdown(cancel_futures=True)
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving on http://{host}:{port}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+async def _read_message(reader):
+    # One HTTP/1.1 message: (start line, headers, body), or None at end of stream
+    start = await reader.readline()
+    if not start.strip():
+        return None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            chunk = await reader.readexactly(size + 2)
+            if not size:
+                break
+            body += chunk[:-2]
+            if len(body) > MAX_BODY:
+                raise HTTPError(413, "Request body too large")
+        body = bytes(body)
+    else:
+        length = int(headers.get('content-length') or 0)
+        if length > MAX_BODY:
+            raise HTTPError(413, "Request body too large")
+        body = await reader.readexactly(length)
+
+    first, second, _ = start.decode('latin-1').split(' ', 2)
+    return first, second, headers, body
+
+
+async def _send_json(writer, status, obj):
+    body = json.dumps(obj).encode('utf-8')
+    writer.write(f"HTTP/1.1 {status} {STATUS[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+
+
+async def _write_chunk(writer, data):
+    writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+    await writer.drain()
+
+
+async def request(reader, writer, method, path, body=b'', content_type='application/json'):
+    # Minimal keep-alive client for the load generator: returns (status, body)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: {content_type}\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    response = await _read_message(reader)
+    if response is None:
+        raise ConnectionError("Connection closed by the service")
+    _, status, _, body = response
+    return int(status), body
+
+
+async def load_test(host, port, job, requests=100, concurrency=8, processes=None):
+    # Fires requests POST /jobs from concurrency keep-alive connections and reports
+    # latency percentiles (ms) and throughput (requests per second)
+    if processes is not None:
+        reader, writer = await asyncio.open_connection(host, port)
+        status, body = await request(reader, writer, 'POST', '/traces',
+                                     json.dumps(to_dicts(processes)).encode('utf-8'))
+        writer.close()
+        if status != 200:
+            raise RuntimeError(f"Trace upload failed: {body.decode('utf-8', 'replace')}")
+        job = dict(job, trace=json.loads(body)['trace'])
+
+    payload = json.dumps(job).encode('utf-8')
+    latency = Histogram()
+    errors = 0
+    remaining = requests
+
+    async def client():
+        nonlocal remaining, errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, 'POST', '/jobs', payload)
+                latency.add((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - start
+
+    report = {'requests': latency.count, 'errors': errors, 'concurrency': concurrency, 'seconds': elapsed,
+              'throughput': latency.count / elapsed if elapsed else 0.0, 'mean_ms': latency.mean}
+    for p in PERCENTILES:
+        report[f'p{p}_ms'] = latency.quantile(p / 100)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cpu_scheduler.service',
+                                     description="Local HTTP/JSON scheduling service and its load generator.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="run the service")
+    serve.add_argument('--host', default=DEFAULT_HOST)
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve.add_argument('--workers', type=int, default=None, help="simulation processes (default: one per CPU)")
+
+    load = commands.add_parser('load', help="measure latency and throughput of a running service")
+    load.add_argument('--host', default=DEFAULT_HOST)
+    load.add_argument('--port', type=int, default=DEFAULT_PORT)
+    load.add_argument('-a', '--algorithm', default='round_robin', choices=list(SCHEDULERS))
+    load.add_argument('-q', '--quantum', type=int, default=4)
+    load.add_argument('--workload', default='poisson')
+    load.add_argument('-n', '--size', type=int, default=10000, help="processes in the uploaded trace")
+    load.add_argument('-s', '--seed', type=int, default=0)
+    load.add_argument('--requests', type=int, default=100)
+    load.add_argument('--concurrency', type=int, default=8)
+    load.add_argument('--distinct', type=int, default=1,
+                      help="split the requests over this many traces (consecutive seeds), so fewer of them "
+                           "can share a run")
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(SimulationService(args.workers).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    from .workloads import generate
+
+    params = {'time_quantum': args.quantum} if 'time_quantum' in SCHEDULERS[args.algorithm].params else {}
+    job = {'algorithm': args.algorithm, 'params': params}
+
+    async def run_all():
+        # Each distinct trace gets an equal share of the requests, all running at once
+        share = max(args.requests // args.distinct, 1)
+        tasks = [load_test(args.host, args.port, job, share, max(args.concurrency // args.distinct, 1),
+                           generate(args.workload, args.size, seed=args.seed + k)) for k in range(args.distinct)]
+        start = time.perf_counter()
+        reports = await asyncio.gather(*tasks)
+        return reports, time.perf_counter() - start
+
+    try:
+        reports, elapsed = asyncio.run(run_all())
+    except OSError as e:
+        parser.error(f"cannot reach the service at {args.host}:{args.port}: {e}")
+    count = sum(r['requests'] for r in reports)
+    print(f"Requests: {count} ({sum(r['errors'] for r in reports)} errors) over {elapsed:.2f} s")
+    print(f"Throughput: {count / elapsed:.1f} requests/s")
+    for k, r in enumerate(reports):
+        label = f"trace {k}: " if len(reports) > 1 else ""
+        print(f"{label}latency mean {r['mean_ms']:.1f} ms, "
+              + ", ".join(f"p{p} {r[f'p{p}_ms']:.1f} ms" for p in PERCENTILES))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
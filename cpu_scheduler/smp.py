@@ -0,0 +1,192 @@
+import heapq
+
+from .registry import fifo, get_event_driven
+from .scheduler import _Record, _result
+
+# Multi-CPU simulation. Every CPU runs one job at a time; ready jobs wait either in
+# one shared queue ('global') or in per-CPU run queues ('steal' lets idle CPUs take
+# work from other queues, 'affinity' pins each job to its CPU). The clock jumps
+# between arrivals and slice ends kept in a heap-based event calendar. Every
+# registered policy with a ready-queue key (see registry.py) can run here.
+
+POLICIES = ('global', 'steal', 'affinity')
+
+
+class CpuSegment(_Record):
+    __slots__ = ('cpu', 'pid', 'start', 'end')
+
+    def __init__(self, cpu, pid, start, end):
+        self.cpu = cpu
+        self.pid = pid
+        self.start = start
+        self.end = end
+
+
+def simulate_smp(processes, algorithm='fcfs', cpus=1, policy='global', time_quantum=None):
+    scheduler = get_event_driven(algorithm)
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; expected one of {', '.join(POLICIES)}")
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    if scheduler.time_sliced and not time_quantum:
+        raise ValueError(f"{algorithm} needs a time_quantum")
+
+    processes = sorted(processes, key=lambda x: x['arrival'])
+    n = len(processes)
+    shared = policy == 'global'
+    key = scheduler.key
+    preemptive = scheduler.preemptive
+    round_robin = scheduler.time_sliced
+    by_seq = key is fifo
+
+    remaining = [p['burst'] for p in processes]
+    results = [None] * n
+    timeline = []
+
+    queues = [[] for _ in range(1 if shared else cpus)]
+    queued = 0
+    seq = 0
+
+    running = [None] * cpus
+    run_start = [0] * cpus
+    run_rank = [0] * cpus
+    version = [0] * cpus
+    last_segment = [None] * cpus
+    idle = [True] * cpus
+    idle_cpus = list(range(cpus))  # lowest idle CPU picks up shared work first
+    calendar = []  # (slice end, cpu, version)
+    worst = []     # running jobs by how much they deserve preemption (global preemptive only)
+
+    def home(i):
+        if shared:
+            return 0
+        cpu = processes[i].get('cpu')
+        return cpu % cpus if cpu is not None else i % cpus
+
+    def enqueue(idx, q):
+        nonlocal queued, seq
+        if by_seq:
+            rank = seq
+            seq += 1
+        else:
+            rank = key(processes[idx], remaining[idx])
+        heapq.heappush(queues[q], (rank, idx))
+        queued += 1
+
+    def take(c):
+        nonlocal queued
+        q = queues[0 if shared else c]
+        if not q and policy == 'steal' and queued:
+            for k in range(1, cpus):
+                if queues[(c + k) % cpus]:
+                    q = queues[(c + k) % cpus]
+                    break
+        if not q:
+            return None
+        queued -= 1
+        return heapq.heappop(q)[1]
+
+    def dispatch(c, idx, t):
+        running[c] = idx
+        run_start[c] = t
+        idle[c] = False
+        version[c] += 1
+        run_time = remaining[idx]
+        if round_robin:
+            run_time = min(time_quantum, run_time)
+        heapq.heappush(calendar, (t + run_time, c, version[c]))
+        if preemptive:
+            # The key with the finish time in place of the remaining time: by the
+            # key contract this orders running jobs the same way their key does at
+            # any later instant
+            run_rank[c] = key(processes[idx], t + remaining[idx])
+            if shared:
+                heapq.heappush(worst, (-run_rank[c], -idx, c, version[c]))
+
+    def stop(c, t):
+        idx = running[c]
+        ran = t - run_start[c]
+        if ran > 0:
+            pid = processes[idx]['pid']
+            last = last_segment[c]
+            if last is not None and last.pid == pid and last.end == run_start[c]:
+                last.end = t
+            else:
+                last_segment[c] = CpuSegment(c, pid, run_start[c], t)
+                timeline.append(last_segment[c])
+            remaining[idx] -= ran
+        running[c] = None
+        idle[c] = True
+        version[c] += 1
+        if shared or policy == 'steal':
+            heapq.heappush(idle_cpus, c)
+        return idx
+
+    def running_key(c, t):
+        idx = running[c]
+        return key(processes[idx], remaining[idx] - (t - run_start[c])), idx
+
+    def preempt(c, q, t):
+        enqueue(stop(c, t), q)
+        dispatch(c, take(c), t)
+
+    done = 0
+    i = 0
+    while done < n:
+        t = calendar[0][0] if calendar else None
+        if i < n and (t is None or processes[i]['arrival'] < t):
+            t = processes[i]['arrival']
+
+        freed = []
+        requeue = []
+        while calendar and calendar[0][0] == t:
+            _, c, v = heapq.heappop(calendar)
+            if v != version[c]:
+                continue  # slice was cut short by a preemption
+            idx = stop(c, t)
+            freed.append(c)
+            if remaining[idx] == 0:
+                results[idx] = _result(processes[idx], t)
+                done += 1
+            else:
+                requeue.append((c, idx))
+
+        touched = []
+        while i < n and processes[i]['arrival'] <= t:
+            q = home(i)
+            enqueue(i, q)
+            touched.append(q)
+            i += 1
+
+        # Arrivals during a quantum queue ahead of the job it ran for
+        for c, idx in requeue:
+            enqueue(idx, 0 if shared else c)
+
+        if not shared:
+            for c in freed + touched:
+                if idle[c] and queues[c]:
+                    dispatch(c, take(c), t)
+        if shared or policy == 'steal':
+            while queued and idle_cpus:
+                c = heapq.heappop(idle_cpus)
+                if idle[c]:
+                    dispatch(c, take(c), t)
+
+        if preemptive and touched:
+            if shared:
+                q = queues[0]
+                while q and worst:
+                    _, _, c, v = worst[0]
+                    if v != version[c]:
+                        heapq.heappop(worst)
+                    elif q[0] < running_key(c, t):
+                        heapq.heappop(worst)
+                        preempt(c, 0, t)
+                    else:
+                        break
+            else:
+                for c in touched:
+                    if running[c] is not None and queues[c] and queues[c][0] < running_key(c, t):
+                        preempt(c, c, t)
+
+    return results, timeline
@@ -0,0 +1,146 @@
+import heapq
+from collections import deque
+
+from .scheduler import Result, Segment, _result
+
+# Generator variants of the scheduler algorithms for traces that do not fit in
+# memory. Each takes an iterator of jobs in arrival order and yields Segment and
+# Result records as soon as they are known; only the ready queue is held in memory.
+
+
+class RunningStats:
+    __slots__ = ('count', 'total_waiting', 'total_turnaround', 'last_completion')
+
+    def __init__(self):
+        self.count = 0
+        self.total_waiting = 0
+        self.total_turnaround = 0
+        self.last_completion = 0
+
+    def add(self, result):
+        self.count += 1
+        self.total_waiting += result.waiting
+        self.total_turnaround += result.turnaround
+        self.last_completion = max(self.last_completion, result.completion)
+
+    @property
+    def avg_waiting(self):
+        return self.total_waiting / self.count if self.count else 0.0
+
+    @property
+    def avg_turnaround(self):
+        return self.total_turnaround / self.count if self.count else 0.0
+
+
+def _in_arrival_order(jobs):
+    last = None
+    for job in jobs:
+        if last is not None and job['arrival'] < last:
+            raise ValueError(f"Job {job['pid']} arrives at {job['arrival']}, "
+                             f"before the previous job at {last}; streams must be in arrival order")
+        last = job['arrival']
+        yield job
+
+
+def _finish(p, completion, stats):
+    result = _result(p, completion)
+    if stats is not None:
+        stats.add(result)
+    return result
+
+
+def stream_fcfs(jobs, stats=None):
+    current_time = 0
+    for p in _in_arrival_order(jobs):
+        start_time = max(current_time, p['arrival'])
+        current_time = start_time + p['burst']
+        yield Segment(p['pid'], start_time, current_time)
+        yield _finish(p, current_time, stats)
+
+
+def _stream_dispatch(jobs, key, stats):
+    # Same dispatch rule as scheduler._dispatch_order, with the arrival cursor
+    # replaced by one job of lookahead on the iterator
+    jobs = _in_arrival_order(jobs)
+    upcoming = next(jobs, None)
+    ready_queue = []
+    current_time = 0
+    seq = 0
+
+    while upcoming is not None or ready_queue:
+        if not ready_queue and upcoming['arrival'] > current_time:
+            current_time = upcoming['arrival']
+
+        while upcoming is not None and upcoming['arrival'] <= current_time:
+            heapq.heappush(ready_queue, (key(upcoming), seq, upcoming))
+            seq += 1
+            upcoming = next(jobs, None)
+
+        _, _, current = heapq.heappop(ready_queue)
+        start_time = current_time
+        current_time += current['burst']
+        yield Segment(current['pid'], start_time, current_time)
+        yield _finish(current, current_time, stats)
+
+
+def stream_sjf(jobs, stats=None):
+    return _stream_dispatch(jobs, lambda p: p['burst'], stats)
+
+
+def stream_priority_scheduling(jobs, stats=None):
+    # Lower value = higher priority
+    return _stream_dispatch(jobs, lambda p: p['priority'], stats)
+
+
+def stream_round_robin(jobs, time_quantum, stats=None):
+    jobs = _in_arrival_order(jobs)
+    upcoming = next(jobs, None)
+    queue = deque()
+    time = 0
+
+    while upcoming is not None or queue:
+        if not queue and upcoming['arrival'] > time:
+            time = upcoming['arrival']
+
+        while upcoming is not None and upcoming['arrival'] <= time:
+            queue.append([upcoming, upcoming['burst']])
+            upcoming = next(jobs, None)
+
+        entry = queue.popleft()
+        p = entry[0]
+        run_time = min(time_quantum, entry[1])
+        start_time = time
+        time += run_time
+        entry[1] -= run_time
+        yield Segment(p['pid'], start_time, time)
+
+        # Arrivals during this quantum queue ahead of the preempted job
+        while upcoming is not None and upcoming['arrival'] <= time:
+            queue.append([upcoming, upcoming['burst']])
+            upcoming = next(jobs, None)
+
+        if entry[1] > 0:
+            queue.append(entry)
+        else:
+            yield _finish(p, time, stats)
+
+
+# Registry name -> generator, for callers that pick the algorithm by name
+STREAMS = {
+    'fcfs': stream_fcfs,
+    'sjf': stream_sjf,
+    'priority': stream_priority_scheduling,
+    'round_robin': stream_round_robin,
+}
+
+
+def split(events):
+    # Collect a finished stream back into the batch (results, timeline) shape
+    results = []
+    timeline = []
+    for event in events:
+        if type(event) is Result:
+            results.append(event)
+        else:
+            timeline.append(event)
+    return results, timeline
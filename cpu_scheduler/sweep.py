@@ -0,0 +1,137 @@
+import argparse
+import csv
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .cli import parse_switch_cost
+from .metrics import summarize
+from .registry import SCHEDULERS
+from .scheduler import Process
+from .traces import load_trace
+
+ALGORITHMS = list(SCHEDULERS)
+
+COLUMNS = ['algorithm', 'time_quantum', 'avg_waiting', 'avg_turnaround', 'avg_response', 'p95_waiting',
+           'p99_waiting', 'p99_response', 'throughput', 'cpu_utilization', 'effective_utilization',
+           'overhead_time', 'context_switches']
+
+# Trace shared by every task in a worker process, loaded once by _init_worker
+_trace = None
+
+
+def grid(algorithms, quanta, switch_cost=None):
+    configs = []
+    for name in algorithms:
+        if 'time_quantum' in SCHEDULERS[name].params:
+            configs.extend((name, q, switch_cost) for q in quanta)
+        else:
+            configs.append((name, None, switch_cost))
+    return configs
+
+
+def run_config(processes, name, time_quantum=None, switch_cost=None):
+    params = {'time_quantum': time_quantum} if time_quantum is not None else {}
+    if switch_cost:
+        params['switch_cost'] = switch_cost
+    result, timeline = SCHEDULERS[name].run(processes, **params)
+    summary = summarize(result, timeline)
+    row = {'algorithm': name, 'time_quantum': time_quantum}
+    row.update((column, summary[column]) for column in COLUMNS[2:])
+    return row
+
+
+def _share(processes):
+    # Lay the numeric columns out back to back in one shared block. Workers
+    # only need PID identity for the metrics, so PIDs become row numbers.
+    # Whole numbers stay exact as 'q'; one float in any column makes it 'd'.
+    fields = [[p.get(field, 0) for p in processes] for field in ('arrival', 'burst', 'priority')]
+    typecode = 'd' if any(isinstance(value, float) for values in fields for value in values) else 'q'
+    columns = array(typecode)
+    for values in fields:
+        columns.extend(values)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(columns) * columns.itemsize, 1))
+    shm.buf[:len(columns) * columns.itemsize] = columns.tobytes()
+    return shm, typecode
+
+
+def _init_worker(name, n, typecode):
+    global _trace
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[:3 * n * array(typecode).itemsize].cast(typecode)
+        arrival, burst, priority = view[:n].tolist(), view[n:2 * n].tolist(), view[2 * n:3 * n].tolist()
+        view.release()
+    finally:
+        shm.close()
+    _trace = [Process(i, arrival[i], burst[i], priority[i]) for i in range(n)]
+
+
+def _run_shared(config):
+    return run_config(_trace, *config)
+
+
+def sweep(processes, configs, max_workers=None):
+    if not processes:
+        return []
+
+    shm, typecode = _share(processes)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(shm.name, len(processes), typecode)) as pool:
+            # Keep the grid order in the output table
+            chunksize = max(1, len(configs) // ((max_workers or os.cpu_count() or 1) * 4))
+            return list(pool.map(_run_shared, configs, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _parse_quanta(text):
+    # "1:50" for an inclusive range, "2,4,8" for a list, "1:50:5" for a stepped range
+    try:
+        if ':' in text:
+            parts = [int(x) for x in text.split(':')]
+            start, stop = parts[0], parts[1]
+            step = parts[2] if len(parts) > 2 else 1
+            quanta = list(range(start, stop + 1, step))
+        else:
+            quanta = [int(x) for x in text.split(',')]
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"expected START:STOP[:STEP] or a comma-separated list, got {text}") from None
+    if not quanta:
+        raise argparse.ArgumentTypeError(f"{text} is an empty range")
+    # A quantum of zero or less never lets round robin finish
+    if min(quanta) <= 0:
+        raise argparse.ArgumentTypeError(f"quanta must be positive, got {text}")
+    return quanta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a grid of scheduling algorithms and parameters over one trace.")
+    parser.add_argument('trace', help="trace file: CSV with pid,arrival,burst[,priority] columns, Parquet, Arrow or .trace")
+    parser.add_argument('--algorithms', default='round_robin',
+                        help=f"comma-separated subset of: {', '.join(ALGORITHMS)}")
+    parser.add_argument('--quanta', type=_parse_quanta, default='1:20', help="RR time quanta, e.g. 1:100, 1:100:5 or 2,4,8")
+    parser.add_argument('--switch-cost', type=parse_switch_cost, metavar='DISPATCH[,WARMUP[,COLD_AFTER]]',
+                        help="context switch cost, so the best quantum accounts for switching overhead")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms.split(',')
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name!r}")
+
+    rows = sweep(load_trace(args.trace), grid(algorithms, args.quanta, args.switch_cost), args.workers)
+
+    writer = csv.DictWriter(sys.stdout, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import numpy as np
+
+from .scheduler import Result, Segment
+
+
+class ProcessTable:
+    # Columnar process storage: one NumPy array per field, PIDs interned to
+    # integer ids with the original labels kept in `labels`.
+    def __init__(self, pid, arrival, burst, priority=None, labels=None):
+        self.pid = np.asarray(pid, dtype=np.int64)
+        self.arrival = np.asarray(arrival)
+        self.burst = np.asarray(burst)
+        if priority is None:
+            priority = np.zeros(len(self.pid), dtype=np.int64)
+        self.priority = np.asarray(priority)
+        self.labels = list(labels) if labels is not None else list(range(len(self.pid)))
+
+    def __len__(self):
+        return len(self.pid)
+
+    @classmethod
+    def from_dicts(cls, processes):
+        ids = {}
+        pid = []
+        for p in processes:
+            pid.append(ids.setdefault(p['pid'], len(ids)))
+        return cls(
+            pid,
+            [p['arrival'] for p in processes],
+            [p['burst'] for p in processes],
+            [p.get('priority', 0) for p in processes],
+            labels=list(ids),
+        )
+
+    def to_dicts(self):
+        labels = self.labels
+        return [{
+            'pid': labels[pid],
+            'arrival': arrival,
+            'burst': burst,
+            'priority': priority
+        } for pid, arrival, burst, priority in zip(
+            self.pid.tolist(), self.arrival.tolist(), self.burst.tolist(), self.priority.tolist())]
+
+    def take(self, index):
+        return ProcessTable(self.pid[index], self.arrival[index], self.burst[index],
+                            self.priority[index], labels=self.labels)
+
+    def sorted_by_arrival(self):
+        # Traces are usually recorded in arrival order already; skip the sort then
+        if np.all(self.arrival[1:] >= self.arrival[:-1]):
+            return self
+        return self.take(np.argsort(self.arrival, kind='stable'))
+
+
+def vectorized_fcfs(table):
+    table = table.sorted_by_arrival()
+    burst = table.burst
+    # completion[i] = max over j <= i of (arrival[j] + burst[j] + ... + burst[i]),
+    # which is the running sum of bursts plus a cumulative-max scan. The clock
+    # starts at 0 as in scheduler.fcfs, so nothing runs before then.
+    work = np.cumsum(burst)
+    completion = work + np.maximum(np.maximum.accumulate(table.arrival - (work - burst)), 0)
+    turnaround = completion - table.arrival
+    return {
+        'pid': table.pid,
+        'arrival': table.arrival,
+        'burst': burst,
+        'priority': table.priority,
+        'start': completion - burst,
+        'completion': completion,
+        'turnaround': turnaround,
+        'waiting': turnaround - burst
+    }
+
+
+def fcfs_from_dicts(processes):
+    # Thin adapter: same (result, timeline) contract as scheduler.fcfs
+    table = ProcessTable.from_dicts(processes)
+    columns = vectorized_fcfs(table)
+    pid = [table.labels[i] for i in columns['pid'].tolist()]
+    arrival = columns['arrival'].tolist()
+    burst = columns['burst'].tolist()
+    start = columns['start'].tolist()
+    completion = columns['completion'].tolist()
+    turnaround = columns['turnaround'].tolist()
+    waiting = columns['waiting'].tolist()
+    priority = columns['priority'].tolist()
+
+    result = [Result(pid[i], arrival[i], burst[i], priority[i], completion[i], turnaround[i], waiting[i])
+              for i in range(len(pid))]
+    timeline = [Segment(pid[i], start[i], completion[i]) for i in range(len(pid))]
+
+    return result, timeline
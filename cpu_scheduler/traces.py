@@ -0,0 +1,241 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+
+from .scheduler import Process
+
+# Trace files: CSV (streamed in chunks), Parquet / Arrow IPC (needs pyarrow) and a
+# fixed-width binary format that can be memory-mapped.
+#
+# Binary layout, little endian:
+#   header  magic b'CPUTRACE', u32 version, u32 reserved, u64 count, u64 labels offset
+#   records count x (i64 pid id, i64 arrival, i64 burst, i64 priority)
+#   labels  JSON array mapping pid id -> original PID, at the labels offset
+
+MAGIC = b'CPUTRACE'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+RECORD = struct.Struct('<qqqq')
+CHUNK_SIZE = 65536
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def iter_csv(f):
+    # Processes from an open text file (or any iterable of lines) with a header row
+    # naming pid, arrival and burst columns; priority is optional
+    for row in csv.DictReader(f):
+        priority = row.get('priority')
+        yield Process(row['pid'], _number(row['arrival']), _number(row['burst']),
+                      _number(priority) if priority else 0)
+
+
+def iter_csv_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, newline='') as f:
+        chunk = []
+        for p in iter_csv(f):
+            chunk.append(p)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Reading Parquet or Arrow traces needs pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def _batches_to_chunks(batches):
+    for batch in batches:
+        columns = batch.to_pydict()
+        priority = columns.get('priority') or [0] * batch.num_rows
+        yield [Process(*row) for row in zip(columns['pid'], columns['arrival'], columns['burst'], priority)]
+
+
+def iter_parquet_chunks(path, chunk_size=CHUNK_SIZE):
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    names = [name for name in ('pid', 'arrival', 'burst', 'priority') if name in parquet.schema_arrow.names]
+    return _batches_to_chunks(parquet.iter_batches(batch_size=chunk_size, columns=names))
+
+
+def iter_arrow_chunks(path, chunk_size=CHUNK_SIZE):
+    pyarrow = _require_pyarrow()
+    import pyarrow.ipc
+
+    with pyarrow.memory_map(path) as source:
+        reader = pyarrow.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield from _batches_to_chunks([batch.slice(offset, chunk_size)])
+
+
+class BinaryTrace:
+    # Read-only view over a binary trace. Iterating yields Process records one at a
+    # time straight from the mapped pages; to_table() wraps the same pages in a
+    # ProcessTable without copying.
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self._labels_offset = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary trace")
+        if version != VERSION:
+            raise ValueError(f"{path} has trace format version {version}, expected {VERSION}")
+        self._labels = None
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def labels(self):
+        if self._labels is None:
+            self._labels = json.loads(self._mmap[self._labels_offset:].decode('utf-8'))
+        return self._labels
+
+    def records(self):
+        # Raw (pid id, arrival, burst, priority) tuples
+        end = HEADER.size + self.count * RECORD.size
+        return RECORD.iter_unpack(memoryview(self._mmap)[HEADER.size:end])
+
+    def __iter__(self):
+        labels = self.labels
+        for pid, arrival, burst, priority in self.records():
+            yield Process(labels[pid], arrival, burst, priority)
+
+    def to_table(self):
+        import numpy as np
+        from .table import ProcessTable
+
+        rows = np.frombuffer(self._mmap, dtype=np.dtype([
+            ('pid', '<i8'), ('arrival', '<i8'), ('burst', '<i8'), ('priority', '<i8')
+        ]), count=self.count, offset=HEADER.size)
+        return ProcessTable(rows['pid'], rows['arrival'], rows['burst'], rows['priority'], labels=self.labels)
+
+    def close(self):
+        # Tables from to_table() and unfinished iterations still point into the
+        # mapping; it then stays open until the garbage collector has reclaimed
+        # the last of them
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _whole(p, field):
+    value = p.get(field, 0)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if not isinstance(value, int):
+        raise ValueError(f"Process {p['pid']}: the binary trace format stores whole numbers, "
+                         f"got {field} {value!r}")
+    return value
+
+
+def write_binary(path, processes):
+    # Streams any iterable of processes; only the PID -> id map is kept in memory.
+    # Times and priorities must be whole numbers (2.0 is stored as 2). The file is
+    # written under a temporary name and renamed into place, so a bad row leaves
+    # neither a truncated trace nor a changed one at path.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        count = _write_binary(tmp, processes)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return count
+
+
+def _write_binary(path, processes):
+    ids = {}
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        buffer = bytearray()
+        for p in processes:
+            pid = ids.setdefault(p['pid'], len(ids))
+            try:
+                buffer += RECORD.pack(pid, p['arrival'], p['burst'], p.get('priority', 0))
+            except struct.error:
+                buffer += RECORD.pack(pid, _whole(p, 'arrival'), _whole(p, 'burst'), _whole(p, 'priority'))
+            count += 1
+            if len(buffer) >= CHUNK_SIZE * RECORD.size:
+                f.write(buffer)
+                buffer.clear()
+        f.write(buffer)
+
+        labels_offset = f.tell()
+        f.write(json.dumps(list(ids)).encode('utf-8'))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, labels_offset))
+    return count
+
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    if ext in ('.arrow', '.feather', '.ipc'):
+        return 'arrow'
+    if ext in ('.trace', '.bin'):
+        return 'binary'
+    return 'csv'
+
+
+def iter_trace(path, chunk_size=CHUNK_SIZE):
+    # Yields Process records one at a time whatever the file format
+    fmt = _format(path)
+    if fmt == 'binary':
+        with BinaryTrace(path) as trace:
+            yield from trace
+        return
+    chunks = {'csv': iter_csv_chunks, 'parquet': iter_parquet_chunks, 'arrow': iter_arrow_chunks}[fmt]
+    for chunk in chunks(path, chunk_size):
+        yield from chunk
+
+
+def load_trace(path):
+    return list(iter_trace(path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a CSV, Parquet or Arrow trace to the binary trace format.")
+    parser.add_argument('source')
+    parser.add_argument('destination', help="output path, conventionally ending in .trace")
+    args = parser.parse_args(argv)
+
+    try:
+        count = write_binary(args.destination, iter_trace(args.source))
+    except ValueError as e:
+        parser.error(str(e))
+    except KeyError as e:
+        parser.error(f"{args.source} has no {e} column")
+    print(f"Wrote {count} processes to {args.destination}")
+
+
+if __name__ == '__main__':
+    main()
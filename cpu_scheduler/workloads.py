@@ -0,0 +1,122 @@
+import random
+
+from .iosim import IOProcess
+from .scheduler import Process
+
+# Seeded synthetic workloads. Times are integers, like the traces entered in the GUI,
+# and arrival rates are chosen so the offered load stays just under one CPU.
+
+
+def poisson(n, mean_burst=8, load=0.9, seed=0):
+    # Exponential inter-arrival gaps with exponential bursts
+    rng = random.Random(seed)
+    mean_gap = mean_burst / load
+    processes = []
+    arrival = 0.0
+    for i in range(n):
+        arrival += rng.expovariate(1 / mean_gap)
+        processes.append(Process(f"P{i}", int(arrival), max(1, round(rng.expovariate(1 / mean_burst)))))
+    return processes
+
+
+def heavy_tailed(n, alpha=1.5, min_burst=2, load=0.9, seed=0):
+    # Poisson arrivals with Pareto bursts: mostly short jobs, a few huge ones
+    rng = random.Random(seed)
+    mean_burst = min_burst * alpha / (alpha - 1) if alpha > 1 else min_burst * 10
+    mean_gap = mean_burst / load
+    processes = []
+    arrival = 0.0
+    for i in range(n):
+        arrival += rng.expovariate(1 / mean_gap)
+        burst = int(min_burst * rng.paretovariate(alpha))
+        processes.append(Process(f"P{i}", int(arrival), min(burst, 10 ** 6)))
+    return processes
+
+
+def bursty(n, batch=50, mean_burst=8, load=0.9, seed=0):
+    # Jobs arrive in batches of up to `batch` at the same instant, then nothing
+    # for long enough to keep the average load at `load`
+    rng = random.Random(seed)
+    processes = []
+    arrival = 0
+    i = 0
+    while i < n:
+        size = min(n - i, rng.randint(1, batch))
+        work = 0
+        for _ in range(size):
+            burst = max(1, round(rng.expovariate(1 / mean_burst)))
+            processes.append(Process(f"P{i}", arrival, burst))
+            work += burst
+            i += 1
+        arrival += max(1, int(rng.expovariate(load / work)))
+    return processes
+
+
+def priority_mix(n, levels=32, mean_burst=8, load=0.9, seed=0):
+    # Poisson arrivals spread over many priority levels, skewed towards low priority
+    rng = random.Random(seed)
+    mean_gap = mean_burst / load
+    processes = []
+    arrival = 0.0
+    for i in range(n):
+        arrival += rng.expovariate(1 / mean_gap)
+        burst = max(1, round(rng.expovariate(1 / mean_burst)))
+        priority = min(levels - 1, int(rng.expovariate(4 / levels)))
+        processes.append(Process(f"P{i}", int(arrival), burst, levels - 1 - priority))
+    return processes
+
+
+def io_bound(n, mean_cpu=4, mean_io=5, mean_cpu_bursts=4, load=0.9, seed=0):
+    # Poisson arrivals of processes alternating CPU and I/O bursts on one device.
+    # Their burst is the total CPU time, so CPU-only schedulers run them as if the
+    # I/O took no time; simulate_io runs the full model.
+    rng = random.Random(seed)
+    mean_gap = mean_cpu * mean_cpu_bursts / load
+    processes = []
+    arrival = 0.0
+    for i in range(n):
+        arrival += rng.expovariate(1 / mean_gap)
+        count = 1 + int(rng.expovariate(1 / (mean_cpu_bursts - 1))) if mean_cpu_bursts > 1 else 1
+        bursts = []
+        for k in range(2 * count - 1):
+            mean = mean_io if k % 2 else mean_cpu
+            bursts.append(max(1, round(rng.expovariate(1 / mean))))
+        processes.append(IOProcess(f"P{i}", int(arrival), bursts))
+    return processes
+
+
+def job_classes(n, classes=(('web', 2, 0.6), ('api', 8, 0.3), ('batch', 40, 0.1)), load=0.9, seed=0):
+    # Poisson arrivals from a few job classes, each (name, mean burst, share of
+    # jobs) with lognormal bursts around its mean. PIDs are name-<n>, so burst
+    # predictors can learn per class.
+    rng = random.Random(seed)
+    names = [c[0] for c in classes]
+    weights = [c[2] for c in classes]
+    means = {c[0]: c[1] for c in classes}
+    mean_gap = sum(c[1] * c[2] for c in classes) / sum(weights) / load
+    processes = []
+    arrival = 0.0
+    for i in range(n):
+        arrival += rng.expovariate(1 / mean_gap)
+        name = rng.choices(names, weights)[0]
+        burst = max(1, round(rng.lognormvariate(0, 0.5) * means[name] / 1.133))  # e^(sigma^2/2) = 1.133
+        processes.append(Process(f"{name}-{i}", int(arrival), burst))
+    return processes
+
+
+WORKLOADS = {
+    'poisson': poisson,
+    'heavy_tailed': heavy_tailed,
+    'bursty': bursty,
+    'priority_mix': priority_mix,
+    'io_bound': io_bound,
+    'job_classes': job_classes,
+}
+
+
+def generate(name, n, seed=0):
+    try:
+        make = WORKLOADS[name]
+    except KeyError:
+        raise ValueError(f"Unknown workload {name!r}; expected one of {', '.join(WORKLOADS)}") from None
+    return make(n, seed=seed)
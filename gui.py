@@ -1,16 +1,16 @@
 import streamlit as st
-from scheduler import fcfs_scheduling, sjf_scheduling, priority_scheduling, round_robin
-from visualize import draw_gantt_chart
 
-class Process:
-    def __init__(self, pid, arrival, burst, priority=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.priority = priority
-        self.remaining_time = burst
-        self.waiting_time = 0
-        self.turnaround_time = 0
+from cpu_scheduler.cache import ResultCache
+from cpu_scheduler.metrics import summarize
+from cpu_scheduler.registry import SCHEDULERS
+from cpu_scheduler.scheduler import Process, to_dicts
+
+
+@st.cache_resource
+def result_cache():
+    # One cache per server process: Streamlit reruns the whole script on every
+    # widget change, and unchanged inputs then come straight from the cache
+    return ResultCache(maxsize=64)
 
 
 st.title("CPU Scheduler Simulator")
@@ -25,30 +25,48 @@ for i in range(num_processes):
         arrival = st.number_input(f"Arrival Time {i+1}", min_value=0, step=1, key=f"arrival_{i}")
         burst = st.number_input(f"Burst Time {i+1}", min_value=1, step=1, key=f"burst_{i}")
         priority = st.number_input(f"Priority {i+1} (Optional)", min_value=0, step=1, key=f"priority_{i}")
-        processes.append((pid, arrival, burst, priority))
+        processes.append(Process(pid or f"P{i+1}", arrival, burst, priority))
 
 # Scheduler Selection
-algorithm = st.selectbox("Select Scheduling Algorithm", ["FCFS", "SJF", "Priority", "Round Robin"])
+by_label = {scheduler.label: scheduler for scheduler in SCHEDULERS.values()}
+scheduler = by_label[st.selectbox("Select Scheduling Algorithm", list(by_label))]
 
-if algorithm == "Round Robin":
-    quantum = st.number_input("Enter Quantum Time", min_value=1, step=1)
+params = {}
+if 'time_quantum' in scheduler.params:
+    params['time_quantum'] = st.number_input("Enter Quantum Time", min_value=1, step=1)
+if 'quanta' in scheduler.params:
+    quanta_text = st.text_input("Level quanta (comma-separated)", "4,8,16")
+    try:
+        params['quanta'] = tuple(int(q) for q in quanta_text.split(","))
+    except ValueError:
+        st.error("Enter the level quanta as comma-separated integers, e.g. 4,8,16.")
+        st.stop()
+    if any(q <= 0 for q in params['quanta']):
+        st.error("Level quanta must be positive integers, e.g. 4,8,16.")
+        st.stop()
+    params['boost_interval'] = 10 * sum(params['quanta'])
 
 if st.button("Run Simulation"):
-    processes_obj = [Process(*p) for p in processes]
+    results, timeline = scheduler.run(processes, result_cache(), **params)
 
-    if algorithm == "FCFS":
-        scheduled = fcfs_scheduling(processes_obj)
-    elif algorithm == "SJF":
-        scheduled = sjf_scheduling(processes_obj)
-    elif algorithm == "Priority":
-        scheduled = priority_scheduling(processes_obj)
-    elif algorithm == "Round Robin":
-        scheduled = round_robin(processes_obj, quantum)
+    if results:
+        summary = summarize(results, timeline)
+        st.table(to_dicts(results))
 
-    print("Scheduled Processes:", scheduled)
+        columns = st.columns(5)
+        columns[0].metric("Avg Waiting", f"{summary['avg_waiting']:.2f}")
+        columns[1].metric("Avg Turnaround", f"{summary['avg_turnaround']:.2f}")
+        columns[2].metric("Avg Response", f"{summary['avg_response']:.2f}")
+        columns[3].metric("Throughput", f"{summary['throughput']:.3f}")
+        columns[4].metric("CPU Utilization", f"{summary['cpu_utilization']:.1%}")
 
-    if scheduled:
-        draw_gantt_chart(scheduled)
+        # Only load matplotlib when there is a chart to draw
+        import matplotlib.pyplot as plt
+        from cpu_scheduler.gantt import GanttChart
+
+        fig, ax = plt.subplots(figsize=(10, 2))
+        GanttChart(ax, timeline)
+        fig.tight_layout()
+        st.pyplot(fig)
     else:
         st.error("No processes were scheduled. Check your input data or scheduling function.")
-
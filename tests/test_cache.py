@@ -0,0 +1,85 @@
+from cpu_scheduler.cache import ResultCache, _source_hash, fingerprint
+from cpu_scheduler.scheduler import Process, fcfs, sjf
+from cpu_scheduler.smp import simulate_smp
+
+
+def workload(n=5):
+    return [Process(f"P{i}", i, i + 1) for i in range(n)]
+
+
+def test_hits_and_misses():
+    cache = ResultCache()
+    run = cache.wrap(fcfs)
+    first = run(workload())
+    second = run(workload())
+    assert first == second == fcfs(workload())
+    run(workload(6))
+    assert cache.info() == {'hits': 1, 'disk_hits': 0, 'misses': 2, 'bypassed': 0, 'size': 2, 'maxsize': 32}
+
+
+def test_hits_hand_out_fresh_containers():
+    run = ResultCache().wrap(fcfs)
+    results, timeline = run(workload())
+    results.clear()
+    assert len(run(workload())[0]) == 5
+
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    run = cache.wrap(fcfs)
+    run(workload(1))
+    run(workload(2))
+    run(workload(1))   # now the most recently used
+    run(workload(3))   # evicts workload(2)
+    assert cache.info()['size'] == 2
+    run(workload(1))
+    assert cache.info()['hits'] == 2
+    run(workload(2))
+    assert cache.info()['misses'] == 4
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    run = ResultCache(directory=tmp_path).wrap(sjf)
+    expected = run(workload())
+    assert len(list(tmp_path.glob('*.pickle'))) == 1
+
+    cache = ResultCache(directory=tmp_path)
+    assert cache.wrap(sjf)(workload()) == expected
+    assert cache.info()['disk_hits'] == 1 and cache.info()['misses'] == 0
+    cache.wrap(sjf)(workload())
+    assert cache.info()['hits'] == 1
+
+    cache.clear()
+    assert not list(tmp_path.glob('*.pickle'))
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    cache = ResultCache(directory=tmp_path)
+    run = cache.wrap(fcfs)
+    run(workload())
+    for path in tmp_path.glob('*.pickle'):
+        path.write_bytes(b'truncated')
+    fresh = ResultCache(directory=tmp_path)
+    assert fresh.wrap(fcfs)(workload()) == fcfs(workload())
+    assert fresh.info()['misses'] == 1
+
+
+def test_fingerprint_covers_every_field():
+    pinned = [{'pid': 'A', 'arrival': 0, 'burst': 4, 'cpu': 0}, {'pid': 'B', 'arrival': 0, 'burst': 4, 'cpu': 0}]
+    spread = [{'pid': 'A', 'arrival': 0, 'burst': 4, 'cpu': 0}, {'pid': 'B', 'arrival': 0, 'burst': 4, 'cpu': 1}]
+    assert fingerprint(pinned) != fingerprint(spread)
+    run = ResultCache().wrap(simulate_smp)
+    assert max(r['completion'] for r in run(pinned, 'fcfs', 2, 'affinity')[0]) == 8
+    assert max(r['completion'] for r in run(spread, 'fcfs', 2, 'affinity')[0]) == 4
+
+
+def test_fingerprint_ignores_record_type_and_arrival_order():
+    records = [Process('A', 3, 1), Process('B', 0, 2, 1)]
+    dicts = [{'pid': 'B', 'arrival': 0, 'burst': 2, 'priority': 1}, {'pid': 'A', 'arrival': 3, 'burst': 1}]
+    assert fingerprint(records) == fingerprint(dicts)
+
+
+def test_source_hash_covers_the_package():
+    # smp's engine lives in other modules of the package, so its key has to
+    # change when they do
+    assert _source_hash(simulate_smp) == _source_hash(fcfs)
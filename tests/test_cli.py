@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from cpu_scheduler.cli import main
+
+
+@pytest.mark.parametrize('algorithm, quantum', [('round_robin', '0'), ('round_robin', '-1'), ('mlfq', '0'),
+                                                ('mlfq', '4,0'), ('round_robin', 'x')])
+def test_bad_quantum_rejected(algorithm, quantum, capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(['-a', algorithm, '-q', quantum, '-n', '20'])
+    assert exit.value.code == 2
+    assert '--quantum' in capsys.readouterr().err
+
+
+def test_json_report(capsys):
+    assert main(['-a', 'round_robin', '-q', '4', '-n', '50', '-f', 'json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['summary']['processes'] == len(report['results']) == 50
+
+
+def test_batch_only_policy_on_several_cpus(capsys):
+    with pytest.raises(SystemExit):
+        main(['-a', 'mlfq', '--cpus', '2', '-n', '20'])
+    assert 'mlfq' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('devices', ['io=0', 'disk=2,net=-1', 'io=x'])
+def test_bad_device_count_rejected(devices, capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(['--io', '--devices', devices, '-n', '20'])
+    assert exit.value.code == 2
+    assert '--devices' in capsys.readouterr().err
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from cpu_scheduler import registry
+from cpu_scheduler.iosim import simulate_io
+from cpu_scheduler.online import OnlineScheduler, replay
+from cpu_scheduler.scheduler import Process, Result, Segment, _dispatch_order, _result
+from cpu_scheduler.smp import simulate_smp
+
+
+def longest_first(processes):
+    processes = sorted(processes, key=lambda p: p['arrival'])
+    results, timeline = [], []
+    for p, start in _dispatch_order(processes, lambda p: -p['burst']):
+        results.append(_result(p, start + p['burst']))
+        timeline.append(Segment(p['pid'], start, start + p['burst']))
+    return results, timeline
+
+
+@pytest.fixture
+def ljf():
+    # A policy registered after the engines were imported
+    scheduler = registry.register('ljf', longest_first, "LJF", key=lambda p, remaining: -p['burst'])
+    yield scheduler
+    del registry.SCHEDULERS['ljf']
+
+
+def random_processes(rng, n=30):
+    return [Process(f"P{i}", rng.randint(0, 60), rng.randint(1, 10), rng.randint(0, 4)) for i in range(n)]
+
+
+def completions(results):
+    return sorted((r['pid'], r['completion']) for r in results)
+
+
+def test_registered_policy_runs_everywhere(ljf):
+    assert 'ljf' in registry.event_driven()
+    rng = random.Random(0)
+    for _ in range(200):
+        processes = random_processes(rng)
+        expected = completions(longest_first(processes)[0])
+        assert completions(simulate_smp(processes, 'ljf', 1)[0]) == expected
+        assert completions(simulate_io(processes, 'ljf')[0]) == expected
+        online = [e for e in replay(OnlineScheduler('ljf'), processes) if type(e) is Result]
+        assert completions(online) == expected
+        results, timeline = simulate_smp(processes, 'ljf', 4, 'steal')
+        assert len(results) == len(processes) and {s.cpu for s in timeline} <= {0, 1, 2, 3}
+
+
+@pytest.mark.parametrize('name', registry.event_driven())
+def test_single_cpu_engines_match_batch(name):
+    rng = random.Random(name)
+    params = {'time_quantum': 3} if registry.SCHEDULERS[name].time_sliced else {}
+    for _ in range(200):
+        processes = random_processes(rng)
+        expected = completions(registry.run(name, processes, **params)[0])
+        assert completions(simulate_smp(processes, name, 1, time_quantum=params.get('time_quantum'))[0]) == expected
+        assert completions(simulate_io(processes, name, params.get('time_quantum'))[0]) == expected
+
+
+def test_batch_only_policy_rejected():
+    processes = [Process('A', 0, 1)]
+    with pytest.raises(ValueError, match='mlfq'):
+        simulate_smp(processes, 'mlfq', 2)
+    with pytest.raises(ValueError, match='mlfq'):
+        simulate_io(processes, 'mlfq')
+
+
+@pytest.mark.parametrize('count', [0, -1, 1.5])
+def test_device_without_servers_rejected(count):
+    with pytest.raises(ValueError, match='server'):
+        simulate_io([Process('A', 0, 1)], devices={'io': count})
@@ -0,0 +1,62 @@
+import pytest
+
+from cpu_scheduler.gantt import IDLE_COLOR, OVERHEAD_COLOR, PALETTE, assign_colors, level_of_detail, merge_segments
+from cpu_scheduler.scheduler import Segment
+from cpu_scheduler.smp import CpuSegment
+
+
+def test_merge_joins_back_to_back_segments():
+    timeline = [Segment('A', 0, 2), Segment('A', 2, 4), Segment('B', 4, 5), Segment('A', 5, 7), Segment('A', 7, 8)]
+    assert merge_segments(timeline) == {(0, 'A'): ([0, 5], [4, 8]), (0, 'B'): ([4], [5])}
+
+
+def test_merge_keeps_lanes_apart_and_sorts_them():
+    # SMP timelines are ordered per CPU only
+    timeline = [CpuSegment(1, 'A', 4, 6), CpuSegment(0, 'A', 0, 2), CpuSegment(0, 'A', 2, 3), CpuSegment(1, 'A', 1, 2)]
+    assert merge_segments(timeline) == {(1, 'A'): ([1, 4], [2, 6]), (0, 'A'): ([0], [3])}
+
+
+def test_level_of_detail_joins_sub_pixel_gaps():
+    starts, ends = [0, 2.1, 2.5, 10], [2, 2.4, 3, 12]
+    assert level_of_detail(starts, ends, 0.5) == [[0, 3], [10, 12]]
+    assert level_of_detail(starts, ends, 0.05) == [[0, 2], [2.1, 2.4], [2.5, 3], [10, 12]]
+    assert level_of_detail([], [], 1) == []
+
+
+def test_colors_wrap_around_the_palette():
+    pids = [f"P{i}" for i in range(len(PALETTE) + 2)]
+    colors = assign_colors(pids + pids)
+    assert [colors[pid] for pid in pids] == PALETTE + PALETTE[:2]
+
+
+def test_idle_and_overhead_keep_their_colors():
+    colors = assign_colors(['idle', 'A', 'overhead'])
+    assert colors['idle'] == IDLE_COLOR and colors['overhead'] == OVERHEAD_COLOR
+    assert colors['A'] in PALETTE
+
+
+def test_chart_rejects_an_empty_timeline():
+    pytest.importorskip('matplotlib')
+    from matplotlib.figure import Figure
+
+    from cpu_scheduler.gantt import GanttChart
+
+    with pytest.raises(ValueError, match='empty timeline'):
+        GanttChart(Figure().add_subplot(), [])
+
+
+@pytest.mark.parametrize('timeline, fps, duration, frames', [
+    # Capped at one frame per time unit of a short schedule
+    ([Segment('A', 0, 4), Segment('B', 4, 12)], 5, 10, 13),
+    # fps * duration for a long one
+    ([Segment('A', 0, 400), Segment('B', 400, 1000)], 4, 3, 12),
+])
+def test_save_animation_writes_a_gif(timeline, fps, duration, frames, tmp_path):
+    pytest.importorskip('matplotlib')
+    Image = pytest.importorskip('PIL.Image')
+    from cpu_scheduler.gantt import save_animation
+
+    path = str(tmp_path / 'schedule.gif')
+    assert save_animation(timeline, path, fps=fps, duration=duration, dpi=20) == frames
+    with Image.open(path) as gif:
+        assert gif.format == 'GIF' and gif.n_frames == frames
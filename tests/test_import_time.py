@@ -0,0 +1,25 @@
+import importlib.util
+import os
+
+import pytest
+
+# The budgets and the forbidden list live in benchmarks/import_time.py, which also
+# runs as a standalone report
+_path = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'import_time.py')
+_spec = importlib.util.spec_from_file_location('import_time', _path)
+import_time = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(import_time)
+
+
+@pytest.mark.parametrize('module', import_time.BUDGETS)
+def test_import_budget(module):
+    # Best of a few cold imports, so one slow run on a busy machine does not fail it
+    best = min(import_time.import_profile(module)[module] for _ in range(3))
+    assert best / 1000 <= import_time.BUDGETS[module], f"{module} took {best / 1000:.1f} ms"
+
+
+@pytest.mark.parametrize('module', import_time.BUDGETS)
+def test_no_gui_or_plotting_imports(module):
+    profile = import_time.import_profile(module)
+    leaked = sorted({name for name in profile if name.split('.')[0] in import_time.FORBIDDEN})
+    assert not leaked, f"{module} imports {', '.join(leaked)}"
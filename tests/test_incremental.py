@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from cpu_scheduler.scheduler import (IncrementalSimulation, Process, fcfs, mlfq, preemptive_sjf, priority_preemptive,
+                                     priority_scheduling, round_robin, sjf)
+
+
+def rr(time_quantum, merge_segments=False):
+    def run(processes):
+        summary, timeline = round_robin(processes, time_quantum, merge_segments)
+        return summary['processes'], timeline
+    return run
+
+
+# name -> (run, idle_segments)
+ALGORITHMS = {
+    'fcfs': (fcfs, False),
+    'sjf': (sjf, False),
+    'priority': (priority_scheduling, False),
+    'priority_aging': (lambda processes: priority_scheduling(processes, aging=5), False),
+    'srtf': (preemptive_sjf, True),
+    'priority_preemptive': (priority_preemptive, True),
+    'round_robin': (rr(3), False),
+    'round_robin_merged': (rr(2, True), False),
+    'mlfq': (lambda processes: mlfq(processes, (2, 4, None)), True),
+    'mlfq_boost': (lambda processes: mlfq(processes, (2, 4, 8), boost_interval=20), True),
+}
+
+
+@pytest.mark.parametrize('name', ALGORITHMS)
+def test_edits_match_full_rerun(name):
+    # Random add/delete sequences; after every edit the incremental schedule must
+    # equal a full re-run on the same process table
+    run, idle_segments = ALGORITHMS[name]
+    rng = random.Random(name)
+    for trial in range(100):
+        spread = rng.choice([5, 50, 300])
+        processes = [Process(f"P{i}", rng.randint(0, spread), rng.randint(1, 10), rng.randint(0, 5))
+                     for i in range(rng.randint(0, 25))]
+        simulation = IncrementalSimulation(run, processes, idle_segments)
+        next_id = len(processes)
+        for step in range(8):
+            if processes and rng.random() < 0.4:
+                p = rng.choice(processes)
+                processes.remove(p)
+                simulation.remove(p.pid)
+            else:
+                p = Process(f"P{next_id}", rng.randint(0, spread), rng.randint(1, 10), rng.randint(0, 5))
+                next_id += 1
+                processes.append(p)
+                simulation.add(p)
+            results, timeline = run(processes) if processes else ([], [])
+            assert list(simulation.results) == list(results), (trial, step)
+            assert list(simulation.timeline) == list(timeline), (trial, step)
+
+
+def test_add_resimulates_only_its_busy_period():
+    # Two busy periods far apart: an edit in the second leaves the first alone
+    processes = [Process(f"A{i}", i, 2) for i in range(10)] + [Process(f"B{i}", 1000 + i, 2) for i in range(10)]
+    simulation = IncrementalSimulation(preemptive_sjf, processes, True)
+    simulation.add(Process('X', 1005, 1))
+    assert simulation.resimulated <= 11
+    assert list(simulation.results) == list(preemptive_sjf(processes + [Process('X', 1005, 1)])[0])
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from cpu_scheduler.metrics import Histogram, MetricsCollector, summarize
+from cpu_scheduler.registry import run
+from cpu_scheduler.scheduler import Process
+from cpu_scheduler.streaming import stream_round_robin
+from cpu_scheduler.workloads import generate
+
+
+def test_histogram_quantiles():
+    rng = random.Random(0)
+    values = [rng.expovariate(0.01) for _ in range(20000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.add(value)
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        assert histogram.quantile(q) == pytest.approx(values[int(q * len(values)) - 1], rel=0.01)
+    # Small integers are exact
+    exact = Histogram()
+    for value in range(1, 101):
+        exact.add(value)
+    assert exact.quantile(0.5) == 50 and exact.quantile(0.99) == 99
+
+
+def test_summary_basics():
+    results, timeline = run('fcfs', [Process('A', 0, 4), Process('B', 10, 2)])
+    summary = summarize(results, timeline)
+    assert summary['processes'] == 2
+    assert summary['makespan'] == 12
+    assert summary['idle_time'] == 6
+    assert summary['cpu_utilization'] == pytest.approx(0.5)
+    assert summary['context_switches'] == 1
+
+
+def test_throughput_series():
+    processes = generate('poisson', 2000)
+    results, timeline = run('fcfs', processes)
+    summary = summarize(results, timeline, window=100)
+    series = summary['throughput_series']
+    # Consecutive windows covering every completion
+    assert [start for start, _ in series] == [pytest.approx(series[0][0] + 100 * i) for i in range(len(series))]
+    assert sum(rate for _, rate in series) * 100 == pytest.approx(2000)
+    assert max(rate for _, rate in series) <= summary['peak_throughput']
+
+
+def test_streaming_matches_batch():
+    processes = generate('poisson', 3000, seed=2)
+    collector = MetricsCollector(window=50)
+    events = list(collector.observe(stream_round_robin(processes, 4)))
+    batch = summarize(*run('round_robin', processes, time_quantum=4), window=50)
+    streamed = collector.summary()
+    assert len(events) > len(processes)
+    for name in ('processes', 'avg_waiting', 'avg_turnaround', 'avg_response', 'p95_waiting', 'context_switches',
+                 'peak_throughput', 'throughput_series'):
+        assert streamed[name] == pytest.approx(batch[name]), name
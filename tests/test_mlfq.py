@@ -0,0 +1,19 @@
+import pytest
+
+from cpu_scheduler.scheduler import Process, mlfq
+
+
+@pytest.mark.parametrize('quanta', [(), (4, 0), (0, None), (4, -1, 8), (None, 4), (4, 'x')])
+def test_bad_quanta_rejected(quanta):
+    with pytest.raises(ValueError):
+        mlfq([Process('A', 0, 5)], quanta)
+
+
+def test_bad_boost_interval_rejected():
+    with pytest.raises(ValueError):
+        mlfq([Process('A', 0, 5)], (4, 8), boost_interval=0)
+
+
+def test_last_level_may_run_to_completion():
+    results, timeline = mlfq([Process('A', 0, 10), Process('B', 0, 3)], (2, None))
+    assert sorted((r['pid'], r['completion']) for r in results) == [('A', 12), ('B', 13)]
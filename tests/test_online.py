@@ -0,0 +1,101 @@
+import copy
+import random
+
+import pytest
+
+from cpu_scheduler.online import OnlineScheduler, main, replay
+from cpu_scheduler.registry import SCHEDULERS, event_driven
+from cpu_scheduler.scheduler import Process, Result
+
+
+def batch(name, processes, time_quantum, aging):
+    params = {}
+    if 'time_quantum' in SCHEDULERS[name].params:
+        params['time_quantum'] = time_quantum
+    if aging:
+        params['aging'] = aging
+    results, timeline = SCHEDULERS[name].run(processes, **params)
+    return sorted(results, key=lambda r: r.pid), [s for s in timeline if s.pid != 'idle']
+
+
+def split(events):
+    events = list(events)
+    results = sorted((e for e in events if type(e) is Result), key=lambda r: r.pid)
+    return results, [e for e in events if type(e) is not Result]
+
+
+@pytest.mark.parametrize('name', event_driven())
+def test_replay_matches_batch(name):
+    # Jobs fed one at a time, with ticks in between and queries at random points,
+    # give the batch schedule; ETAs match what happens when no more jobs arrive
+    rng = random.Random(name)
+    for trial in range(1500):
+        processes = [Process(f"P{i}", rng.randint(0, 40), rng.randint(1, 10), rng.randint(0, 3))
+                     for i in range(rng.randint(1, 20))]
+        time_quantum = rng.randint(1, 5)
+        aging = rng.choice([None, 5]) if 'aging' in SCHEDULERS[name].params else None
+        engine = OnlineScheduler(name, time_quantum, aging)
+        events = []
+        for job in sorted(processes, key=lambda p: p.arrival):
+            if rng.random() < 0.5 and job.arrival > engine.clock:
+                events += engine.tick(rng.uniform(engine.clock, job.arrival))
+            if rng.random() < 0.3 and engine.busy:
+                etas = engine.etas()
+                queue = [p['pid'] for p in engine.ready_queue()]
+                drained = copy.deepcopy(engine).drain()
+                completions = {r.pid: r.completion for r in drained if type(r) is Result}
+                assert completions.keys() == etas.keys(), trial
+                for pid, completion in completions.items():
+                    assert etas[pid] == pytest.approx(completion), (trial, pid)
+                assert set(queue) <= set(etas)
+            events += engine.submit(job)
+        events += engine.drain()
+        assert split(events) == batch(name, processes, time_quantum, aging), trial
+
+
+@pytest.mark.parametrize('name', event_driven())
+def test_replay_generator(name):
+    processes = [Process(f"P{i}", i * 2, 3 + i % 4, i % 3) for i in range(30)]
+    engine = OnlineScheduler(name, 2)
+    assert split(replay(engine, processes)) == batch(name, processes, 2, None)
+
+
+def test_queries_do_not_commit_the_dispatch():
+    # Looking at the queue must not change the schedule: short still runs first
+    for look in (False, True):
+        engine = OnlineScheduler('sjf')
+        engine.submit(Process('long', 0, 10))
+        if look:
+            assert engine.etas() == {'long': 10}
+            assert engine.ready_queue() == []
+        engine.submit(Process('short', 0, 1))
+        results, _ = split(engine.drain())
+        assert {r.pid: r.completion for r in results} == {'short': 1, 'long': 11}
+
+
+def test_rejects_jobs_from_the_past():
+    engine = OnlineScheduler('fcfs')
+    engine.submit(Process('A', 5, 1))
+    with pytest.raises(ValueError):
+        engine.submit(Process('B', 4, 1))
+    with pytest.raises(ValueError):
+        engine.tick(3)
+
+
+def test_batch_only_policy_rejected():
+    with pytest.raises(ValueError):
+        OnlineScheduler('mlfq')
+
+
+@pytest.mark.parametrize('quantum', [None, 0, -2])
+def test_non_positive_quantum_rejected(quantum):
+    with pytest.raises(ValueError, match='time_quantum'):
+        OnlineScheduler('round_robin', quantum)
+
+
+@pytest.mark.parametrize('quantum', ['0', '-1', 'x'])
+def test_cli_rejects_non_positive_quantum(quantum, capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(['trace.csv', '-a', 'round_robin', '-q', quantum])
+    assert exit.value.code == 2
+    assert '--quantum' in capsys.readouterr().err
@@ -0,0 +1,73 @@
+import pytest
+
+from cpu_scheduler import registry
+from cpu_scheduler.cache import ResultCache
+from cpu_scheduler.metrics import summarize
+from cpu_scheduler.prediction import ClassHistory, ExponentialAverage, make_predictor, pid_class, prediction_report
+from cpu_scheduler.scheduler import Process, SwitchCost
+from cpu_scheduler.workloads import job_classes
+
+
+def test_pid_class():
+    assert pid_class({'pid': 'web-12'}) == 'web'
+    assert pid_class({'pid': 'P7'}) == 'P'
+    assert pid_class({'pid': '42'}) == '42'
+
+
+def test_exponential_average():
+    predictor = ExponentialAverage(alpha=0.5, initial=10)
+    job = Process('web-1', 0, 4)
+    assert predictor.predict(job) == 10
+    predictor.update(job, 4)
+    assert predictor.predict(Process('web-2', 0, 0)) == 7
+    predictor.update(job, 1)
+    assert predictor.predict(job) == 4
+    # An unseen class falls back to the average over every class
+    assert predictor.predict(Process('api-1', 0, 0)) == 4
+    with pytest.raises(ValueError):
+        ExponentialAverage(alpha=2)
+
+
+def test_class_history_window():
+    predictor = ClassHistory(size=2, initial=5)
+    job = Process('db-1', 0, 0)
+    for burst in (10, 2, 4):
+        predictor.update(job, burst)
+    assert predictor.predict(job) == 3
+
+
+def test_regression_matches_vectorized():
+    pytest.importorskip('numpy')
+    processes = job_classes(500, seed=3)
+    predictor = make_predictor('regression', refit_every=7).fit(processes[:300])
+    for p in processes[300:400]:
+        predictor.update(p, p['burst'])
+    batch = predictor.predict_many(processes[400:])
+    assert list(batch) == pytest.approx([predictor.predict(p) for p in processes[400:]])
+
+
+@pytest.mark.parametrize('algorithm', ['sjf', 'srtf'])
+def test_predicted_schedule_between_oracle_and_fcfs(algorithm):
+    report = prediction_report(job_classes(3000, seed=1), algorithm, ExponentialAverage())
+    assert report['error']['predicted'] == 3000
+    waiting = report['avg_waiting']
+    assert waiting['oracle'] <= waiting['predicted'] < waiting['fcfs']
+
+
+def test_cache_bypassed_for_predictors():
+    # A predictor reprs as its address, so a cached lookup could hand back another
+    # predictor's schedule; such calls must run every time
+    processes = job_classes(2000)
+    cache = ResultCache()
+    runs = {}
+    for alpha in (0.05, 0.95, 0.05, 0.95):
+        results, timeline = registry.run('sjf', processes, cache, predictor=ExponentialAverage(alpha=alpha))
+        runs.setdefault(alpha, []).append(summarize(results, timeline)['avg_waiting'])
+    assert runs[0.05][0] == runs[0.05][1] != runs[0.95][0] == runs[0.95][1]
+    assert cache.info()['hits'] == 0 and cache.info()['bypassed'] == 4
+
+    # Value-like arguments still hit, plain functions bypass
+    registry.run('sjf', processes, cache, switch_cost=SwitchCost(1, 2))
+    registry.run('sjf', processes, cache, switch_cost=SwitchCost(1, 2))
+    registry.run('sjf', processes, cache, switch_cost=lambda off_cpu: 1)
+    assert cache.info()['hits'] == 1 and cache.info()['bypassed'] == 5
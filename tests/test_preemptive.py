@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from cpu_scheduler.scheduler import Process, preemptive_sjf, priority_preemptive
+
+
+def unit_step(processes, key):
+    # Reference: the original SRTF loop, which advances one time unit at a time and
+    # runs the ready job with the smallest key, ties to the earliest arrival
+    processes = sorted(processes, key=lambda p: p.arrival)
+    remaining = {p.pid: p.burst for p in processes}
+    completion = {}
+    timeline = []
+    time = 0
+    while len(completion) < len(processes):
+        ready = [p for p in processes if p.arrival <= time and remaining[p.pid] > 0]
+        pid = min(ready, key=lambda p: key(p, remaining[p.pid])).pid if ready else 'idle'
+        if timeline and timeline[-1][0] == pid:
+            timeline[-1][2] = time + 1
+        else:
+            timeline.append([pid, time, time + 1])
+        time += 1
+        if pid != 'idle':
+            remaining[pid] -= 1
+            if not remaining[pid]:
+                completion[pid] = time
+    results = [(p.pid, completion[p.pid], completion[p.pid] - p.arrival, completion[p.pid] - p.arrival - p.burst)
+               for p in processes]
+    return results, [tuple(s) for s in timeline]
+
+
+def random_processes(rng):
+    return [Process(f"P{i}", rng.randint(0, 15), rng.randint(1, 7), rng.randint(0, 3))
+            for i in range(rng.randint(1, 8))]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_srtf_matches_unit_step(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        processes = random_processes(rng)
+        results, timeline = preemptive_sjf(processes)
+        expected_results, expected_timeline = unit_step(processes, lambda p, remaining: remaining)
+        assert [(r.pid, r.completion, r.turnaround, r.waiting) for r in results] == expected_results, processes
+        assert [(s.pid, s.start, s.end) for s in timeline] == expected_timeline, processes
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_priority_preemptive_matches_unit_step(seed):
+    rng = random.Random(100 + seed)
+    for _ in range(500):
+        processes = random_processes(rng)
+        results, timeline = priority_preemptive(processes)
+        expected_results, expected_timeline = unit_step(processes, lambda p, remaining: p.priority)
+        assert [(r.pid, r.completion, r.turnaround, r.waiting) for r in results] == expected_results, processes
+        assert [(s.pid, s.start, s.end) for s in timeline] == expected_timeline, processes
+
+
+def test_input_not_mutated():
+    processes = [{'pid': 'A', 'arrival': 0, 'burst': 4}, {'pid': 'B', 'arrival': 1, 'burst': 1}]
+    before = [dict(p) for p in processes]
+    preemptive_sjf(processes)
+    assert processes == before
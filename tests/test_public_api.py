@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+import cpu_scheduler
+from cpu_scheduler import scheduler
+
+# The public scheduler API. Adding a name here is a deliberate API change;
+# removing one breaks callers.
+PUBLIC = {
+    'Process', 'Result', 'Segment', 'SwitchCost', 'OVERHEAD', 'to_dicts',
+    'fcfs', 'round_robin', 'sjf', 'priority_scheduling',
+    'preemptive_sjf', 'priority_preemptive', 'mlfq', 'IncrementalSimulation',
+}
+
+
+def test_scheduler_all():
+    assert set(scheduler.__all__) == PUBLIC
+    assert len(scheduler.__all__) == len(PUBLIC)
+
+
+def test_names_exist():
+    for name in scheduler.__all__:
+        assert hasattr(scheduler, name), name
+
+
+def test_package_reexports():
+    assert set(cpu_scheduler.__all__) == PUBLIC
+    for name in PUBLIC:
+        assert getattr(cpu_scheduler, name) is getattr(scheduler, name), name
+
+
+def test_star_import():
+    namespace = {}
+    exec('from cpu_scheduler import *', namespace)
+    assert set(namespace) - {'__builtins__'} == PUBLIC
+
+
+def test_no_private_exports():
+    assert not [name for name in scheduler.__all__ if name.startswith('_')]
+
+
+def test_schedulers_return_results_and_timeline():
+    processes = [scheduler.Process('A', 0, 5, 2), scheduler.Process('B', 1, 3, 1), scheduler.Process('C', 2, 1, 3)]
+    for func in (scheduler.fcfs, scheduler.sjf, scheduler.priority_scheduling, scheduler.preemptive_sjf,
+                 scheduler.priority_preemptive, scheduler.mlfq):
+        results, timeline = func(processes)
+        assert sorted(r.pid for r in results) == ['A', 'B', 'C'], func.__name__
+        assert all(r.turnaround == r.completion - r.arrival for r in results), func.__name__
+        assert all(r.waiting == r.turnaround - r.burst for r in results), func.__name__
+        assert sum(s.end - s.start for s in timeline if s.pid != 'idle') == 9, func.__name__
+    summary, timeline = scheduler.round_robin(processes, 2)
+    assert sorted(r['pid'] for r in summary['processes']) == ['A', 'B', 'C']
+
+
+def test_priority_preemptive_preempts():
+    results, timeline = scheduler.priority_preemptive([
+        scheduler.Process('A', 0, 5, 3), scheduler.Process('B', 1, 2, 1), scheduler.Process('C', 10, 1, 0)])
+    assert [(s.pid, s.start, s.end) for s in timeline] == [
+        ('A', 0, 1), ('B', 1, 3), ('A', 3, 7), ('idle', 7, 10), ('C', 10, 11)]
+    assert {r.pid: r.completion for r in results} == {'A': 7, 'B': 3, 'C': 11}
+
+
+def test_records_behave_like_the_dict_rows():
+    p = scheduler.Process('A', 0, 3)
+    assert p['burst'] == p.burst == 3 and p.get('cpu') is None
+    assert p.to_dict() == {'pid': 'A', 'arrival': 0, 'burst': 3, 'priority': 0}
+    assert p == scheduler.Process('A', 0, 3) and p != scheduler.Process('A', 0, 4)
+    assert pickle.loads(pickle.dumps(p)) == p
+    # Equal records may be mutated, so like dicts they cannot be hashed
+    with pytest.raises(TypeError):
+        hash(p)
@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+
+from cpu_scheduler import service as service_module
+from cpu_scheduler.registry import get_scheduler
+from cpu_scheduler.scheduler import Process
+from cpu_scheduler.service import (HTTPError, SimulationService, _columns, _job_params, _processes, _run_job,
+                                   _stream_job, request)
+from cpu_scheduler.workloads import generate
+
+PROCESSES = [{'pid': 'A', 'arrival': 0, 'burst': 5}, {'pid': 'B', 'arrival': 1, 'burst': 3, 'priority': 1}]
+
+
+@pytest.mark.parametrize('algorithm, params', [
+    ('round_robin', {}),
+    ('round_robin', {'time_quantum': -1}),
+    ('round_robin', {'time_quantum': 0}),
+    ('round_robin', {'time_quantum': '2'}),
+    ('round_robin', {'time_quantum': True}),
+    ('priority', {'aging': 0}),
+    ('mlfq', {'quanta': [4, 0]}),
+    ('mlfq', {'quanta': 4}),
+    ('fcfs', {'switch_cost': [1, -2]}),
+    ('fcfs', {'switch_cost': {'bogus': 1}}),
+    ('fcfs', {'switch_cost': 'a'}),
+    ('fcfs', {'time_quantum': 2}),
+    ('sjf', {'predictor': 'nope'}),
+    ('sjf', {'predictor': {'name': 'ewma', 'bogus': 1}}),
+    ('sjf', {'predictor': {'name': 'ewma', 'alpha': '0.3'}}),
+    ('sjf', {'predictor': {'name': 'history', 'size': 0}}),
+    ('sjf', {'predictor': {'name': 'ewma', 'key': 'pid'}}),
+])
+def test_bad_params_rejected(algorithm, params):
+    # Caught before queuing: these used to fail in, or hang, a pool worker
+    with pytest.raises(HTTPError) as error:
+        _job_params(get_scheduler(algorithm), params)
+    assert error.value.status == 400
+
+
+def test_params_converted():
+    assert _job_params(get_scheduler('round_robin'), {'time_quantum': 2.5}) == {'time_quantum': 2.5}
+    assert _job_params(get_scheduler('mlfq'), {'quanta': [2, 4, None]}) == {'quanta': (2, 4, None)}
+    params = _job_params(get_scheduler('sjf'), {'switch_cost': [1, 2], 'predictor': {'name': 'ewma', 'alpha': 0.3}})
+    assert params['predictor'] == (('alpha', 0.3), ('name', 'ewma'))
+    assert (params['switch_cost'].dispatch, params['switch_cost'].warmup) == (1, 2)
+
+
+@pytest.mark.parametrize('row', [{'pid': 'A', 'arrival': 0, 'burst': '3'}, {'pid': 'A', 'arrival': 0, 'burst': -1},
+                                 {'pid': 'A', 'arrival': None, 'burst': 1}, {'pid': 'A', 'burst': 1}])
+def test_bad_processes_rejected(row):
+    with pytest.raises(HTTPError):
+        _processes([row])
+
+
+def test_jobs_end_to_end():
+    async def scenario():
+        service = SimulationService(workers=1)
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            job = {'processes': PROCESSES, 'algorithm': 'round_robin', 'params': {'time_quantum': 2}, 'timeline': True}
+            status, body = await request(reader, writer, 'POST', '/jobs', json.dumps(job).encode('utf-8'))
+            lines = [json.loads(line) for line in body.splitlines()]
+            bad = dict(job, params={'time_quantum': -1})
+            bad_status, _ = await request(reader, writer, 'POST', '/jobs', json.dumps(bad).encode('utf-8'))
+            again, _ = await request(reader, writer, 'POST', '/jobs', json.dumps(job).encode('utf-8'))
+            writer.close()
+            return status, lines, bad_status, again, service.stats()
+        finally:
+            server.close()
+            service.close()
+
+    status, lines, bad_status, again, stats = asyncio.run(scenario())
+    assert status == 200 and again == 200 and bad_status == 400
+    assert sorted(r['pid'] for r in lines[0]['results']) == ['A', 'B']
+    assert 'timeline' in lines[1]
+    assert lines[-1]['summary']['processes'] == 2
+    assert stats['runs'] == 1 and stats['cache']['hits'] == 1
+
+
+def decode(lines):
+    decoded = {'results': [], 'timeline': [], 'summary': []}
+    for line in lines:
+        for name, value in json.loads(line).items():
+            decoded[name].extend(value if name != 'summary' else [value])
+    return decoded
+
+
+@pytest.mark.parametrize('algorithm, params', [('fcfs', {}), ('sjf', {}), ('priority', {}),
+                                               ('round_robin', {'time_quantum': 3})])
+def test_streamed_job_matches_batch(algorithm, params, monkeypatch):
+    monkeypatch.setattr(service_module, 'BATCH_SIZE', 7)
+    columns = _columns(generate('priority_mix', 200, seed=3))
+    streamed = []
+    _stream_job(columns, algorithm, params, True, streamed.append)
+    batch = decode(_run_job(columns, algorithm, params, True))
+    streamed = decode(streamed)
+    key = lambda r: r['pid']
+    assert sorted(streamed['results'], key=key) == sorted(batch['results'], key=key)
+    busy = lambda timeline: sum(s['end'] - s['start'] for s in timeline if s['pid'] != 'idle')
+    assert busy(streamed['timeline']) == busy(batch['timeline'])
+    assert streamed['summary'] == batch['summary']
+
+
+def test_stream_sends_lines_before_the_run_ends(monkeypatch):
+    monkeypatch.setattr(service_module, 'BATCH_SIZE', 10)
+    columns = _columns([Process(f"P{i}", i, 1) for i in range(1000)])
+    sent = []
+
+    def emit(line):
+        sent.append(line)
+        raise RuntimeError("client gone")
+
+    with pytest.raises(RuntimeError):
+        _stream_job(columns, 'fcfs', {}, False, emit)
+    assert len(json.loads(sent[0])['results']) == 10
+
+
+def test_identical_streamed_jobs_share_a_run():
+    async def scenario():
+        service = SimulationService(workers=2)
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        job = json.dumps({'processes': [{'pid': f"P{i}", 'arrival': i, 'burst': 2}
+                                                          for i in range(5000)],
+                          'algorithm': 'sjf'}).encode('utf-8')
+
+        async def client():
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                return await request(reader, writer, 'POST', '/jobs', job)
+            finally:
+                writer.close()
+
+        try:
+            responses = await asyncio.gather(*(client() for _ in range(4)))
+            return responses, service.stats()
+        finally:
+            server.close()
+            service.close()
+
+    responses, stats = asyncio.run(scenario())
+    assert {status for status, _ in responses} == {200}
+    assert len({body for _, body in responses}) == 1
+    assert stats['runs'] + stats['cache']['hits'] + stats['coalesced'] == 4
+    assert stats['runs'] == 1
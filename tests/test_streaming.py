@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from cpu_scheduler import registry
+from cpu_scheduler.metrics import MetricsCollector, summarize
+from cpu_scheduler.scheduler import Process
+from cpu_scheduler.streaming import STREAMS, RunningStats, split
+
+
+def random_processes(rng, n=60):
+    # Whole and fractional times, ties on arrival, burst and priority
+    processes = [Process(f"P{i}", rng.choice([rng.randint(0, 80), rng.randint(0, 160) / 4]),
+                         rng.choice([rng.randint(1, 9), rng.randint(1, 36) / 4]), rng.randint(0, 3))
+                 for i in range(n)]
+    return sorted(processes, key=lambda p: p.arrival)
+
+
+@pytest.mark.parametrize('name', sorted(STREAMS))
+def test_stream_matches_batch(name):
+    rng = random.Random(name)
+    params = {'time_quantum': 2} if registry.SCHEDULERS[name].time_sliced else {}
+    for _ in range(100):
+        processes = random_processes(rng)
+        stats = RunningStats()
+        results, timeline = split(STREAMS[name](iter(processes), stats=stats, **params))
+        expected, expected_timeline = registry.run(name, processes, **params)
+        assert sorted(results, key=lambda r: r.pid) == sorted(expected, key=lambda r: r.pid)
+        assert timeline == [s for s in expected_timeline if s.pid != 'idle']
+        assert stats.count == len(processes)
+        assert stats.avg_waiting == pytest.approx(sum(r.waiting for r in expected) / len(expected))
+
+
+@pytest.mark.parametrize('name', sorted(STREAMS))
+def test_collector_over_a_stream_matches_summarize(name):
+    params = {'time_quantum': 3} if registry.SCHEDULERS[name].time_sliced else {}
+    processes = random_processes(random.Random(7), 300)
+    expected = summarize(*registry.run(name, processes, **params), window=10)
+    collector = MetricsCollector(window=10)
+    for _ in collector.observe(STREAMS[name](processes, **params)):
+        pass
+    assert collector.summary() == pytest.approx(expected)
+
+
+def test_out_of_order_stream_rejected():
+    with pytest.raises(ValueError, match='arrival order'):
+        list(STREAMS['fcfs']([Process('A', 5, 1), Process('B', 2, 1)]))
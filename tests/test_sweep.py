@@ -0,0 +1,40 @@
+import argparse
+
+import pytest
+
+from cpu_scheduler.scheduler import Process, SwitchCost
+from cpu_scheduler.sweep import _parse_quanta, grid, run_config, sweep
+from cpu_scheduler.workloads import generate
+
+
+def test_parse_quanta():
+    assert _parse_quanta('1:5') == [1, 2, 3, 4, 5]
+    assert _parse_quanta('2:10:4') == [2, 6, 10]
+    assert _parse_quanta('2,4,8') == [2, 4, 8]
+
+
+@pytest.mark.parametrize('text', ['0:5', '-2,4', '0', '5:1', '1:4:0', 'a', '3:'])
+def test_bad_quanta_rejected(text):
+    # A zero quantum used to hang the pool worker that drew it
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_quanta(text)
+
+
+def test_grid_rows():
+    processes = generate('poisson', 200)
+    configs = grid(['fcfs', 'round_robin'], [2, 4])
+    assert [config[:2] for config in configs] == [('fcfs', None), ('round_robin', 2), ('round_robin', 4)]
+    rows = [run_config(processes, *config) for config in configs]
+    assert [row['time_quantum'] for row in rows] == [None, 2, 4]
+    assert all(row['avg_turnaround'] >= row['avg_waiting'] for row in rows)
+
+
+@pytest.mark.parametrize('processes', [
+    generate('priority_mix', 300, seed=5),
+    # Float priorities only: the shared block has to hold them as doubles
+    [Process(f"P{i}", i // 3, 1 + i % 4, (i * 7 % 5) / 2) for i in range(60)],
+    [Process(f"P{i}", i * 0.5, 1.25, i % 3) for i in range(60)],
+])
+def test_sweep_matches_serial_runs(processes):
+    configs = grid(['fcfs', 'sjf', 'priority', 'round_robin', 'srtf'], [1, 3]) + grid(['round_robin'], [2], SwitchCost(1))
+    assert sweep(processes, configs, max_workers=2) == [run_config(processes, *config) for config in configs]
@@ -0,0 +1,48 @@
+import pytest
+
+from cpu_scheduler.metrics import summarize
+from cpu_scheduler.scheduler import OVERHEAD, Process, Segment, SwitchCost, fcfs, round_robin
+
+
+def test_warmup_scales_with_time_off_cpu():
+    cost = SwitchCost(dispatch=1, warmup=4, cold_after=8)
+    assert [cost(off_cpu) for off_cpu in (0, 2, 4, 8, 100, float('inf'))] == [1, 2, 3, 5, 5, 5]
+    # Without cold_after every switch pays the full warmup
+    assert SwitchCost(1, 4)(0) == 5
+
+
+def test_round_robin_timeline():
+    # Hand-computed: each first dispatch is cold (1 + 4). At t=14 A has been off
+    # the CPU since 7, so it pays 1 + 4 * 7/8; B comes back at 20.5 after 6.5 off.
+    cost = SwitchCost(dispatch=1, warmup=4, cold_after=8)
+    report, timeline = round_robin([Process('A', 0, 4), Process('B', 0, 3)], 2, switch_cost=cost)
+    assert timeline == [
+        Segment(OVERHEAD, 0, 5), Segment('A', 5, 7),
+        Segment(OVERHEAD, 7, 12), Segment('B', 12, 14),
+        Segment(OVERHEAD, 14, 18.5), Segment('A', 18.5, 20.5),
+        Segment(OVERHEAD, 20.5, 24.75), Segment('B', 24.75, 25.75),
+    ]
+    # Overhead counts toward turnaround and waiting
+    assert [(r.pid, r.completion, r.turnaround, r.waiting) for r in report['processes']] == [
+        ('A', 20.5, 20.5, 16.5), ('B', 25.75, 25.75, 22.75)]
+
+
+def test_resuming_the_same_process_is_free():
+    report, timeline = round_robin([Process('A', 0, 5)], 2, switch_cost=SwitchCost(1, 2))
+    assert timeline == [Segment(OVERHEAD, 0, 3), Segment('A', 3, 5), Segment('A', 5, 7), Segment('A', 7, 8)]
+    assert report['processes'][0].completion == 8
+
+
+def test_fcfs_pays_after_an_idle_gap():
+    results, timeline = fcfs([Process('A', 0, 2), Process('B', 10, 1)], switch_cost=1)
+    assert timeline == [Segment(OVERHEAD, 0, 1), Segment('A', 1, 3), Segment(OVERHEAD, 10, 11), Segment('B', 11, 12)]
+    assert [(r.pid, r.turnaround, r.waiting) for r in results] == [('A', 3, 1), ('B', 2, 1)]
+
+
+def test_summary_splits_overhead_from_useful_work():
+    report, timeline = round_robin([Process('A', 0, 4), Process('B', 0, 3)], 2,
+                                   switch_cost=SwitchCost(1, 4, 8))
+    summary = summarize(report['processes'], timeline)
+    assert summary['overhead_time'] == 5 + 5 + 4.5 + 4.25
+    assert summary['effective_utilization'] == pytest.approx(7 / 25.75)
+    assert summary['cpu_utilization'] == pytest.approx(1.0)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from cpu_scheduler.scheduler import Process, fcfs
+
+np = pytest.importorskip('numpy')
+
+from cpu_scheduler.table import ProcessTable, fcfs_from_dicts, vectorized_fcfs  # noqa: E402
+
+
+def test_idle_gaps_and_equal_arrivals():
+    processes = [Process('A', 0, 3), Process('B', 0, 2), Process('C', 10, 1), Process('D', 10, 4),
+                 Process('E', 11, 1), Process('F', 30, 2)]
+    assert fcfs_from_dicts(processes) == fcfs(processes)
+    columns = vectorized_fcfs(ProcessTable.from_dicts(processes))
+    assert columns['start'].tolist() == [0, 3, 10, 11, 15, 30]
+
+
+def test_unsorted_input_keeps_arrival_ties_in_input_order():
+    processes = [Process('C', 4, 1), Process('A', 0, 2), Process('B', 0, 1), Process('D', 4, 3)]
+    assert fcfs_from_dicts(processes) == fcfs(processes)
+
+
+def test_clock_starts_at_zero():
+    processes = [Process('A', -5, 2), Process('B', -1, 1), Process('C', 6, 1)]
+    assert fcfs_from_dicts(processes) == fcfs(processes)
+
+
+def test_random_workloads():
+    rng = random.Random(4)
+    for _ in range(200):
+        processes = [Process(f"P{i}", rng.randint(0, 50), rng.randint(1, 6), rng.randint(0, 3)) for i in range(40)]
+        assert fcfs_from_dicts(processes) == fcfs(processes)
+        # Quarter units stay exact in floating point, so results match exactly too
+        processes = [Process(p.pid, p.arrival / 4, p.burst / 4) for p in processes]
+        assert fcfs_from_dicts(processes) == fcfs(processes)
+
+
+def test_empty_table():
+    assert fcfs_from_dicts([]) == ([], [])
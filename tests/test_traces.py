@@ -0,0 +1,69 @@
+import pytest
+
+from cpu_scheduler.scheduler import Process
+from cpu_scheduler.traces import BinaryTrace, load_trace, main, write_binary
+
+
+def write_csv(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_csv_to_binary_round_trip(tmp_path):
+    source = write_csv(tmp_path / 'in.csv', 'pid,arrival,burst,priority\nA,0,3,1\nB,2.0,4,0\nA2,5,1,2\n')
+    destination = str(tmp_path / 'out.trace')
+    main([source, destination])
+    assert load_trace(destination) == [Process('A', 0, 3, 1), Process('B', 2, 4, 0), Process('A2', 5, 1, 2)]
+
+
+def test_fractional_times_rejected(tmp_path):
+    with pytest.raises(ValueError, match='arrival 0.5'):
+        write_binary(str(tmp_path / 'out.trace'), [Process('A', 0.5, 3)])
+
+    source = write_csv(tmp_path / 'in.csv', 'pid,arrival,burst\nA,0.5,3\n')
+    destination = tmp_path / 'bad.trace'
+    with pytest.raises(SystemExit):
+        main([source, str(destination)])
+    assert not destination.exists()
+
+
+def test_missing_column_leaves_no_file(tmp_path, capsys):
+    source = write_csv(tmp_path / 'in.csv', 'pid,arrival\nA,0\n')
+    destination = tmp_path / 'bad.trace'
+    with pytest.raises(SystemExit):
+        main([source, str(destination)])
+    assert "no 'burst' column" in capsys.readouterr().err
+    assert list(tmp_path.iterdir()) == [tmp_path / 'in.csv']
+
+
+def test_failed_write_keeps_the_old_trace(tmp_path):
+    path = str(tmp_path / 'out.trace')
+    write_binary(path, [Process('A', 0, 3)])
+
+    def rows():
+        yield Process('B', 0, 1)
+        raise RuntimeError("source went away")
+
+    with pytest.raises(RuntimeError):
+        write_binary(path, rows())
+    assert load_trace(path) == [Process('A', 0, 3)]
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_close_with_table_in_use(tmp_path):
+    pytest.importorskip('numpy')
+    path = str(tmp_path / 'out.trace')
+    write_binary(path, [Process(f"P{i}", i, i + 1, 0) for i in range(100)])
+    with BinaryTrace(path) as trace:
+        table = trace.to_table()
+    assert len(table) == 100
+    assert int(table.burst[-1]) == 100
+
+
+def test_close_during_iteration(tmp_path):
+    path = str(tmp_path / 'out.trace')
+    write_binary(path, [Process(f"P{i}", i, 1) for i in range(10)])
+    with BinaryTrace(path) as trace:
+        records = iter(trace)
+        assert next(records).pid == 'P0'
+    assert [p.pid for p in records] == [f"P{i}" for i in range(1, 10)]
@@ -0,0 +1,25 @@
+import pytest
+
+from cpu_scheduler import workloads
+from cpu_scheduler.workloads import WORKLOADS, generate
+
+
+@pytest.mark.parametrize('name', list(WORKLOADS))
+def test_seeded_and_sized(name):
+    assert generate(name, 50, seed=1) == generate(name, 50, seed=1)
+    assert len(generate(name, 50)) == 50
+
+
+def test_unknown_workload():
+    with pytest.raises(ValueError, match='Unknown workload'):
+        generate('nope', 10)
+
+
+def test_generator_errors_are_not_renamed(monkeypatch):
+    # A KeyError from inside a generator is a bug there, not an unknown name
+    def broken(n, seed=0):
+        return {}['missing']
+
+    monkeypatch.setitem(workloads.WORKLOADS, 'broken', broken)
+    with pytest.raises(KeyError):
+        generate('broken', 10)